@@ -3,9 +3,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from pydantic import TypeAdapter
+from sqlalchemy import event as sa_event
 from sqlalchemy.orm import Session
 
+from ..utils import json_codec
 from ..utils.id_generator import new_alert_id
+from ..utils.logging import get_logger
 from .alert_models import (
     AlertAction,
     AlertDiagnostics,
@@ -17,23 +21,68 @@ from .alert_models import (
 )
 from .correlation import build_correlation_key
 from .impact_scorer import calculate_network_impact_score, map_score_to_classification
-from ..output.incidents.evidence import build_incident_evidence_artifact
+from ..output.incidents.evidence import (
+    IncidentEvidenceArtifact,
+    build_incident_evidence_artifact,
+    write_incident_evidence_artifact,
+)
 from ..database.alert_repo import (
     find_recent_alert_by_key,
+    find_recent_alerts_by_keys,
     update_existing_alert_row,
     upsert_new_alert_row,
 )
+from ..database.schema import Alert
+
+logger = get_logger(__name__)
+
+
+# Serializes a list of actions in one pydantic-core call instead of per-item model_dump()
+_ACTIONS_ADAPTER = TypeAdapter(List[AlertAction])
+
+# Static action template; AlertAction is frozen, so instances are safe to share across alerts
+_DEFAULT_ACTIONS: tuple[AlertAction, ...] = (
+    AlertAction(
+        id="ACT-VERIFY",
+        description="Verify status with responsible operator or facility.",
+        owner_role="Operations / Supply Chain",
+        due_within_hours=4,
+    ),
+)
+_DEFAULT_ACTIONS_JSON = _ACTIONS_ADAPTER.dump_json(list(_DEFAULT_ACTIONS)).decode("utf-8")
+
+
+# session.info key for incident artifacts waiting on the session's commit
+_PENDING_ARTIFACTS_KEY = "hardstop_pending_incident_artifacts"
+
+
+def _write_pending_artifacts(session: Session) -> None:
+    # Runs after the DB commit is durable, so a failed write is logged rather than
+    # raised out of session.commit() (the committed alert rows stay valid)
+    pending = session.info.get(_PENDING_ARTIFACTS_KEY) or []
+    session.info[_PENDING_ARTIFACTS_KEY] = []
+    for artifact, artifact_path in pending:
+        try:
+            write_incident_evidence_artifact(artifact, artifact_path)
+        except Exception as e:
+            logger.error(f"Failed to write incident evidence artifact {artifact_path}: {e}")
+
+
+def _discard_pending_artifacts(session: Session) -> None:
+    session.info[_PENDING_ARTIFACTS_KEY] = []
+
+
+def _write_artifact_after_commit(session: Session, artifact: IncidentEvidenceArtifact, artifact_path: Path) -> None:
+    """Queue an incident artifact so it is written only if the alert rows it describes commit."""
+    if _PENDING_ARTIFACTS_KEY not in session.info:
+        session.info[_PENDING_ARTIFACTS_KEY] = []
+        sa_event.listen(session, "after_commit", _write_pending_artifacts)
+        sa_event.listen(session, "after_rollback", _discard_pending_artifacts)
+    session.info[_PENDING_ARTIFACTS_KEY].append((artifact, artifact_path))
 
 
 def _dedupe_preserve_order(items: List[str]) -> List[str]:
-    seen = set()
-    result = []
-    for item in items:
-        if item in seen or item is None:
-            continue
-        seen.add(item)
-        result.append(item)
-    return result
+    return list(dict.fromkeys(item for item in items if item is not None))
 
 
 def _merge_scope(existing_scope_json: str | None, new_scope: Dict[str, object]) -> Dict[str, object]:
@@ -41,7 +90,7 @@ def _merge_scope(existing_scope_json: str | None, new_scope: Dict[str, object])
         return new_scope
     
     try:
-        existing_scope = json.loads(existing_scope_json) or {}
+        existing_scope = json_codec.loads(existing_scope_json) or {}
     except (json.JSONDecodeError, TypeError):
         existing_scope = {}
     
@@ -70,6 +119,8 @@ def build_basic_alert(
     determinism_mode: str = "live",
     determinism_context: Optional[Dict[str, Any]] = None,
     incident_dest_dir: str | Path = "output/incidents",
+    known_alerts: Optional[Dict[str, Optional[Alert]]] = None,
+    correlation_key: Optional[str] = None,
 ) -> HardstopAlert:
     """
     Build a minimal alert for a single event.
@@ -83,16 +134,28 @@ def build_basic_alert(
     
     New code should use `classification` and `evidence.diagnostics`.
 
+    Alert rows are flushed (so later correlation lookups see them) but not committed;
+    the caller owns the transaction. Use build_alerts() to process a batch with
+    periodic commits. With a session, the incident evidence artifact is written
+    when that transaction commits and dropped if it rolls back, so a failed event
+    leaves no orphan artifact on disk.
+
     Args:
         event: Event dict with facilities, lanes, shipments populated
         session: Optional SQLAlchemy session for network impact scoring
                  If None, falls back to severity_guess
+        known_alerts: Optional correlation-key -> Alert (or None) map prefetched by
+                 build_alerts(); keys present skip the per-event lookup, and alerts
+                 created here are recorded back into it
+        correlation_key: Optional precomputed build_correlation_key(event), so
+                 batch callers don't derive it twice
     """
     alert_id = new_alert_id()
     root_event_id = event["event_id"]
 
     summary = event.get("title", "Risk event detected")
     risk_type = event.get("event_type", "GENERAL")
+    reasoning: List[str] = [f"Event type: {risk_type}"]
     
     # Extract v0.7 fields from event (already injected by normalizer)
     trust_tier = event.get("trust_tier", 2)  # Default 2 if absent
@@ -100,10 +163,29 @@ def build_basic_alert(
     classification_floor = event.get("classification_floor", 0)  # Default 0 if absent
     tier = event.get("tier")
     source_id = event.get("source_id")
+    facilities = event.get("facilities", [])
+    lanes = event.get("lanes", [])
+    shipments = event.get("shipments", [])
+    shipments_total_linked = event.get("shipments_total_linked", len(shipments))
+    shipments_truncated = event.get("shipments_truncated", False)
+    linking_notes = event.get("linking_notes", [])
+    
+    # Source metadata for evidence, external events only (v0.7: includes trust_tier)
+    source_meta = None
+    if source_id:
+        source_meta = {
+            "id": source_id,
+            "tier": tier,
+            "raw_id": event.get("raw_id"),
+            "url": event.get("url"),
+            "trust_tier": trust_tier,
+        }
     
     # Calculate classification based on network impact
     evidence = None
-    if session:
+    floor_note: Optional[str] = None
+    impact_score: Optional[int] = None  # Only scored (and persisted) when a session is available
+    if session is not None:
         scoring_now = event.get("scoring_now")
         if not isinstance(scoring_now, datetime):
             scoring_now = None
@@ -121,7 +203,7 @@ def build_basic_alert(
         original_classification = classification
         classification = max(classification, classification_floor)
         if classification != original_classification:
-            reasoning.append(f"Classification floor: {classification_floor} (source policy) - raised from {original_classification}")
+            floor_note = f"Classification floor: {classification_floor} (source policy) - raised from {original_classification}"
         
         classification_source = f"network_impact_score={impact_score}"
         
@@ -129,15 +211,15 @@ def build_basic_alert(
         diagnostics = AlertDiagnostics(
             link_confidence=event.get("link_confidence", {}),
             link_provenance=event.get("link_provenance", {}),
-            shipments_total_linked=event.get("shipments_total_linked", len(event.get("shipments", []))),
-            shipments_truncated=event.get("shipments_truncated", False),
+            shipments_total_linked=shipments_total_linked,
+            shipments_truncated=shipments_truncated,
             impact_score=impact_score,
             impact_score_breakdown=breakdown,
             impact_score_rationale=rationale,
         )
         evidence = AlertEvidence(
             diagnostics=diagnostics,
-            linking_notes=event.get("linking_notes", []),
+            linking_notes=linking_notes,
         )
     else:
         # Fallback to severity_guess if no session provided
@@ -146,62 +228,58 @@ def build_basic_alert(
         # Initialize evidence for correlation notes even without session
         evidence = AlertEvidence(
             diagnostics=None,
-            linking_notes=event.get("linking_notes", []),
+            linking_notes=linking_notes,
         )
 
     scope = AlertScope(
-        facilities=event.get("facilities", []),
-        lanes=event.get("lanes", []),
-        shipments=event.get("shipments", []),
+        facilities=facilities,
+        lanes=lanes,
+        shipments=shipments,
     )
     
-    # Prepare scope JSON for database storage
+    # Prepare scope payload for database storage (serialized once, after correlation merge)
     scope_payload: Dict[str, object] = {
         "facilities": scope.facilities,
         "lanes": scope.lanes,
         "shipments": scope.shipments,
-        "shipments_total_linked": event.get("shipments_total_linked", len(scope.shipments)),
-        "shipments_truncated": event.get("shipments_truncated", False),
+        "shipments_total_linked": shipments_total_linked,
+        "shipments_truncated": shipments_truncated,
     }
-    scope_json = json.dumps(scope_payload)
 
     impact_assessment = AlertImpactAssessment(
         qualitative_impact=[event.get("raw_text", "")[:280]],
     )
 
-    reasoning = [
-        f"Event type: {risk_type}",
-        f"Classification: {classification} (from {classification_source})",
-        "Scope derived from network entity matching.",
-    ]
-
-    recommended_actions = [
-        AlertAction(
-            id="ACT-VERIFY",
-            description="Verify status with responsible operator or facility.",
-            owner_role="Operations / Supply Chain",
-            due_within_hours=4,
-        )
-    ]
+    reasoning.append(f"Classification: {classification} (from {classification_source})")
+    if floor_note:
+        reasoning.append(floor_note)
+    reasoning.append("Scope derived from network entity matching.")
+
+    recommended_actions = list(_DEFAULT_ACTIONS)
 
     # Correlation: Build key (always - it's a property of the event)
-    correlation_key = build_correlation_key(event)
+    if correlation_key is None:
+        correlation_key = build_correlation_key(event)
     existing_alert = None
     
     # Correlation persistence: only when session is available
     # Note: Correlation key is always computed for debugging/replay,
     # but persistence and deduplication require database session
     if session is not None:
-        existing_alert = find_recent_alert_by_key(session, correlation_key, within_days=7)
+        if known_alerts is not None and correlation_key in known_alerts:
+            existing_alert = known_alerts[correlation_key]
+        else:
+            existing_alert = find_recent_alert_by_key(session, correlation_key, within_days=7)
         
         if existing_alert:
             # Update existing alert (v0.7: store tier/source_id/trust_tier from latest event)
-            merged_scope_payload = _merge_scope(existing_alert.scope_json, scope_payload)
-            scope.facilities = merged_scope_payload.get("facilities", scope.facilities)
-            scope.lanes = merged_scope_payload.get("lanes", scope.lanes)
-            scope.shipments = merged_scope_payload.get("shipments", scope.shipments)
-            scope_payload = merged_scope_payload
-            scope_json = json.dumps(scope_payload)
+            if existing_alert.scope_json:
+                merged_scope_payload = _merge_scope(existing_alert.scope_json, scope_payload)
+                scope.facilities = merged_scope_payload.get("facilities", scope.facilities)
+                scope.lanes = merged_scope_payload.get("lanes", scope.lanes)
+                scope.shipments = merged_scope_payload.get("shipments", scope.shipments)
+                scope_payload = merged_scope_payload
+            scope_json = json_codec.dumps(scope_payload)
             
             update_existing_alert_row(
                 session,
@@ -210,13 +288,13 @@ def build_basic_alert(
                 new_classification=classification,
                 root_event_id=root_event_id,
                 correlation_action="UPDATED",
-                impact_score=impact_score if session else None,
+                impact_score=impact_score,
                 scope_json=scope_json,  # Update scope with latest event data
                 tier=tier,  # v0.7: update tier from latest event
                 source_id=source_id,  # v0.7: update source_id from latest event
                 trust_tier=trust_tier,  # v0.7: update trust_tier from latest event
             )
-            session.commit()
+            session.flush()
             
             # Use existing alert ID and add structured correlation info
             alert_id = existing_alert.alert_id
@@ -226,24 +304,16 @@ def build_basic_alert(
                     "action": "UPDATED",
                     "alert_id": existing_alert.alert_id,
                 }
-                # Add source metadata if available (v0.7: includes trust_tier)
-                if event.get("source_id"):
-                    evidence.source = {
-                        "id": event.get("source_id"),
-                        "tier": event.get("tier"),
-                        "raw_id": event.get("raw_id"),
-                        "url": event.get("url"),
-                        "trust_tier": trust_tier,
-                    }
                 evidence.linking_notes = (evidence.linking_notes or []) + [
                     f"Correlated to existing alert_id={existing_alert.alert_id} via key={correlation_key}"
                 ]
         else:
             # Create new alert
+            scope_json = json_codec.dumps(scope_payload)
             reasoning_text = "\n".join(reasoning) if reasoning else None
-            actions_text = json.dumps([a.model_dump() for a in recommended_actions]) if recommended_actions else None
+            actions_text = _DEFAULT_ACTIONS_JSON
             
-            upsert_new_alert_row(
+            new_row = upsert_new_alert_row(
                 session,
                 alert_id=alert_id,
                 summary=summary,
@@ -255,13 +325,15 @@ def build_basic_alert(
                 root_event_id=root_event_id,
                 correlation_key=correlation_key,
                 correlation_action="CREATED",
-                impact_score=impact_score if session else None,
+                impact_score=impact_score,
                 scope_json=scope_json,
                 tier=tier,  # v0.7: store tier for brief efficiency
                 source_id=source_id,  # v0.7: store source_id for UI efficiency
                 trust_tier=trust_tier,  # v0.7: store trust_tier
             )
-            session.commit()
+            session.flush()
+            if known_alerts is not None:
+                known_alerts[correlation_key] = new_row
             
             if evidence:
                 evidence.correlation = {
@@ -269,15 +341,6 @@ def build_basic_alert(
                     "action": "CREATED",
                     "alert_id": alert_id,
                 }
-                # Add source metadata if available (v0.7: includes trust_tier)
-                if event.get("source_id"):
-                    evidence.source = {
-                        "id": event.get("source_id"),
-                        "tier": event.get("tier"),
-                        "raw_id": event.get("raw_id"),
-                        "url": event.get("url"),
-                        "trust_tier": trust_tier,
-                    }
                 evidence.linking_notes = (evidence.linking_notes or []) + [
                     f"Created new correlated alert via key={correlation_key}"
                 ]
@@ -289,15 +352,9 @@ def build_basic_alert(
                 "action": None,  # Not persisted
                 "alert_id": None,
             }
-            # Add source metadata if available (v0.7: includes trust_tier)
-            if event.get("source_id"):
-                evidence.source = {
-                    "id": event.get("source_id"),
-                    "tier": event.get("tier"),
-                    "raw_id": event.get("raw_id"),
-                    "url": event.get("url"),
-                    "trust_tier": trust_tier,
-                }
+
+    if source_meta is not None:
+        evidence.source = source_meta
 
     incident_artifact, incident_ref, incident_path = build_incident_evidence_artifact(
         alert_id=alert_id,
@@ -310,7 +367,10 @@ def build_basic_alert(
         filename_basename=f"{alert_id}__{event.get('event_id', 'event')}__{correlation_key.replace('|', '_')}",
         determinism_mode=determinism_mode,
         determinism_context=determinism_context if determinism_mode == "pinned" else None,
+        write=session is None,
     )
+    if session is not None:
+        _write_artifact_after_commit(session, incident_artifact, incident_path)
     if evidence is None:
         evidence = AlertEvidence()
     evidence.incident_evidence = IncidentEvidenceSummary(
@@ -335,3 +395,48 @@ def build_basic_alert(
         recommended_actions=recommended_actions,
         evidence=evidence,
     )
+
+
+def build_alerts(
+    events: List[Dict],
+    session: Session,
+    *,
+    commit_every: int = 1000,
+    incident_dest_dir: str | Path = "output/incidents",
+) -> List[HardstopAlert]:
+    """
+    Build alerts for a batch of events, committing once per commit_every events.
+
+    Events are processed in order through build_basic_alert, so an event can
+    correlate to an alert created earlier in the same batch. Existing alerts for
+    the batch's correlation keys are fetched up front in one query instead of
+    one lookup per event.
+
+    Args:
+        events: Event dicts with facilities, lanes, shipments populated
+        session: SQLAlchemy session used for scoring, correlation, and persistence
+        commit_every: Number of events per transaction (default 1000)
+        incident_dest_dir: Directory for incident evidence artifacts
+
+    Returns:
+        Alerts in the same order as events
+    """
+    keys = [build_correlation_key(event) for event in events]
+    known_alerts: Dict[str, Optional[Alert]] = dict.fromkeys(keys)
+    known_alerts.update(find_recent_alerts_by_keys(session, keys, within_days=7))
+
+    alerts: List[HardstopAlert] = []
+    for index, (event, key) in enumerate(zip(events, keys), start=1):
+        alerts.append(
+            build_basic_alert(
+                event,
+                session=session,
+                incident_dest_dir=incident_dest_dir,
+                known_alerts=known_alerts,
+                correlation_key=key,
+            )
+        )
+        if index % commit_every == 0:
+            session.commit()
+    session.commit()
+    return alerts
@@ -1,9 +1,26 @@
+import os
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+# Deprecated mirror fields (HardstopAlert.priority / .diagnostics) stay readable as
+# properties, but are serialized unless HARDSTOP_SKIP_DEPRECATED_ALERT_FIELDS=1
+# (read once at import).
+INCLUDE_DEPRECATED_FIELDS = os.getenv("HARDSTOP_SKIP_DEPRECATED_ALERT_FIELDS", "0") != "1"
+
+
+def _deprecated_mirror(prop: property):
+    """Expose prop as a serialized computed field unless deprecated fields are disabled."""
+    if INCLUDE_DEPRECATED_FIELDS:
+        return computed_field(prop, repr=False)
+    return prop
 
 
 class AlertAction(BaseModel):
+    """Recommended action (immutable, so template instances can be shared across alerts)."""
+
+    model_config = ConfigDict(frozen=True)
+
     id: str
     description: str
     owner_role: str
@@ -94,7 +111,7 @@ class HardstopAlert(BaseModel):
     
     # Backward compatibility: priority mirrors classification
     # DEPRECATED: Use classification instead. This field will be removed in v0.4.
-    @computed_field
+    @_deprecated_mirror
     @property
     def priority(self) -> int:
         """
@@ -107,7 +124,7 @@ class HardstopAlert(BaseModel):
     
     # Backward compatibility: diagnostics mirrors evidence.diagnostics
     # DEPRECATED: Use evidence.diagnostics instead. This field will be removed in v0.4.
-    @computed_field
+    @_deprecated_mirror
     @property
     def diagnostics(self) -> Optional[AlertDiagnostics]:
         """
@@ -45,8 +45,8 @@ def _top_or_none(xs: List[str]) -> str:
     """Return first item from sorted set, or 'NONE' if empty."""
     if not xs:
         return "NONE"
-    # stable: sorted then first
-    return sorted(set(xs))[0]
+    # stable: smallest item (same as sorted then first, without building the sorted list)
+    return min(xs)
 
 
 def build_correlation_key(event: Dict) -> str:
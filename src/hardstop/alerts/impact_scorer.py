@@ -1,39 +1,119 @@
 """Network impact scoring for alert classification."""
 
 from functools import lru_cache
-from datetime import datetime, timedelta, time, timezone
-from typing import Dict, List, Tuple, Optional
+from datetime import date, datetime, timedelta, time, timezone
+from typing import Dict, List, NamedTuple, Tuple, Optional
 
+from sqlalchemy import Integer, and_, case, cast, func, literal, null, select, union_all
 from sqlalchemy.orm import Session
 
 from ..config.loader import load_keywords_config
 from ..database.schema import Facility, Lane, Shipment
 
 
-DEFAULT_RISK_KEYWORDS: List[Dict[str, int]] = [
+# Session.info slot holding network rows keyed by (facility_ids, lane_ids, shipment_ids)
+_NETWORK_CACHE_KEY = "hardstop.impact_scorer.network_rows"
+_NETWORK_CACHE_MAX_ENTRIES = 4096
+
+# Facility criticality_score / lane volume_score at or above this count toward impact
+_CRITICAL_SCORE_THRESHOLD = 7
+
+# Priority-shipment ETA window: late up to 7 days back, due up to 48h forward
+_ETA_LOOKBACK = timedelta(days=7)
+_ETA_LOOKAHEAD = timedelta(hours=48)
+
+DEFAULT_RISK_KEYWORDS: Tuple[Dict[str, int], ...] = (
     {"term": "SPILL", "weight": 1},
     {"term": "STRIKE", "weight": 1},
     {"term": "CLOSURE", "weight": 1},
     {"term": "CLOSED", "weight": 1},
     {"term": "SHUTDOWN", "weight": 1},
-]
+)
+
+
+class KeywordSet(NamedTuple):
+    """Risk keywords as parallel tuples: uppercase terms and their weights."""
+
+    terms: Tuple[str, ...]
+    weights: Tuple[int, ...]
+
+
+def _build_keyword_set(entries) -> KeywordSet:
+    return KeywordSet(
+        terms=tuple(entry["term"].upper() for entry in entries),
+        weights=tuple(entry.get("weight", 1) for entry in entries),
+    )
 
 
 @lru_cache(maxsize=1)
-def _load_risk_keywords() -> List[Dict[str, int]]:
+def _load_risk_keywords() -> KeywordSet:
     """
     Load risk keywords from config with fallback defaults.
+
+    Cached for the process; call _load_risk_keywords.cache_clear() after
+    changing the keywords config.
     """
     try:
         config = load_keywords_config()
         keywords = config.get("risk_keywords", [])
         if keywords:
-            return keywords
+            return _build_keyword_set(keywords)
     except FileNotFoundError:
         pass
     except ValueError:
         pass
-    return DEFAULT_RISK_KEYWORDS
+    return _build_keyword_set(DEFAULT_RISK_KEYWORDS)
+
+
+# Legacy formats tried when the ISO fast path rejects a datetime string
+_ETA_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_eta_string(eta_date_str: str) -> Optional[datetime]:
+    """
+    Parse a stripped, non-empty ETA string (cached; ETA strings repeat across shipments).
+    """
+    # Date-only (YYYY-MM-DD): treat as end-of-day UTC for consistency
+    if len(eta_date_str) == 10 and eta_date_str.count('-') == 2:
+        if eta_date_str[4] != '-' or eta_date_str[7] != '-':
+            return None
+        try:
+            date_obj = date.fromisoformat(eta_date_str)
+        except ValueError:
+            return None
+        # Use 23:59:59 to represent end of day
+        return datetime.combine(date_obj, time(23, 59, 59), tzinfo=timezone.utc)
+
+    # ISO fast path: a single C-level parse covers the common YYYY-MM-DD[T ]HH:MM:SS[Z|offset] shapes
+    if len(eta_date_str) >= 19 and eta_date_str[10] in "T ":
+        try:
+            dt = datetime.fromisoformat(eta_date_str.replace("Z", "+00:00"))
+        except ValueError:
+            dt = None
+        if dt is not None:
+            # If no timezone info, assume UTC
+            return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+    # Fall back to the legacy strptime formats (e.g. "+0000" offsets, non-padded fields)
+    for fmt in _ETA_DATETIME_FORMATS:
+        try:
+            dt = datetime.strptime(eta_date_str, fmt)
+        except ValueError:
+            continue
+        # If no timezone info, assume UTC
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+
+    # If all parsing attempts fail, return None
+    return None
 
 
 def parse_eta_date_safely(eta_date_str: Optional[str]) -> Optional[datetime]:
@@ -62,41 +142,7 @@ def parse_eta_date_safely(eta_date_str: Optional[str]) -> Optional[datetime]:
     if not eta_date_str:
         return None
     
-    try:
-        # Try parsing as date-only (YYYY-MM-DD)
-        if len(eta_date_str) == 10 and eta_date_str.count('-') == 2:
-            date_obj = datetime.strptime(eta_date_str, "%Y-%m-%d").date()
-            # Treat date-only as end-of-day UTC for consistency
-            # Use 23:59:59 to represent end of day
-            return datetime.combine(date_obj, time(23, 59, 59), tzinfo=timezone.utc)
-        
-        # Try parsing as datetime (YYYY-MM-DD HH:MM:SS or variants)
-        # Common formats
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S%z",
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(eta_date_str, fmt)
-                # If no timezone info, assume UTC
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except ValueError:
-                continue
-        
-        # If all parsing attempts fail, return None
-        return None
-        
-    except (ValueError, AttributeError, TypeError) as e:
-        # Log the error but don't crash - just skip this date
-        # In production, you might want to log this for monitoring
-        return None
+    return _parse_eta_string(eta_date_str)
 
 
 def is_eta_within_48h(eta_date_str: Optional[str], now: Optional[datetime] = None) -> bool:
@@ -124,11 +170,158 @@ def is_eta_within_48h(eta_date_str: Optional[str], now: Optional[datetime] = Non
     if eta_dt.tzinfo is None:
         eta_dt = eta_dt.replace(tzinfo=timezone.utc)
     
-    # Calculate time difference
-    time_diff = eta_dt - now
-    
     # Consider late shipments up to 7 days back and 48h forward
-    return timedelta(days=-7) <= time_diff <= timedelta(hours=48)
+    return now - _ETA_LOOKBACK <= eta_dt <= now + _ETA_LOOKAHEAD
+
+
+# Canonical ETA shapes SQLite can convert to epoch seconds exactly like parse_eta_date_safely
+_ETA_DATE_GLOB = "[0-9][0-9][0-9][0-9]-[0-1][0-9]-[0-3][0-9]"
+_ETA_DATETIME_GLOB = _ETA_DATE_GLOB + "[ T][0-2][0-9]:[0-5][0-9]:[0-5][0-9]"
+
+
+def _eta_epoch_expr():
+    """
+    SQL expression normalizing Shipment.eta_date to UTC epoch seconds, or NULL.
+
+    Handles YYYY-MM-DD (end of day), YYYY-MM-DD[ T]HH:MM:SS, and the same with a Z
+    suffix. The round-trip comparisons reject values SQLite would silently normalize
+    (e.g. 2024-02-30). Any other shape yields NULL and is parsed in Python instead.
+    """
+    eta = Shipment.eta_date
+    eta_naive = func.replace(eta, "T", " ")
+    # Formatting from julianday() forces normalization, so invalid dates no longer round-trip
+    eta_date_normalized = func.date(func.julianday(eta))
+    eta_datetime_normalized = func.datetime(func.julianday(eta))
+    return case(
+        (
+            and_(eta.op("GLOB")(_ETA_DATE_GLOB), eta_date_normalized == eta),
+            cast(func.strftime("%s", eta, "+1 day", "-1 second"), Integer),
+        ),
+        (
+            and_(eta.op("GLOB")(_ETA_DATETIME_GLOB), eta_datetime_normalized == eta_naive),
+            cast(func.strftime("%s", eta), Integer),
+        ),
+        (
+            and_(eta.op("GLOB")(_ETA_DATETIME_GLOB + "Z"), eta_datetime_normalized.concat("Z") == eta_naive),
+            cast(func.strftime("%s", eta), Integer),
+        ),
+        else_=null(),
+    )
+
+
+def _fetch_network_rows(
+    session: Session,
+    facility_ids: List[str],
+    lane_ids: List[str],
+    shipment_ids: List[str],
+) -> Dict[str, list]:
+    """
+    Fetch the facility/lane/shipment columns needed for scoring in one round trip.
+
+    Builds one tagged SELECT per non-empty id list and combines them with UNION ALL,
+    so the scorer issues a single statement instead of three. Only the scored columns
+    are projected (no ORM objects) and the scoring predicates run in SQL:
+    - facility/lane: at most one row, the lowest id at or above the threshold
+    - shipment: priority shipments only (priority_flag = 1), with eta_epoch
+      precomputed in SQL for canonical ETA formats
+    Rows come back grouped by kind and ordered by entity id.
+
+    Returns:
+        Dict mapping "facility" / "lane" / "shipment" to lists of rows with
+        entity_id, score, eta_date, eta_epoch attributes.
+    """
+    grouped: Dict[str, list] = {"facility": [], "lane": [], "shipment": []}
+    selects = []
+    if facility_ids:
+        first_critical = (
+            select(
+                literal("facility").label("kind"),
+                Facility.facility_id.label("entity_id"),
+                Facility.criticality_score.label("score"),
+                null().label("eta_date"),
+                null().label("eta_epoch"),
+            )
+            .where(
+                Facility.facility_id.in_(facility_ids),
+                Facility.criticality_score >= _CRITICAL_SCORE_THRESHOLD,
+            )
+            .order_by(Facility.facility_id)
+            .limit(1)
+            .subquery()
+        )
+        selects.append(select(first_critical))
+    if lane_ids:
+        first_high_volume = (
+            select(
+                literal("lane").label("kind"),
+                Lane.lane_id.label("entity_id"),
+                Lane.volume_score.label("score"),
+                null().label("eta_date"),
+                null().label("eta_epoch"),
+            )
+            .where(
+                Lane.lane_id.in_(lane_ids),
+                Lane.volume_score >= _CRITICAL_SCORE_THRESHOLD,
+            )
+            .order_by(Lane.lane_id)
+            .limit(1)
+            .subquery()
+        )
+        selects.append(select(first_high_volume))
+    if shipment_ids:
+        selects.append(
+            select(
+                literal("shipment").label("kind"),
+                Shipment.shipment_id.label("entity_id"),
+                null().label("score"),
+                Shipment.eta_date.label("eta_date"),
+                _eta_epoch_expr().label("eta_epoch"),
+            ).where(
+                Shipment.shipment_id.in_(shipment_ids),
+                Shipment.priority_flag == 1,
+            )
+        )
+    if not selects:
+        return grouped
+
+    stmt = union_all(*selects) if len(selects) > 1 else selects[0]
+    stmt = stmt.order_by("kind", "entity_id")
+    for row in session.execute(stmt):
+        grouped[row.kind].append(row)
+    return grouped
+
+
+def _get_network_rows(
+    session: Session,
+    facility_ids: List[str],
+    lane_ids: List[str],
+    shipment_ids: List[str],
+) -> Dict[str, list]:
+    """
+    Return network rows for the given ids, reusing lookups already made in this session.
+
+    Replayed and correlated events usually link to the same entities, so rows are
+    memoized in session.info keyed by the sorted id sets. Only the DB lookup is cached;
+    scoring (including the time-dependent ETA window) still runs on every call.
+    """
+    cache = session.info.setdefault(_NETWORK_CACHE_KEY, {})
+    key = (
+        tuple(sorted(set(facility_ids))),
+        tuple(sorted(set(lane_ids))),
+        tuple(sorted(set(shipment_ids))),
+    )
+    rows = cache.get(key)
+    if rows is None:
+        rows = _fetch_network_rows(session, facility_ids, lane_ids, shipment_ids)
+        if len(cache) >= _NETWORK_CACHE_MAX_ENTRIES:
+            cache.clear()
+        cache[key] = rows
+    return rows
+
+
+def clear_network_cache(session: Session) -> None:
+    """Drop memoized network rows for session (call after facilities/lanes/shipments change)."""
+    session.info.pop(_NETWORK_CACHE_KEY, None)
 
 
 def calculate_network_impact_score(
@@ -163,6 +356,10 @@ def calculate_network_impact_score(
     elif now.tzinfo is None:
         now = now.replace(tzinfo=timezone.utc)
 
+    facility_ids = event.get("facilities", [])
+    lane_ids = event.get("lanes", [])
+    shipment_ids = event.get("shipments", [])
+
     score = 0
     breakdown = []
     rationale: Dict[str, object] = {
@@ -174,7 +371,7 @@ def calculate_network_impact_score(
                 "eta_within_48h": 0,
                 "ids_within_48h": [],
             },
-            "shipment_count": len(event.get("shipments", [])),
+            "shipment_count": len(shipment_ids),
         },
         "modifiers": {
             "trust_tier": trust_tier if trust_tier is not None else 2,
@@ -185,52 +382,41 @@ def calculate_network_impact_score(
         "score_trace": {},
     }
     
-    # Check facility criticality
-    facility_ids = event.get("facilities", [])
-    if facility_ids:
-        facilities = session.query(Facility).filter(
-            Facility.facility_id.in_(facility_ids)
-        ).all()
-        for facility in facilities:
-            if facility.criticality_score and facility.criticality_score >= 7:
-                score += 2
-                breakdown.append(f"+2: Facility criticality_score >= 7 ({facility.facility_id}={facility.criticality_score})")
-                rationale["network_criticality"]["facilities"] = [
-                    {
-                        "facility_id": facility.facility_id,
-                        "criticality_score": facility.criticality_score,
-                        "delta": 2,
-                    }
-                ]
-                break  # Only count once
+    # Text-only events (no linked entities) are scored from keywords/modifiers without touching the session
+    if facility_ids or lane_ids or shipment_ids:
+        network_rows = _get_network_rows(session, facility_ids, lane_ids, shipment_ids)
+    else:
+        network_rows = {"facility": [], "lane": [], "shipment": []}
+
+    # Check facility criticality (rows are pre-filtered to >= 7; only count once)
+    if network_rows["facility"]:
+        facility = network_rows["facility"][0]
+        score += 2
+        breakdown.append(f"+2: Facility criticality_score >= 7 ({facility.entity_id}={facility.score})")
+        rationale["network_criticality"]["facilities"] = [
+            {
+                "facility_id": facility.entity_id,
+                "criticality_score": facility.score,
+                "delta": 2,
+            }
+        ]
     
-    # Check lane volume
-    lane_ids = event.get("lanes", [])
-    if lane_ids:
-        lanes = session.query(Lane).filter(
-            Lane.lane_id.in_(lane_ids)
-        ).all()
-        for lane in lanes:
-            if lane.volume_score and lane.volume_score >= 7:
-                score += 1
-                breakdown.append(f"+1: Lane volume_score >= 7 ({lane.lane_id}={lane.volume_score})")
-                rationale["network_criticality"]["lanes"] = [
-                    {
-                        "lane_id": lane.lane_id,
-                        "volume_score": lane.volume_score,
-                        "delta": 1,
-                    }
-                ]
-                break  # Only count once
+    # Check lane volume (rows are pre-filtered to >= 7; only count once)
+    if network_rows["lane"]:
+        lane = network_rows["lane"][0]
+        score += 1
+        breakdown.append(f"+1: Lane volume_score >= 7 ({lane.entity_id}={lane.score})")
+        rationale["network_criticality"]["lanes"] = [
+            {
+                "lane_id": lane.entity_id,
+                "volume_score": lane.score,
+                "delta": 1,
+            }
+        ]
     
     # Check shipment priority (enhanced scoring)
-    shipment_ids = event.get("shipments", [])
     if shipment_ids:
-        shipments = session.query(Shipment).filter(
-            Shipment.shipment_id.in_(shipment_ids)
-        ).all()
-        
-        priority_shipments = [s for s in shipments if s.priority_flag == 1]
+        priority_shipments = network_rows["shipment"]  # Filtered to priority_flag = 1 in SQL
         priority_count = len(priority_shipments)
         
         if priority_count > 0:
@@ -245,12 +431,20 @@ def calculate_network_impact_score(
             
             # Check for near-term ETA (within 48h)
             # Use robust parsing that handles timezone drift and bad dates
+            # Window bounds are fixed for the whole event, so compute them once (epoch seconds)
+            window_start = (now - _ETA_LOOKBACK).timestamp()
+            window_end = (now + _ETA_LOOKAHEAD).timestamp()
             near_term_count = 0
             for shipment in priority_shipments:
-                if is_eta_within_48h(shipment.eta_date, now=now):
+                eta_epoch = shipment.eta_epoch
+                if eta_epoch is None:
+                    # Non-canonical format: SQL left it NULL, parse in Python
+                    eta_dt = parse_eta_date_safely(shipment.eta_date)
+                    eta_epoch = eta_dt.timestamp() if eta_dt is not None else None
+                if eta_epoch is not None and window_start <= eta_epoch <= window_end:
                     near_term_count += 1
                     rationale["network_criticality"]["priority_shipments"]["ids_within_48h"].append(
-                        shipment.shipment_id
+                        shipment.entity_id
                     )
             rationale["network_criticality"]["priority_shipments"]["ids_within_48h"].sort()
             
@@ -276,13 +470,17 @@ def calculate_network_impact_score(
         score += 1
         breakdown.append(f"+1: Event type in high-impact types ({event_type})")
     else:
-        keyword_matches = [entry for entry in _load_risk_keywords() if entry["term"] in text_upper]
-        if keyword_matches:
-            total_weight = sum(entry.get("weight", 1) for entry in keyword_matches)
+        matched: List[str] = []
+        total_weight = 0
+        keywords = _load_risk_keywords()
+        for term, weight in zip(keywords.terms, keywords.weights):
+            if term in text_upper:
+                matched.append(term)
+                total_weight += weight
+        if matched:
             score += total_weight
-            matched_terms = ", ".join(entry["term"] for entry in keyword_matches)
-            breakdown.append(f"+{total_weight}: High-impact keywords detected ({matched_terms})")
-            rationale["score_trace"]["keyword_terms"] = sorted(entry["term"] for entry in keyword_matches)
+            breakdown.append(f"+{total_weight}: High-impact keywords detected ({', '.join(matched)})")
+            rationale["score_trace"]["keyword_terms"] = sorted(matched)
     
     if not breakdown:
         breakdown.append("No impact factors detected")
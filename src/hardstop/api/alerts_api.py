@@ -1,8 +1,9 @@
 """Alerts API: canonical query surface for alert data."""
 
 import json
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.orm import Session
 
 from ..alerts.alert_models import (
@@ -14,58 +15,122 @@ from ..alerts.alert_models import (
     IncidentEvidenceSummary,
     HardstopAlert,
 )
-from ..database.alert_repo import load_root_event_ids, query_recent_alerts
-from ..output.incidents.evidence import load_incident_evidence_summary
+from ..utils import json_codec
+from ..database.alert_repo import find_alert_by_id, load_root_event_ids, query_recent_alerts
+from ..output.incidents.evidence import (
+    load_incident_evidence_summaries,
+    load_incident_evidence_summary,
+)
+from .brief_api import _parse_since
 from .models import AlertDetailDTO, AlertProvenance
 
 if TYPE_CHECKING:
     from ..database.schema import Alert
 
 
-def _alert_row_to_hardstop_alert(alert_row: "Alert") -> HardstopAlert:
-    """Convert Alert ORM row to HardstopAlert Pydantic model."""
+# Validates a stored actions list in one pydantic-core call
+_ACTIONS_ADAPTER = TypeAdapter(List[AlertAction])
+
+# Stored JSON values that decode to nothing usable; skipped without parsing
+_EMPTY_JSON = frozenset({"{}", "[]", "null"})
+
+_ROW_PARTS_CACHE_KEY = "hardstop.alerts_api.alert_row_parts"
+_ROW_PARTS_CACHE_MAX_ENTRIES = 1024
+
+
+class _AlertRowParts(NamedTuple):
+    """Values parsed from an alert row's JSON/text columns (immutable, so safe to cache)."""
+
+    facilities: Tuple[str, ...]
+    lanes: Tuple[str, ...]
+    shipments: Tuple[str, ...]
+    reasoning: Tuple[str, ...]
+    recommended_actions: Tuple[AlertAction, ...]  # AlertAction is frozen
+
+
+def _parse_alert_row(alert_row: "Alert") -> _AlertRowParts:
+    """Decode the scope, reasoning and recommended-actions columns of an alert row."""
     # Load scope from JSON
     scope_dict = {}
-    if alert_row.scope_json:
+    scope_json = alert_row.scope_json
+    if scope_json and scope_json not in _EMPTY_JSON:
         try:
-            scope_dict = json.loads(alert_row.scope_json)
+            scope_dict = json_codec.loads(scope_json)
         except (json.JSONDecodeError, TypeError):
             scope_dict = {}
     
-    scope = AlertScope(
-        facilities=scope_dict.get("facilities", []),
-        lanes=scope_dict.get("lanes", []),
-        shipments=scope_dict.get("shipments", []),
-    )
-    
-    # Load impact assessment (minimal - stored in scope_json for now)
-    impact_assessment = AlertImpactAssessment(
-        qualitative_impact=[],
-    )
-    
     # Load reasoning
-    reasoning = []
+    reasoning: Tuple[str, ...] = ()
     if alert_row.reasoning:
-        reasoning = [line.strip() for line in alert_row.reasoning.split("\n") if line.strip()]
+        reasoning = tuple(filter(None, map(str.strip, alert_row.reasoning.splitlines())))
     
     # Load recommended actions
-    recommended_actions = []
-    if alert_row.recommended_actions:
+    recommended_actions: Tuple[AlertAction, ...] = ()
+    actions_json = alert_row.recommended_actions
+    if actions_json and actions_json not in _EMPTY_JSON:
         try:
-            actions_data = json.loads(alert_row.recommended_actions)
+            actions_data = json_codec.loads(actions_json)
             if isinstance(actions_data, list):
-                recommended_actions = [AlertAction(**action) for action in actions_data]
-        except (json.JSONDecodeError, TypeError):
+                recommended_actions = tuple(_ACTIONS_ADAPTER.validate_python(actions_data))
+        except (json.JSONDecodeError, TypeError, ValidationError):
             pass
     
+    return _AlertRowParts(
+        facilities=tuple(scope_dict.get("facilities", [])),
+        lanes=tuple(scope_dict.get("lanes", [])),
+        shipments=tuple(scope_dict.get("shipments", [])),
+        reasoning=reasoning,
+        recommended_actions=recommended_actions,
+    )
+
+
+def _alert_row_to_hardstop_alert(
+    alert_row: "Alert",
+    incident_summaries: Optional[Dict[str, Dict[str, Any]]] = None,
+    row_parts: Optional[_AlertRowParts] = None,
+) -> HardstopAlert:
+    """
+    Convert Alert ORM row to HardstopAlert Pydantic model.
+
+    Row columns were validated when the alert was built, so the models are
+    assembled with model_construct(); only the recommended-actions JSON and the
+    on-disk incident evidence summary are validated.
+
+    incident_summaries is an optional alert_id -> summary map preloaded with
+    load_incident_evidence_summaries(); when omitted the summary is loaded for
+    this alert alone. row_parts is an optional pre-parsed _parse_alert_row() result.
+    Every call returns new model instances.
+    """
+    if row_parts is None:
+        row_parts = _parse_alert_row(alert_row)
+
+    scope = AlertScope.model_construct(
+        facilities=list(row_parts.facilities),
+        lanes=list(row_parts.lanes),
+        shipments=list(row_parts.shipments),
+    )
+    
+    # Load impact assessment (minimal - stored in scope_json for now)
+    impact_assessment = AlertImpactAssessment.model_construct(
+        qualitative_impact=[],
+    )
+    
     # Build evidence (minimal - diagnostics not fully stored in DB yet)
-    evidence = None
+    diagnostics = None
     if alert_row.impact_score is not None:
-        diagnostics = AlertDiagnostics(
+        diagnostics = AlertDiagnostics.model_construct(
             impact_score=alert_row.impact_score,
             impact_score_breakdown=[],
         )
-        evidence = AlertEvidence(
+    if incident_summaries is None:
+        incident_summary_data = load_incident_evidence_summary(alert_row.alert_id, alert_row.correlation_key or "")
+    else:
+        incident_summary_data = incident_summaries.get(alert_row.alert_id)
+
+    # Evidence exists when there is either a score or an incident artifact to report
+    evidence = None
+    if diagnostics is not None or incident_summary_data:
+        evidence = AlertEvidence.model_construct(
             diagnostics=diagnostics,
             linking_notes=[],
             correlation={
@@ -73,22 +138,12 @@ def _alert_row_to_hardstop_alert(alert_row: "Alert") -> HardstopAlert:
                 "action": alert_row.correlation_action or None,
                 "alert_id": alert_row.alert_id,
             },
+            incident_evidence=(
+                IncidentEvidenceSummary(**incident_summary_data) if incident_summary_data else None
+            ),
         )
-    incident_summary_data = load_incident_evidence_summary(alert_row.alert_id, alert_row.correlation_key or "")
-    if incident_summary_data:
-        if evidence is None:
-            evidence = AlertEvidence(
-                diagnostics=None,
-                linking_notes=[],
-                correlation={
-                    "key": alert_row.correlation_key or "",
-                    "action": alert_row.correlation_action or None,
-                    "alert_id": alert_row.alert_id,
-                },
-            )
-        evidence.incident_evidence = IncidentEvidenceSummary(**incident_summary_data)
     
-    return HardstopAlert(
+    return HardstopAlert.model_construct(
         alert_id=alert_row.alert_id,
         risk_type=alert_row.risk_type,
         classification=alert_row.classification,
@@ -97,14 +152,109 @@ def _alert_row_to_hardstop_alert(alert_row: "Alert") -> HardstopAlert:
         root_event_id=alert_row.root_event_id,
         scope=scope,
         impact_assessment=impact_assessment,
-        reasoning=reasoning,
-        recommended_actions=recommended_actions,
+        reasoning=list(row_parts.reasoning),
+        recommended_actions=list(row_parts.recommended_actions),
         model_version="hardstop-v1",
         confidence_score=None,
         evidence=evidence,
     )
 
 
+def _convert_alert_row(
+    session: Session,
+    alert_row: "Alert",
+    incident_summaries: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> HardstopAlert:
+    """
+    Return _alert_row_to_hardstop_alert(alert_row), reusing row parsing done earlier in this session.
+
+    Only the parsed row columns are memoized, in session.info keyed by
+    (alert_id, last_seen_utc): every alert update bumps last_seen_utc, so a
+    changed row never hits a stale entry. Incident evidence lives on disk and can
+    appear without a row change, so it is attached on every call, and each call
+    returns a fresh HardstopAlert. Rows without last_seen_utc are always parsed.
+    """
+    last_seen = alert_row.last_seen_utc
+    if not last_seen:
+        return _alert_row_to_hardstop_alert(alert_row, incident_summaries=incident_summaries)
+
+    cache = session.info.setdefault(_ROW_PARTS_CACHE_KEY, {})
+    key = (alert_row.alert_id, str(last_seen))
+    row_parts = cache.get(key)
+    if row_parts is None:
+        row_parts = _parse_alert_row(alert_row)
+        if len(cache) >= _ROW_PARTS_CACHE_MAX_ENTRIES:
+            cache.clear()
+        cache[key] = row_parts
+    return _alert_row_to_hardstop_alert(alert_row, incident_summaries=incident_summaries, row_parts=row_parts)
+
+
+def _iter_alerts_with_rows(
+    session: Session,
+    since: Optional[str] = None,
+    classification: Optional[int] = None,
+    tier: Optional[str] = None,
+    source_id: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> Iterator[Tuple["Alert", HardstopAlert]]:
+    """
+    Shared body of iter_alerts()/list_alerts(): yields each ORM row alongside its HardstopAlert.
+
+    Callers that need row-only columns (tier, update_count, timestamps) use the
+    row directly instead of re-querying by alert_id. Alerts are converted one at
+    a time as the caller iterates.
+    """
+    # Parse since to hours if provided
+    since_hours = None
+    if since:
+        since_hours = _parse_since(since)
+    
+    # Query alerts (repo handles filtering, sorting - canonical order - and paging)
+    filtered = query_recent_alerts(
+        session,
+        since_hours=since_hours or 24 * 365,  # If no since, use 1 year as default
+        include_class0=classification is None or classification == 0,
+        limit=limit,
+        classification=classification,
+        tier=tier,
+        source_id=source_id,
+        offset=offset,
+    )
+    
+    # Load incident evidence for the whole page in one pass, then convert lazily
+    summaries = load_incident_evidence_summaries([(a.alert_id, a.correlation_key or "") for a in filtered])
+    for a in filtered:
+        yield a, _convert_alert_row(session, a, incident_summaries=summaries)
+
+
+def iter_alerts(
+    session: Session,
+    since: Optional[str] = None,
+    classification: Optional[int] = None,
+    tier: Optional[str] = None,
+    source_id: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> Iterator[HardstopAlert]:
+    """
+    Iterate alerts with optional filters, converting one alert at a time.
+    
+    Same arguments and ordering as list_alerts(); use this when the caller only
+    needs a single pass (e.g. streaming an export).
+    """
+    for _, alert in _iter_alerts_with_rows(
+        session,
+        since=since,
+        classification=classification,
+        tier=tier,
+        source_id=source_id,
+        limit=limit,
+        offset=offset,
+    ):
+        yield alert
+
+
 def list_alerts(
     session: Session,
     since: Optional[str] = None,
@@ -129,34 +279,17 @@ def list_alerts(
     Returns:
         List of HardstopAlert models, sorted by canonical order (repo handles sorting)
     """
-    # Parse since to hours if provided
-    since_hours = None
-    if since:
-        from .brief_api import _parse_since
-        since_hours = _parse_since(since)
-    
-    # Query alerts (repo handles sorting - canonical order)
-    alerts = query_recent_alerts(
-        session,
-        since_hours=since_hours or 24 * 365,  # If no since, use 1 year as default
-        include_class0=classification is None or classification == 0,
-        limit=limit + offset,  # Get more to apply offset
+    return list(
+        iter_alerts(
+            session,
+            since=since,
+            classification=classification,
+            tier=tier,
+            source_id=source_id,
+            limit=limit,
+            offset=offset,
+        )
     )
-    
-    # Apply filters that repo doesn't handle
-    filtered = alerts
-    if classification is not None:
-        filtered = [a for a in filtered if a.classification == classification]
-    if tier is not None:
-        filtered = [a for a in filtered if a.tier == tier]
-    if source_id is not None:
-        filtered = [a for a in filtered if a.source_id == source_id]
-    
-    # Apply offset and limit
-    filtered = filtered[offset:offset + limit]
-    
-    # Convert to HardstopAlert models
-    return [_alert_row_to_hardstop_alert(a) for a in filtered]
 
 
 def get_alert_detail(
@@ -174,14 +307,12 @@ def get_alert_detail(
         AlertDetailDTO or None if not found
     """
     # Use repo function for query (canonical surface rule)
-    from ..database.alert_repo import find_alert_by_id
-    
     alert_row = find_alert_by_id(session, alert_id)
     if not alert_row:
         return None
     
     # Convert to HardstopAlert
-    alert = _alert_row_to_hardstop_alert(alert_row)
+    alert = _convert_alert_row(session, alert_row)
     
     # Build provenance (minimal - only root_event_count for now)
     root_event_ids = load_root_event_ids(alert_row)
@@ -5,7 +5,9 @@ All query logic lives here - output/daily_brief.py is renderer-only.
 """
 
 import json
+import re
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Dict
 
 from sqlalchemy.orm import Session
@@ -19,15 +21,17 @@ if TYPE_CHECKING:
     from ..database.schema import Alert
 
 
+_SINCE_RE = re.compile(r"^\s*(\d+)\s*([hd])\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
 def _parse_since(since_str: str) -> int:
-    """Parse --since argument (24h, 72h, 7d) to hours."""
-    since_str = since_str.lower().strip()
-    if since_str.endswith("h"):
-        return int(since_str[:-1])
-    elif since_str.endswith("d"):
-        return int(since_str[:-1]) * 24
-    else:
-        raise ValueError(f"Invalid --since format: {since_str}. Use 24h, 72h, or 7d")
+    """Parse --since argument (24h, 72h, 7d) to hours (pure, so results are memoized)."""
+    match = _SINCE_RE.match(since_str)
+    if not match:
+        raise ValueError(f"Invalid --since format: {since_str.strip()}. Use 24h, 72h, or 7d")
+    hours = int(match.group(1))
+    return hours * 24 if match.group(2).lower() == "d" else hours
 
 
 def _infer_correlation_action(alert: "Alert") -> str:
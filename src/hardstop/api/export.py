@@ -1,18 +1,84 @@
 """Export API: structured data export for external consumption."""
 
 import csv
-import json
 from datetime import datetime, timezone
+from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
 
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from ..alerts.alert_models import HardstopAlert
+from ..utils import json_codec
 from ..utils.time import utc_now_z
-from .alerts_api import list_alerts
+from .alerts_api import _iter_alerts_with_rows
 from .brief_api import get_brief
 from .sources_api import get_sources_health, list_sources
 
+if TYPE_CHECKING:
+    from ..database.schema import Alert
+
+
+# Serializes the whole alert list in one pydantic-core call instead of per-item model_dump()
+_ALERTS_ADAPTER = TypeAdapter(List[HardstopAlert])
+
+_ALERT_CSV_COLUMNS: Tuple[str, ...] = (
+    "alert_id",
+    "classification",
+    "impact_score",
+    "tier",
+    "trust_tier",
+    "source_id",
+    "correlation_action",
+    "update_count",
+    "first_seen_utc",
+    "last_seen_utc",
+    "summary",
+)
+
+
+def _alert_csv_rows(alerts_with_rows: Iterable[Tuple["Alert", HardstopAlert]]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield one CSV row tuple per alert, in _ALERT_CSV_COLUMNS order.
+
+    tier/source_id/update_count/timestamps come from the ORM row.
+    """
+    for alert_row, alert in alerts_with_rows:
+        evidence = alert.evidence
+
+        # Extract correlation_action from evidence if available
+        if evidence and evidence.correlation:
+            correlation_action = evidence.correlation.get("action")
+        else:
+            correlation_action = alert_row.correlation_action
+
+        if evidence and evidence.diagnostics:
+            impact_score = evidence.diagnostics.impact_score
+        else:
+            impact_score = alert_row.impact_score
+
+        yield (
+            alert.alert_id,
+            alert.classification,
+            impact_score,
+            alert_row.tier,
+            alert_row.trust_tier,
+            alert_row.source_id,
+            correlation_action,
+            alert_row.update_count,
+            alert_row.first_seen_utc,
+            alert_row.last_seen_utc,
+            alert.summary,
+        )
+
+
+def _write_csv(fp: TextIO, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """Stream rows to fp as CSV (header first) without materializing the document."""
+    writer = csv.writer(fp)
+    writer.writerow(columns)
+    writer.writerows(rows)
+
 
 def export_brief(
     session: Session,
@@ -46,7 +112,7 @@ def export_brief(
     }
     
     if format == "json":
-        output = json.dumps(export_data, indent=2, sort_keys=True)
+        output = json_codec.dumps_pretty(export_data)
         if out:
             out.write_text(output, encoding="utf-8")
             return f"Exported to {out}"
@@ -81,7 +147,7 @@ def export_alerts(
     Returns:
         Exported data as string (if out is None) or writes to file
     """
-    alerts = list_alerts(
+    alerts_with_rows = _iter_alerts_with_rows(
         session,
         since=since,
         classification=classification,
@@ -91,87 +157,27 @@ def export_alerts(
     )
     
     if format == "json":
+        alerts = [alert for _, alert in alerts_with_rows]
         export_data = {
             "export_schema_version": "1",
             "exported_at_utc": utc_now_z(),
-            "data": [alert.model_dump() for alert in alerts],
+            "data": _ALERTS_ADAPTER.dump_python(alerts, mode="json"),
         }
-        output = json.dumps(export_data, indent=2, sort_keys=True)
+        output = json_codec.dumps_pretty(export_data)
         if out:
             out.write_text(output, encoding="utf-8")
             return f"Exported to {out}"
         return output
     elif format == "csv":
         # CSV: stable column order, no nested structures
-        # Query Alert rows to get tier/source_id/update_count/timestamps
-        # Use repo function (canonical surface rule)
-        from ..database.alert_repo import find_alert_by_id
-        
-        alert_ids = [alert.alert_id for alert in alerts]
-        alert_rows = {}
-        if alert_ids:
-            # Batch query would be better, but for now query individually
-            # TODO: Add batch query function to alert_repo
-            for alert_id in alert_ids:
-                alert_row = find_alert_by_id(session, alert_id)
-                if alert_row:
-                    alert_rows[alert_id] = alert_row
-        
-        columns = [
-            "alert_id",
-            "classification",
-            "impact_score",
-            "tier",
-            "trust_tier",
-            "source_id",
-            "correlation_action",
-            "update_count",
-            "first_seen_utc",
-            "last_seen_utc",
-            "summary",
-        ]
-        
-        rows = []
-        for alert in alerts:
-            alert_row = alert_rows.get(alert.alert_id)
-            
-            # Extract correlation_action from evidence if available
-            correlation_action = None
-            if alert.evidence and alert.evidence.correlation:
-                correlation_action = alert.evidence.correlation.get("action")
-            elif alert_row:
-                correlation_action = alert_row.correlation_action
-            
-            row = {
-                "alert_id": alert.alert_id,
-                "classification": alert.classification,
-                "impact_score": alert.evidence.diagnostics.impact_score if alert.evidence and alert.evidence.diagnostics else (alert_row.impact_score if alert_row else None),
-                "tier": alert_row.tier if alert_row else None,
-                "trust_tier": alert_row.trust_tier if alert_row else None,
-                "source_id": alert_row.source_id if alert_row else None,
-                "correlation_action": correlation_action,
-                "update_count": alert_row.update_count if alert_row else None,
-                "first_seen_utc": alert_row.first_seen_utc if alert_row else None,
-                "last_seen_utc": alert_row.last_seen_utc if alert_row else None,
-                "summary": alert.summary,
-            }
-            rows.append(row)
-        
-        # Write CSV with proper escaping
-        import csv as csv_module
-        from io import StringIO
-        
-        output_buffer = StringIO()
-        writer = csv_module.writer(output_buffer)
-        writer.writerow(columns)
-        for row in rows:
-            writer.writerow([row.get(col, "") for col in columns])
-        
-        output = output_buffer.getvalue()
+        rows = _alert_csv_rows(alerts_with_rows)
         if out:
-            out.write_text(output, encoding="utf-8", newline="")
+            with out.open("w", encoding="utf-8", newline="") as fp:
+                _write_csv(fp, _ALERT_CSV_COLUMNS, rows)
             return f"Exported to {out}"
-        return output
+        output_buffer = StringIO()
+        _write_csv(output_buffer, _ALERT_CSV_COLUMNS, rows)
+        return output_buffer.getvalue()
     else:
         raise ValueError(f"Unsupported format: {format}")
 
@@ -205,7 +211,7 @@ def export_sources(
     }
     
     if format == "json":
-        output = json.dumps(export_data, indent=2, sort_keys=True)
+        output = json_codec.dumps_pretty(export_data)
         if out:
             out.write_text(output, encoding="utf-8")
             return f"Exported to {out}"
@@ -4,14 +4,22 @@ import argparse
 import hashlib
 import json
 import os
+import re
 import shutil
 import sys
 import uuid
+from collections import Counter
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import requests
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, select, text
 
 from hardstop.config.loader import (
     get_all_sources,
@@ -22,18 +30,35 @@ from hardstop.config.loader import (
     load_suppression_config,
 )
 from hardstop.database.migrate import (
+    _connect as _connect_sqlite,
     ensure_alert_correlation_columns,
     ensure_event_external_fields,
     ensure_raw_items_table,
     ensure_source_runs_table,
     ensure_suppression_columns,
     ensure_trust_tier_columns,
+    mark_schema_current,
+    schema_is_current,
+)
+from hardstop.database.raw_item_repo import (
+    save_raw_items_bulk,
+    summarize_suppression_reasons,
 )
-from hardstop.database.raw_item_repo import save_raw_item, summarize_suppression_reasons
 from hardstop.database.schema import Alert, Event, RawItem, SourceRun
-from hardstop.database.source_run_repo import create_source_run, get_all_source_health, list_recent_runs
-from hardstop.database.sqlite_client import session_context
+from hardstop.database.source_run_repo import (
+    create_source_run,
+    get_all_source_health,
+    list_runs_by_phase,
+    list_stale_source_ids,
+)
+from hardstop.database.sqlite_client import (
+    apply_sqlite_pragmas,
+    get_engine,
+    session_context,
+    set_fast_mode,
+)
 from hardstop.output.daily_brief import generate_brief, render_json, render_markdown
+from hardstop.output.incidents.evidence import load_artifact_index
 from hardstop.ops.artifacts import compute_raw_item_batch_digest, compute_source_runs_digest
 from hardstop.ops.run_record import (
     ArtifactRef,
@@ -44,10 +69,12 @@ from hardstop.ops.run_record import (
 )
 from hardstop.ops.run_status import evaluate_run_status
 from hardstop.api.brief_api import _parse_since
+from hardstop.retrieval.adapters import RawItemCandidate
 from hardstop.retrieval.fetcher import FetchResult, SourceFetcher
 from hardstop.runners.ingest_external import main as ingest_external_main
 from hardstop.runners.load_network import main as load_network_main
 from hardstop.runners.run_demo import main as run_demo_main
+from hardstop.utils import json_codec
 from hardstop.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -66,6 +93,171 @@ def _resolve_source_defaults(source_config_raw, sources_config):
         return get_source_with_defaults(source_config_raw)
 
 
+def _sources_by_id(sources_config):
+    """Index configured sources by id."""
+    return {s["id"]: s for s in get_all_sources(sources_config)}
+
+
+def _since_hours_or_none(since: Optional[str]) -> Optional[int]:
+    """Parse a --since window to hours; invalid values are warned about and ignored."""
+    if not since:
+        return None
+    try:
+        return _parse_since(since)
+    except ValueError:
+        logger.warning(f"Invalid --since value: {since}, ignoring")
+        return None
+
+
+# Dumps a whole fetch result's candidates in one pydantic-core call
+_CANDIDATES_ADAPTER = TypeAdapter(List[RawItemCandidate])
+
+
+def _candidates_as_dicts(candidates: List[Any]) -> List[Dict[str, Any]]:
+    """Convert fetched candidates to plain dicts, batching the common all-RawItemCandidate case."""
+    if all(type(candidate) is RawItemCandidate for candidate in candidates):
+        return _CANDIDATES_ADAPTER.dump_python(candidates)
+    return [
+        candidate.model_dump() if isinstance(candidate, BaseModel) else candidate
+        for candidate in candidates
+    ]
+
+
+# Shared HTTP session for CLI reachability probes (keeps connections pooled across checks)
+_HTTP = requests.Session()
+_HTTP.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+
+def _probe_status(url: str, headers: Dict[str, str], timeout: float = 5) -> int:
+    """Return the HTTP status for url without downloading the response body."""
+    response = _HTTP.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+    if response.status_code in (405, 501):
+        # HEAD not allowed; issue a streamed GET and close before reading the body
+        response = _HTTP.get(url, headers=headers, timeout=timeout, stream=True)
+        response.close()
+    return response.status_code
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write table rows to stdout in one write() instead of one print() per row."""
+    if not lines:
+        return
+    try:
+        sys.stdout.write("\n".join(lines) + "\n")
+    finally:
+        sys.stdout.flush()
+
+
+def _fetch_run_items_count(run: SourceRun) -> Optional[int]:
+    """Items seen by a FETCH run: diagnostics first, then the stored counters."""
+    diagnostics = {}
+    if run.diagnostics_json:
+        try:
+            diagnostics = json_codec.loads(run.diagnostics_json)
+        except (json.JSONDecodeError, TypeError):
+            diagnostics = {}
+    for key in ("items_seen", "items_new"):
+        value = diagnostics.get(key)
+        if value is not None:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                continue
+    for value in (run.items_fetched, run.items_new):
+        if value:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                continue
+    return None
+
+
+def _fetch_result_from_run(run: SourceRun) -> FetchResult:
+    """
+    Build a status-evaluation FetchResult from a stored FETCH SourceRun.
+    
+    Uses model_construct: every field comes from typed source_runs columns, so
+    re-validating each row is pure overhead.
+    """
+    return FetchResult.model_construct(
+        source_id=run.source_id,
+        fetched_at_utc=run.run_at_utc,
+        status=run.status,
+        status_code=run.status_code,
+        error=run.error,
+        duration_seconds=run.duration_seconds,
+        items=[],  # We don't store items in FetchResult for status evaluation
+        items_count=_fetch_run_items_count(run),
+        bytes_downloaded=0,
+    )
+
+
+def _rule_ids(rules: Iterable[Any]) -> Iterator[str]:
+    """Yield the non-empty ids of suppression rules given as dicts or rule objects."""
+    for rule in rules:
+        rule_id = rule.get("id") if isinstance(rule, dict) else getattr(rule, "id", None)
+        if rule_id:
+            yield rule_id
+
+
+def _partition_budget_states(health_list: List[Dict[str, Any]]) -> tuple[List[str], List[str]]:
+    """Split source health rows into (BLOCKED, WATCH) source ids in one pass."""
+    buckets: Dict[str, List[str]] = {"BLOCKED": [], "WATCH": []}
+    for health in health_list:
+        bucket = buckets.get(health.get("health_budget_state"))
+        if bucket is not None:
+            bucket.append(health["source_id"])
+    return buckets["BLOCKED"], buckets["WATCH"]
+
+
+# Rule id in doctor's suppression warnings (e.g. "rule: my_rule_id")
+_SUPPRESSION_RULE_RE = re.compile(r"rule[:\s]+([^\s,]+)", re.IGNORECASE)
+
+
+def _doctor_next_action(
+    issues: List[str],
+    warnings: List[str],
+    first_stale_source_id: Optional[str] = None,
+) -> str:
+    """Pick doctor's "what would I do next?" hint from the highest-priority finding."""
+    # Lowercase each message once; the priorities below only test substrings
+    issues_lc = [issue.lower() for issue in issues]
+    warnings_lc = [(warning, warning.lower()) for warning in warnings]
+    
+    # Priority 1: Schema drift
+    if any("schema drift" in lc or "missing" in lc for lc in issues_lc):
+        return "Delete hardstop.db and rerun `hardstop run --since 24h`"
+    
+    # Priority 2: Stale sources (source id found by the source health check)
+    if any("stale" in lc for _, lc in warnings_lc):
+        if first_stale_source_id:
+            return f"Run `hardstop sources test {first_stale_source_id} --since 72h`"
+        return "Run `hardstop sources test <id> --since 72h` for stale sources"
+    
+    # Priority 3: All fetch failing
+    if any("failed" in lc and "fetch" in lc for lc in issues_lc):
+        return "Check network / user agent / endpoint URLs in config/sources.yaml"
+    
+    # Priority 4: Suppression config invalid
+    for warning, lc in warnings_lc:
+        if "suppression" in lc and ("invalid" in lc or "regex" in lc):
+            rule_match = _SUPPRESSION_RULE_RE.search(warning)
+            if rule_match:
+                return f"Fix suppression.yaml regex: {rule_match.group(1)}"
+            return "Fix suppression.yaml configuration"
+    
+    # Priority 5: Config error
+    if any("config" in lc or "sources.yaml" in lc for lc in issues_lc):
+        return "Fix config/sources.yaml or config/suppression.yaml"
+    
+    # Default: all good
+    return "System is healthy. Run `hardstop run --since 24h` to fetch and process new data."
+
+
+# cmd_run exit code -> footer label
+_RUN_STATUS_NAMES = {0: "HEALTHY", 1: "WARNING", 2: "BROKEN"}
+
+
 def _hash_parts(*parts: str) -> str:
     """Stable SHA-256 hash for artifact refs."""
     payload = "||".join(parts).encode("utf-8")
@@ -74,8 +266,69 @@ def _hash_parts(*parts: str) -> str:
 
 def _derive_seed(label: str) -> int:
     """Derive a deterministic seed from a stable label (e.g., run_group_id)."""
-    digest = hashlib.sha256(label.encode("utf-8")).hexdigest()
-    return int(digest[:8], 16)
+    # First 4 digest bytes, big-endian: the same value as int(hexdigest()[:8], 16)
+    return int.from_bytes(hashlib.sha256(label.encode("utf-8")).digest()[:4], "big")
+
+
+_RUN_REQUIRED_TABLES = ("raw_items", "events", "alerts", "source_runs")
+
+
+def _missing_required_tables(sqlite_path: str) -> List[str]:
+    """
+    Return "table: <name>" for each table cmd_run needs that the database lacks.
+
+    Reads sqlite_master on a raw connection on purpose: opening the engine would
+    run create_all and recreate missing tables before they could be reported.
+    """
+    if not Path(sqlite_path).exists():
+        return [f"table: {table}" for table in _RUN_REQUIRED_TABLES]
+    conn = _connect_sqlite(sqlite_path)
+    try:
+        cur = conn.execute(
+            f"SELECT name FROM sqlite_master WHERE type='table' AND name IN ({','.join('?' * len(_RUN_REQUIRED_TABLES))});",
+            _RUN_REQUIRED_TABLES,
+        )
+        existing_tables = {row[0] for row in cur.fetchall()}
+    finally:
+        conn.close()
+    return [f"table: {table}" for table in _RUN_REQUIRED_TABLES if table not in existing_tables]
+
+
+def _apply_migrations(sqlite_path: str) -> None:
+    """Run every additive migration, then stamp the schema version."""
+    ensure_raw_items_table(sqlite_path)
+    ensure_event_external_fields(sqlite_path)
+    ensure_alert_correlation_columns(sqlite_path)
+    ensure_trust_tier_columns(sqlite_path)  # v0.7: trust tier columns
+    ensure_suppression_columns(sqlite_path)  # v0.8: suppression columns
+    ensure_source_runs_table(sqlite_path)  # v0.9: source runs table
+    mark_schema_current(sqlite_path)
+
+
+@lru_cache(maxsize=None)
+def _migrate_once(sqlite_path: str) -> None:
+    # Ensure base tables exist first (creates all tables from schema)
+    get_engine(sqlite_path)
+
+    # Then add any missing columns, unless a previous run already stamped this schema
+    if not schema_is_current(sqlite_path):
+        _apply_migrations(sqlite_path)
+
+
+def _bootstrap_db(sqlite_path: str) -> None:
+    """
+    Create tables and apply migrations for sqlite_path once per process.
+
+    Later calls with the same path are no-ops, and databases already stamped with
+    the current schema version skip the migrations. Set HARDSTOP_FORCE_MIGRATE=1 to
+    re-run them every time (e.g. when a test or CI job recreates the database file).
+    """
+    if os.environ.get("HARDSTOP_FORCE_MIGRATE") == "1":
+        _migrate_once.cache_clear()
+        get_engine(sqlite_path)
+        _apply_migrations(sqlite_path)
+        return
+    _migrate_once(sqlite_path)
 
 
 def _run_group_ref(run_group_id: str) -> ArtifactRef:
@@ -113,18 +366,45 @@ def _safe_source_runs_hash(
         return _hash_parts(*fallback_parts)
 
 
-def _load_run_records(run_records_dir: Path) -> List[dict]:
-    records: List[dict] = []
+def _read_json_file(path: str) -> Optional[Any]:
+    """Read and decode one JSON file, or None if it is unreadable or malformed."""
+    try:
+        with open(path, "rb") as f:
+            return json_codec.loads(f.read())
+    except (OSError, ValueError):  # ValueError covers JSONDecodeError and bad UTF-8
+        return None
+
+
+def _iter_run_records(run_records_dir: Path) -> Iterator[dict]:
+    """Yield run records in file-name order, reading each file only when the caller asks for it."""
     if not run_records_dir.exists():
-        return records
-    for path in sorted(run_records_dir.glob("*.json")):
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            data["_path"] = str(path)
-            records.append(data)
-        except (OSError, json.JSONDecodeError):
+        return
+    with os.scandir(run_records_dir) as it:
+        paths = sorted(entry.path for entry in it if entry.name.endswith(".json") and entry.is_file())
+    for path in paths:
+        data = _read_json_file(path)
+        if not isinstance(data, dict):
             continue
-    return records
+        data["_path"] = path
+        yield data
+
+
+def _find_incident_run_record(
+    run_records_dir: Path,
+    incident_id: str,
+    artifact_hash_value: Optional[str],
+) -> Optional[dict]:
+    """
+    Return the first RunRecord (file-name order) with an output_ref matching the incident.
+
+    A ref matches on artifact hash or when its id contains incident_id. Records
+    are read lazily and the scan stops at the first match.
+    """
+    for record in _iter_run_records(run_records_dir):
+        for ref in record.get("output_refs", []):
+            if (artifact_hash_value and ref.get("hash") == artifact_hash_value) or incident_id in ref.get("id", ""):
+                return record
+    return None
 
 
 def _find_incident_artifacts(
@@ -132,14 +412,23 @@ def _find_incident_artifacts(
     *,
     artifacts_dir: Path,
     correlation_key: Optional[str] = None,
+    only_latest: bool = False,
 ) -> List[tuple[str, Path, dict]]:
+    """
+    Return (generated_at_utc, path, payload) for the incident's artifacts, newest first.
+
+    With only_latest the list holds just the newest match (ties keep file-name order).
+    """
     matches: List[tuple[str, Path, dict]] = []
-    if not artifacts_dir.exists():
-        return matches
-    for path in artifacts_dir.glob("*.json"):
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+    # The sidecar index names each artifact's alert/correlation key, so only matches are opened
+    for entry in load_artifact_index(artifacts_dir):
+        if entry.get("alert_id") != incident_id:
+            continue
+        if correlation_key and entry.get("correlation_key") != correlation_key:
+            continue
+        path = artifacts_dir / entry["path"]
+        payload = _read_json_file(str(path))
+        if not isinstance(payload, dict):
             continue
         inputs = payload.get("inputs") or {}
         if inputs.get("alert_id") != incident_id:
@@ -148,7 +437,9 @@ def _find_incident_artifacts(
             continue
         generated_at = payload.get("generated_at_utc") or ""
         matches.append((generated_at, path, payload))
-    matches.sort(key=lambda item: item[0], reverse=True)
+    if only_latest:
+        return [max(matches, key=itemgetter(0))] if matches else []
+    matches.sort(key=itemgetter(0), reverse=True)
     return matches
 
 
@@ -191,6 +482,7 @@ def cmd_incidents_replay(args: argparse.Namespace) -> dict:
             incident_id,
             artifacts_dir=artifacts_dir,
             correlation_key=correlation_key,
+            only_latest=True,
         )
         if not matches:
             message = f"Incident evidence not found for {incident_id}"
@@ -204,10 +496,8 @@ def cmd_incidents_replay(args: argparse.Namespace) -> dict:
             _, artifact_path, artifact_payload = matches[0]
             from hardstop.ops.run_record import artifact_hash as _artifact_hash  # Local import to avoid cycles
 
-            artifact_hash_value = artifact_payload.get("artifact_hash") or _artifact_hash(
-                {k: v for k, v in artifact_payload.items() if k != "artifact_hash"}
-            )
             expected_hash = _artifact_hash({k: v for k, v in artifact_payload.items() if k != "artifact_hash"})
+            artifact_hash_value = artifact_payload.get("artifact_hash") or expected_hash
             if artifact_hash_value != expected_hash:
                 message = (
                     f"Artifact hash mismatch for {incident_id}: stored={artifact_hash_value} expected={expected_hash}"
@@ -220,7 +510,8 @@ def cmd_incidents_replay(args: argparse.Namespace) -> dict:
                 logger.warning(message)
             artifact_payload["artifact_hash"] = expected_hash
 
-            bytes_len = len(json.dumps(artifact_payload, sort_keys=True).encode("utf-8"))
+            # ensure_ascii output is one byte per character, so skip the encode()
+            bytes_len = len(json.dumps(artifact_payload, sort_keys=True))
             incident_ref = ArtifactRef(
                 id=f"incident:{incident_id}",
                 hash=expected_hash,
@@ -231,19 +522,7 @@ def cmd_incidents_replay(args: argparse.Namespace) -> dict:
             input_refs.append(incident_ref)
             output_refs.append(incident_ref)
 
-        run_records = _load_run_records(run_records_dir)
-        for record in run_records:
-            for ref in record.get("output_refs", []):
-                ref_hash = ref.get("hash")
-                ref_id = ref.get("id", "")
-                if artifact_hash_value and ref_hash == artifact_hash_value:
-                    matching_run_record = record
-                    break
-                if incident_id in ref_id:
-                    matching_run_record = record
-                    break
-            if matching_run_record:
-                break
+        matching_run_record = _find_incident_run_record(run_records_dir, incident_id, artifact_hash_value)
 
         if not matching_run_record:
             message = f"No RunRecord found for incident {incident_id}"
@@ -328,6 +607,7 @@ def cmd_sources_list(args: argparse.Namespace) -> None:
         print(f"{'ID':<30} {'Tier':<12} {'Enabled':<10} {'Type':<15} {'Tags':<30}")
         print("-" * 100)
         
+        rows: List[str] = []
         for source in all_sources:
             source_id = source.get("id", "unknown")
             tier = source.get("tier", "unknown")
@@ -335,7 +615,8 @@ def cmd_sources_list(args: argparse.Namespace) -> None:
             source_type = source.get("type", "unknown")
             tags = ", ".join(source.get("tags", []))
             
-            print(f"{source_id:<30} {tier:<12} {enabled:<10} {source_type:<15} {tags:<30}")
+            rows.append(f"{source_id:<30} {tier:<12} {enabled:<10} {source_type:<15} {tags:<30}")
+        _write_lines(rows)
     
     except FileNotFoundError as e:
         logger.error(f"Sources config not found: {e}")
@@ -354,13 +635,7 @@ def cmd_sources_test(args: argparse.Namespace) -> None:
     run_group_id = str(uuid.uuid4())
     
     # Ensure migrations
-    from hardstop.database.sqlite_client import get_engine
-    get_engine(sqlite_path)
-    ensure_raw_items_table(sqlite_path)
-    ensure_event_external_fields(sqlite_path)
-    ensure_alert_correlation_columns(sqlite_path)
-    ensure_trust_tier_columns(sqlite_path)
-    ensure_source_runs_table(sqlite_path)
+    _bootstrap_db(sqlite_path)
     
     # Create fetcher
     fetcher = SourceFetcher()
@@ -369,7 +644,7 @@ def cmd_sources_test(args: argparse.Namespace) -> None:
     try:
         result = fetcher.fetch_one(
             source_id=args.source_id,
-            since=args.since,
+            since_hours=_since_hours_or_none(args.since),
             max_items=args.max_items,
         )
         
@@ -388,7 +663,7 @@ def cmd_sources_test(args: argparse.Namespace) -> None:
         
         # Save items to database
         sources_config = load_sources_config()
-        all_sources = {s["id"]: s for s in get_all_sources(sources_config)}
+        all_sources = _sources_by_id(sources_config)
         source_config_raw = all_sources.get(args.source_id, {})
         source_config = _resolve_source_defaults(source_config_raw, sources_config)
         tier = source_config.get("tier", "unknown")
@@ -396,20 +671,16 @@ def cmd_sources_test(args: argparse.Namespace) -> None:
         
         items_new = 0
         with session_context(sqlite_path) as session:
-            for candidate in result.items:
-                try:
-                    candidate_dict = candidate.model_dump() if hasattr(candidate, "model_dump") else candidate
-                    raw_item = save_raw_item(
-                        session,
-                        source_id=args.source_id,
-                        tier=tier,
-                        candidate=candidate_dict,
-                        trust_tier=trust_tier,
-                    )
-                    if raw_item in session.new or raw_item.status == "NEW":
-                        items_new += 1
-                except Exception as e:
-                    logger.error(f"Failed to save raw item: {e}")
+            try:
+                items_new = save_raw_items_bulk(
+                    session,
+                    source_id=args.source_id,
+                    tier=tier,
+                    candidates=_candidates_as_dicts(result.items),
+                    trust_tier=trust_tier,
+                )
+            except Exception as e:
+                logger.error(f"Failed to save raw items from {args.source_id}: {e}")
             
             # Create FETCH SourceRun record
             diagnostics_payload = {
@@ -446,7 +717,7 @@ def cmd_sources_test(args: argparse.Namespace) -> None:
         # If --ingest flag, run ingest for this source
         if args.ingest:
             print(f"\nIngesting items from {args.source_id}...")
-            ingest_args = argparse.Namespace(
+            ingest_args = SimpleNamespace(
                 limit=200,
                 min_tier=None,
                 source_id=args.source_id,
@@ -470,26 +741,22 @@ def cmd_sources_health(args: argparse.Namespace) -> None:
     config = load_config()
     sqlite_path = config.get("storage", {}).get("sqlite_path", "hardstop.db")
     
-    # Parse stale threshold
-    stale_hours = 48  # default
+    # Parse stale threshold (invalid values fall back to the 48h default)
+    stale_hours = 48
     if args.stale:
-        stale_str = args.stale.lower().strip()
-        if stale_str.endswith("h"):
-            stale_hours = int(stale_str[:-1])
-        elif stale_str.endswith("d"):
-            stale_hours = int(stale_str[:-1]) * 24
+        try:
+            stale_hours = _parse_since(args.stale)
+        except ValueError:
+            logger.warning(f"Invalid --stale value: {args.stale}, using 48h")
     
     lookback_n = args.lookback or 10
     
     # Get source configs for tier info
     sources_config = load_sources_config()
-    all_sources_list = get_all_sources(sources_config)
-    all_sources = {s["id"]: s for s in all_sources_list}
+    all_sources = _sources_by_id(sources_config)
     source_ids = list(all_sources.keys())
     
     with session_context(sqlite_path) as session:
-        from hardstop.database.source_run_repo import get_all_source_health
-        
         health_list = get_all_source_health(
             session,
             lookback_n=lookback_n,
@@ -520,6 +787,8 @@ def cmd_sources_health(args: argparse.Namespace) -> None:
         
         health_list.sort(key=sort_key)
         
+        # Rows are collected and written to stdout at once
+        rows: List[str] = []
         for health in health_list:
             source_id = health["source_id"]
             tier = all_sources.get(source_id, {}).get("tier", "unknown")[:1].upper()
@@ -541,7 +810,7 @@ def cmd_sources_health(args: argparse.Namespace) -> None:
             score = health.get("health_score", 0)
             consecutive_failures = health.get("consecutive_failures", 0)
             
-            print(
+            rows.append(
                 f"{source_id:<25} "
                 f"{tier:<6} "
                 f"{score:>5} "
@@ -554,6 +823,7 @@ def cmd_sources_health(args: argparse.Namespace) -> None:
                 f"{state:>8}"
             )
         
+        _write_lines(rows)
         print()
         
         if args.explain_suppress:
@@ -593,7 +863,7 @@ def cmd_fetch(args: argparse.Namespace, run_group_id: Optional[str] = None) -> N
     mode = "strict" if getattr(args, "strict", False) else "best-effort"
     output_refs: List[ArtifactRef] = []
     errors: List[Diagnostic] = []
-    best_effort_metadata: dict = {}
+    best_effort_metadata: Optional[dict] = None  # None until the fetcher reports it
     
     # Generate run_group_id if not provided
     if run_group_id is None:
@@ -610,31 +880,15 @@ def cmd_fetch(args: argparse.Namespace, run_group_id: Optional[str] = None) -> N
     total_fetched = 0
     total_stored = 0
     
-    # Ensure base tables exist first (creates all tables from schema)
-    from hardstop.database.sqlite_client import get_engine
-    get_engine(sqlite_path)
-    
-    # Then run migrations to add any missing columns
-    ensure_raw_items_table(sqlite_path)
-    ensure_event_external_fields(sqlite_path)
-    ensure_alert_correlation_columns(sqlite_path)
-    ensure_trust_tier_columns(sqlite_path)  # v0.7: trust tier columns
-    ensure_source_runs_table(sqlite_path)  # v0.9: source runs table
+    # Ensure base tables and migrations
+    _bootstrap_db(sqlite_path)
     
     # Create fetcher
     rng_seed = _derive_seed(run_group_id)
     fetcher = SourceFetcher(strict=mode == "strict", rng_seed=rng_seed)
     
-    # Parse since argument
-    since_hours = None
-    if args.since:
-        since_str = args.since.lower().strip()
-        if since_str.endswith("h"):
-            since_hours = int(since_str[:-1])
-        elif since_str.endswith("d"):
-            since_hours = int(since_str[:-1]) * 24
-    
     try:
+        since_hours = _since_hours_or_none(args.since)
         if args.dry_run:
             print("DRY RUN: Would fetch from sources (no changes will be made)")
             # Still load sources to show what would be fetched
@@ -673,7 +927,7 @@ def cmd_fetch(args: argparse.Namespace, run_group_id: Optional[str] = None) -> N
                 tier=args.tier,
                 enabled_only=args.enabled_only,
                 max_items_per_source=args.max_items_per_source,
-                since=args.since,
+                since_hours=since_hours,
                 fail_fast=args.fail_fast,
             )
             
@@ -681,42 +935,35 @@ def cmd_fetch(args: argparse.Namespace, run_group_id: Optional[str] = None) -> N
             with session_context(sqlite_path) as session:
                 # Get source configs once
                 sources_config = load_sources_config()
-                all_sources = {s["id"]: s for s in get_all_sources(sources_config)}
+                all_sources = _sources_by_id(sources_config)
+                resolved_sources = {}
                 
                 for result in results:  # results is now List[FetchResult]
                     source_id = result.source_id
                     candidates = result.items
                     
-                    # Get source config for tier and trust_tier
-                    source_config_raw = all_sources.get(source_id, {})
-                    source_config = _resolve_source_defaults(source_config_raw, sources_config)
+                    # Get source config for tier and trust_tier (resolved once per source)
+                    source_config = resolved_sources.get(source_id)
+                    if source_config is None:
+                        source_config = _resolve_source_defaults(all_sources.get(source_id, {}), sources_config)
+                        resolved_sources[source_id] = source_config
                     tier = source_config.get("tier", "unknown")
                     trust_tier = source_config.get("trust_tier", 2)
                     
                     # Track items actually inserted (new, not duplicates)
+                    candidate_dicts = _candidates_as_dicts(candidates)
                     items_new = 0
-                    
-                    for candidate in candidates:
-                        try:
-                            candidate_dict = candidate.model_dump() if hasattr(candidate, "model_dump") else candidate
-                            
-                            # Check if item is new by checking if it's in session.new after save
-                            # We'll check the raw_id pattern or use a simpler approach: track count before/after
-                            raw_item = save_raw_item(
-                                session,
-                                source_id=source_id,
-                                tier=tier,
-                                candidate=candidate_dict,
-                                trust_tier=trust_tier,
-                            )
-                            
-                            # Check if this is a new item (was just added to session)
-                            # New items have status="NEW" and are in session.new
-                            if raw_item in session.new or raw_item.status == "NEW":
-                                items_new += 1
-                                total_stored += 1
-                        except Exception as e:
-                            logger.error(f"Failed to save raw item from {source_id}: {e}")
+                    try:
+                        items_new = save_raw_items_bulk(
+                            session,
+                            source_id=source_id,
+                            tier=tier,
+                            candidates=candidate_dicts,
+                            trust_tier=trust_tier,
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to save raw items from {source_id}: {e}")
+                    total_stored += items_new
                     
                     total_fetched += len(candidates)
                     logger.info(f"Fetched {len(candidates)} items from {source_id}, {items_new} new")
@@ -782,8 +1029,12 @@ def cmd_fetch(args: argparse.Namespace, run_group_id: Optional[str] = None) -> N
         errors.append(Diagnostic(code="FETCH_ERROR", message=str(e)))
         raise
     finally:
+        if best_effort_metadata is None:
+            try:
+                best_effort_metadata = fetcher.best_effort_metadata()
+            except Exception:
+                best_effort_metadata = {}
         try:
-            best_effort_metadata = best_effort_metadata or fetcher.best_effort_metadata()
             emit_run_record(
                 operator_id="hardstop.fetch@1.0.0",
                 mode=mode,
@@ -826,24 +1077,13 @@ def cmd_ingest_external(args: argparse.Namespace, run_group_id: Optional[str] =
         ),
     ]
     
-    # Ensure migrations
-    ensure_raw_items_table(sqlite_path)
-    ensure_event_external_fields(sqlite_path)
-    ensure_alert_correlation_columns(sqlite_path)
-    ensure_trust_tier_columns(sqlite_path)  # v0.7: trust tier columns
-    ensure_suppression_columns(sqlite_path)  # v0.8: suppression columns
-    ensure_source_runs_table(sqlite_path)  # v0.9: source runs table
+    # Ensure tables and migrations
+    _bootstrap_db(sqlite_path)
     
     # Parse min_tier
     min_tier = args.min_tier
     
-    # Parse since_hours if provided
-    since_hours = None
-    if args.since:
-        try:
-            since_hours = _parse_since(args.since)
-        except ValueError:
-            logger.warning(f"Invalid --since value: {args.since}, ignoring")
+    since_hours = _since_hours_or_none(args.since)
     
     try:
         with session_context(sqlite_path) as session:
@@ -919,10 +1159,12 @@ def cmd_run(args: argparse.Namespace) -> None:
     
     config = load_config()
     sqlite_path = config.get("storage", {}).get("sqlite_path", "hardstop.db")
+    if getattr(args, "fast", False):
+        set_fast_mode(True)
     
     # Step 1: Fetch
     print("Step 1: Fetching from sources...")
-    fetch_args = argparse.Namespace(
+    fetch_args = SimpleNamespace(
         tier=None,
         enabled_only=True,
         max_items_per_source=10,
@@ -939,7 +1181,7 @@ def cmd_run(args: argparse.Namespace) -> None:
     
     # Step 2: Ingest external
     print("\nStep 2: Ingesting external items...")
-    ingest_args = argparse.Namespace(
+    ingest_args = SimpleNamespace(
         limit=200,
         min_tier=None,
         source_id=None,
@@ -958,7 +1200,7 @@ def cmd_run(args: argparse.Namespace) -> None:
     
     # Step 3: Brief
     print("\nStep 3: Generating brief...")
-    brief_args = argparse.Namespace(
+    brief_args = SimpleNamespace(
         today=True,
         since=since_str,
         format="md",
@@ -982,69 +1224,21 @@ def cmd_run(args: argparse.Namespace) -> None:
     
     try:
         with session_context(sqlite_path) as session:
-            # Get FETCH phase runs for this run_group_id
-            fetch_runs = list_recent_runs(session, limit=100, phase="FETCH")
-            fetch_runs = [r for r in fetch_runs if r.run_group_id == run_group_id]
+            # Get FETCH and INGEST phase runs for this run_group_id in one query
+            runs_by_phase = list_runs_by_phase(session, run_group_id, phases=("FETCH", "INGEST"), limit=100)
+            fetch_runs = runs_by_phase["FETCH"]
             
             # Convert to FetchResult format
-            fetch_results = []
-            for run in fetch_runs:
-                diagnostics = {}
-                if run.diagnostics_json:
-                    try:
-                        diagnostics = json.loads(run.diagnostics_json)
-                    except (json.JSONDecodeError, TypeError):
-                        diagnostics = {}
-                items_count = None
-                for key in ("items_seen", "items_new"):
-                    value = diagnostics.get(key)
-                    if value is not None:
-                        try:
-                            items_count = int(value)
-                            break
-                        except (TypeError, ValueError):
-                            continue
-                if items_count is None:
-                    for value in (run.items_fetched, run.items_new):
-                        if value:
-                            try:
-                                items_count = int(value)
-                                break
-                            except (TypeError, ValueError):
-                                continue
-                fetch_results.append(
-                    FetchResult(
-                        source_id=run.source_id,
-                        fetched_at_utc=run.run_at_utc,
-                        status=run.status,
-                        status_code=run.status_code,
-                        error=run.error,
-                        duration_seconds=run.duration_seconds,
-                        items=[],  # We don't store items in FetchResult for status evaluation
-                        items_count=items_count,
-                    )
-                )
+            fetch_results = [_fetch_result_from_run(run) for run in fetch_runs]
             
-            # Get INGEST phase runs for this run_group_id
-            ingest_runs = list_recent_runs(session, limit=100, phase="INGEST")
-            ingest_runs = [r for r in ingest_runs if r.run_group_id == run_group_id]
+            ingest_runs = runs_by_phase["INGEST"]
             
             # Calculate stale sources
             try:
                 stale_hours = _parse_since(stale_threshold)
                 if stale_hours:
                     stale_threshold_dt = datetime.now(timezone.utc) - timedelta(hours=stale_hours)
-                    stale_threshold_iso = stale_threshold_dt.isoformat()
-                    all_fetch_runs = list_recent_runs(session, limit=1000, phase="FETCH")
-                    source_last_success = {}
-                    for run in all_fetch_runs:
-                        if run.status == "SUCCESS":
-                            if run.source_id not in source_last_success:
-                                source_last_success[run.source_id] = run.run_at_utc
-                    
-                    for source_id, last_success_utc in source_last_success.items():
-                        if last_success_utc < stale_threshold_iso:
-                            stale_sources.append(source_id)
+                    stale_sources.extend(list_stale_source_ids(session, int(stale_threshold_dt.timestamp())))
             except Exception as e:
                 logger.warning(f"Error calculating stale sources: {e}")
     except Exception as e:
@@ -1065,15 +1259,13 @@ def cmd_run(args: argparse.Namespace) -> None:
         
         # Check suppression config
         try:
-            from hardstop.config.loader import load_suppression_config
             suppression_config = load_suppression_config()
             suppression_warnings = []
             if not suppression_config.get("enabled", True):
                 suppression_warnings.append("Suppression disabled")
             # Check for duplicate rule IDs (simplified check)
             rules = suppression_config.get("rules", [])
-            rule_ids = [r.get("id") for r in rules if isinstance(r, dict) and r.get("id")]
-            if len(rule_ids) != len(set(rule_ids)):
+            if any(count > 1 for count in Counter(_rule_ids(rules)).values()):
                 suppression_warnings.append("Duplicate rule IDs found")
             if suppression_warnings:
                 doctor_findings["suppression_warnings"] = suppression_warnings
@@ -1093,8 +1285,7 @@ def cmd_run(args: argparse.Namespace) -> None:
                     lookback_n=10,
                     stale_threshold_hours=stale_hours_value,
                 )
-            blocked = [h["source_id"] for h in health_list if h.get("health_budget_state") == "BLOCKED"]
-            watch = [h["source_id"] for h in health_list if h.get("health_budget_state") == "WATCH"]
+            blocked, watch = _partition_budget_states(health_list)
             if blocked:
                 doctor_findings["health_budget_blockers"] = blocked
             if watch:
@@ -1104,22 +1295,9 @@ def cmd_run(args: argparse.Namespace) -> None:
         
         # Check schema drift (check for required tables)
         try:
-            import sqlite3
-            conn = sqlite3.connect(sqlite_path)
-            try:
-                required_tables = ["raw_items", "events", "alerts", "source_runs"]
-                missing_tables = []
-                for table in required_tables:
-                    cur = conn.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
-                        (table,)
-                    )
-                    if not cur.fetchone():
-                        missing_tables.append(f"table: {table}")
-                if missing_tables:
-                    doctor_findings["schema_drift"] = missing_tables
-            finally:
-                conn.close()
+            missing_tables = _missing_required_tables(sqlite_path)
+            if missing_tables:
+                doctor_findings["schema_drift"] = missing_tables
         except Exception as e:
             logger.warning(f"Error checking schema: {e}")
     except Exception as e:
@@ -1137,8 +1315,7 @@ def cmd_run(args: argparse.Namespace) -> None:
     )
     
     # Print footer
-    status_names = {0: "HEALTHY", 1: "WARNING", 2: "BROKEN"}
-    status_name = status_names.get(exit_code, "UNKNOWN")
+    status_name = _RUN_STATUS_NAMES.get(exit_code, "UNKNOWN")
     print(f"\n{'=' * 50}")
     print(f"Run status: {status_name}")
     if messages:
@@ -1159,14 +1336,14 @@ def cmd_run(args: argparse.Namespace) -> None:
             input_refs=[
                 ArtifactRef(
                     id=f"run-group:{run_group_id}",
-                    hash=hashlib.sha256(run_group_id.encode("utf-8")).hexdigest(),
+                    hash=_hash_parts(run_group_id),
                     kind="RunGroup",
                 )
             ],
             output_refs=[
                 ArtifactRef(
                     id=f"run-status:{run_group_id}",
-                    hash=hashlib.sha256("||".join(messages).encode("utf-8")).hexdigest(),
+                    hash=_hash_parts(*messages),
                     kind="RunStatus",
                 )
             ],
@@ -1182,14 +1359,33 @@ def cmd_run(args: argparse.Namespace) -> None:
 
 def cmd_doctor(args: argparse.Namespace) -> None:
     """Run health checks on Hardstop system."""
-    print("Hardstop Doctor - Health Check")
-    print("=" * 50)
+    # Buffer output and write it once per check section (one stdout write per section)
+    out: List[str] = []
+    emit = out.append
+
+    def flush() -> None:
+        _write_lines(out)
+        out.clear()
+
+    # Resolve the database path once; a config error is re-raised in each check that needs it
+    sqlite_path: Optional[str] = None
+    config_error: Optional[Exception] = None
+    try:
+        sqlite_path = load_config().get("storage", {}).get("sqlite_path", "hardstop.db")
+    except Exception as e:
+        config_error = e
+
+    emit("Hardstop Doctor - Health Check")
+    emit("=" * 50)
     
     issues = []
     warnings = []
+    suppressed_24h: Optional[int] = None  # Counted in check 1, reported in check 4
+    first_stale_source_id: Optional[str] = None  # Found in check 5, used for the next-action hint
 
     # Check 0: CLI access & PATH hygiene
-    print("\n[0] CLI Access & PATH...")
+    flush()
+    emit("\n[0] CLI Access & PATH...")
     try:
         user_bin = Path.home() / ".local" / "bin"
         path_entries = [
@@ -1197,29 +1393,30 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         ]
         hardstop_path = shutil.which("hardstop")
         if hardstop_path:
-            print(f"  [OK] hardstop CLI found at: {hardstop_path}")
+            emit(f"  [OK] hardstop CLI found at: {hardstop_path}")
         else:
             warning_msg = "hardstop CLI not found on PATH (activate your venv or add ~/.local/bin)"
             warnings.append(warning_msg)
-            print(f"  [WARN] {warning_msg}")
+            emit(f"  [WARN] {warning_msg}")
         if user_bin.exists():
             if str(user_bin) in path_entries:
-                print(f"  [OK] PATH includes user-level scripts: {user_bin}")
+                emit(f"  [OK] PATH includes user-level scripts: {user_bin}")
             else:
                 msg = f"{user_bin} not on PATH (pip --user installs land here)"
                 warnings.append(msg)
-                print(f"  [WARN] {msg}")
-                print('        Add `export PATH="$HOME/.local/bin:$PATH"` to your shell rc or re-activate your virtualenv.')
+                emit(f"  [WARN] {msg}")
+                emit('        Add `export PATH="$HOME/.local/bin:$PATH"` to your shell rc or re-activate your virtualenv.')
     except Exception as e:
         warn_msg = f"PATH check failed: {e}"
         warnings.append(warn_msg)
-        print(f"  [WARN] {warn_msg}")
+        emit(f"  [WARN] {warn_msg}")
     
     # Check 1: DB exists and migrations applied
-    print("\n[1] Database Check...")
+    flush()
+    emit("\n[1] Database Check...")
     try:
-        config = load_config()
-        sqlite_path = config.get("storage", {}).get("sqlite_path", "hardstop.db")
+        if config_error is not None:
+            raise config_error
         db_path = Path(sqlite_path)
         
         if not db_path.exists():
@@ -1228,17 +1425,26 @@ def cmd_doctor(args: argparse.Namespace) -> None:
                 "(run `hardstop init` then `hardstop run --since 24h` to create it)"
             )
             issues.append(issue_msg)
-            print(f"  [X] {issue_msg}")
-            print("        Follow the README first-time setup commands to create a fresh SQLite database.")
+            emit(f"  [X] {issue_msg}")
+            emit("        Follow the README first-time setup commands to create a fresh SQLite database.")
         else:
-            print(f"  [OK] Database exists: {sqlite_path}")
+            emit(f"  [OK] Database exists: {sqlite_path}")
             
             # Check for schema drift - specific missing columns
+            # Raw connection on purpose: opening the engine would create missing tables first
             import sqlite3
             conn = sqlite3.connect(sqlite_path)
+            apply_sqlite_pragmas(conn)
             try:
                 missing_columns = []
                 
+                # One sqlite_master read and one PRAGMA table_info per table, then set lookups
+                cur = conn.execute("SELECT name FROM sqlite_master WHERE type='table';")
+                existing_tables = {row[0] for row in cur.fetchall()}
+                
+                def table_columns(table: str) -> set:
+                    return {row[1] for row in conn.execute(f"PRAGMA table_info({table});").fetchall()}
+                
                 # Check alerts table columns (v0.7: includes trust_tier, tier, source_id)
                 alerts_required = [
                     "classification", "correlation_key", "correlation_action",
@@ -1246,11 +1452,8 @@ def cmd_doctor(args: argparse.Namespace) -> None:
                     "root_event_ids_json", "impact_score", "scope_json",
                     "trust_tier", "tier", "source_id"  # v0.7
                 ]
-                for col in alerts_required:
-                    cur = conn.execute("PRAGMA table_info(alerts);")
-                    cols = [row[1] for row in cur.fetchall()]
-                    if col not in cols:
-                        missing_columns.append(f"alerts.{col}")
+                cols = table_columns("alerts")
+                missing_columns.extend(f"alerts.{col}" for col in alerts_required if col not in cols)
                 
                 # Check events table columns (v0.7: includes trust_tier, v0.8: includes suppression)
                 events_required = [
@@ -1259,99 +1462,103 @@ def cmd_doctor(args: argparse.Namespace) -> None:
                     "trust_tier",  # v0.7
                     "suppression_primary_rule_id", "suppression_rule_ids_json", "suppressed_at_utc",  # v0.8
                 ]
-                for col in events_required:
-                    cur = conn.execute("PRAGMA table_info(events);")
-                    cols = [row[1] for row in cur.fetchall()]
-                    if col not in cols:
-                        missing_columns.append(f"events.{col}")
+                cols = table_columns("events")
+                missing_columns.extend(f"events.{col}" for col in events_required if col not in cols)
                 
                 # Check raw_items table exists and has trust_tier column
-                cur = conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='raw_items';"
-                )
-                if not cur.fetchone():
+                if "raw_items" not in existing_tables:
                     missing_columns.append("table: raw_items")
                 else:
                     # Check for trust_tier and suppression columns in raw_items (v0.7, v0.8)
-                    cur = conn.execute("PRAGMA table_info(raw_items);")
-                    cols = [row[1] for row in cur.fetchall()]
+                    cols = table_columns("raw_items")
                     if "trust_tier" not in cols:
                         missing_columns.append("raw_items.trust_tier")
                     # v0.8: suppression columns
                     suppression_cols = ["suppression_status", "suppression_primary_rule_id", "suppression_rule_ids_json", "suppressed_at_utc", "suppression_stage"]
-                    for col in suppression_cols:
-                        if col not in cols:
-                            missing_columns.append(f"raw_items.{col}")
+                    missing_columns.extend(f"raw_items.{col}" for col in suppression_cols if col not in cols)
                 
                 # Check source_runs table exists (v0.9)
-                cur = conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='source_runs';"
-                )
-                if not cur.fetchone():
+                if "source_runs" not in existing_tables:
                     missing_columns.append("table: source_runs")
                 
                 if missing_columns:
                     issues.append(f"Schema drift detected: {len(missing_columns)} missing columns/tables")
-                    print(f"  [X] Schema drift detected:")
+                    emit(f"  [X] Schema drift detected:")
                     for col in missing_columns:
-                        print(f"      - Missing: {col}")
-                    print(f"  [INFO] Recommended fix: Delete {sqlite_path} and re-run `hardstop run --since 24h`")
-                    print(f"        (Migrations are additive, but fresh DB ensures clean schema)")
+                        emit(f"      - Missing: {col}")
+                    emit(f"  [INFO] Recommended fix: Delete {sqlite_path} and re-run `hardstop run --since 24h`")
+                    emit(f"        (Migrations are additive, but fresh DB ensures clean schema)")
                 else:
-                    print("  [OK] Schema is up to date")
+                    emit("  [OK] Schema is up to date")
             finally:
                 conn.close()
             
             # Try to apply migrations
             try:
-                ensure_raw_items_table(sqlite_path)
-                ensure_event_external_fields(sqlite_path)
-                ensure_alert_correlation_columns(sqlite_path)
-                ensure_trust_tier_columns(sqlite_path)  # v0.7: trust tier columns
-                ensure_suppression_columns(sqlite_path)  # v0.8: suppression columns
-                ensure_source_runs_table(sqlite_path)  # v0.9: source runs table
-                print("  [OK] Migrations applied")
+                # Always re-run here: doctor is the repair path, so skip the version stamp check
+                _apply_migrations(sqlite_path)
+                emit("  [OK] Migrations applied")
             except Exception as e:
                 issues.append(f"Migration error: {e}")
-                print(f"  [X] Migration error: {e}")
+                emit(f"  [X] Migration error: {e}")
             
             # Check table counts
             try:
                 with session_context(sqlite_path) as session:
-                    raw_count = session.query(RawItem).count()
-                    event_count = session.query(Event).count()
-                    alert_count = session.query(Alert).count()
+                    # One statement: a single raw_items scan plus scalar counts for events/alerts
+                    suppressed_cutoff_iso = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
+                    counts_stmt = select(
+                        func.count(),
+                        select(func.count()).select_from(Event).scalar_subquery(),
+                        select(func.count()).select_from(Alert).scalar_subquery(),
+                        func.count().filter(RawItem.status == "NEW"),
+                        func.count().filter(RawItem.status == "NORMALIZED"),
+                        func.count().filter(RawItem.status == "FAILED"),
+                        func.count().filter(RawItem.suppression_status == "SUPPRESSED"),
+                        # Reported by check 4
+                        func.count().filter(
+                            RawItem.suppression_status == "SUPPRESSED",
+                            RawItem.suppressed_at_utc >= suppressed_cutoff_iso,
+                        ),
+                    ).select_from(RawItem)
+                    (
+                        raw_count,
+                        event_count,
+                        alert_count,
+                        new_count,
+                        normalized_count,
+                        failed_count,
+                        suppressed_count,
+                        suppressed_24h,
+                    ) = session.execute(counts_stmt).one()
                     
-                    print(f"  [OK] raw_items: {raw_count}")
-                    print(f"  [OK] events: {event_count}")
-                    print(f"  [OK] alerts: {alert_count}")
+                    emit(f"  [OK] raw_items: {raw_count}")
+                    emit(f"  [OK] events: {event_count}")
+                    emit(f"  [OK] alerts: {alert_count}")
                     
                     # Check status distribution
                     if raw_count > 0:
-                        new_count = session.query(RawItem).filter(RawItem.status == "NEW").count()
-                        normalized_count = session.query(RawItem).filter(RawItem.status == "NORMALIZED").count()
-                        failed_count = session.query(RawItem).filter(RawItem.status == "FAILED").count()
-                        suppressed_count = session.query(RawItem).filter(RawItem.suppression_status == "SUPPRESSED").count()
-                        print(f"    - NEW: {new_count}, NORMALIZED: {normalized_count}, FAILED: {failed_count}, SUPPRESSED: {suppressed_count}")
+                        emit(f"    - NEW: {new_count}, NORMALIZED: {normalized_count}, FAILED: {failed_count}, SUPPRESSED: {suppressed_count}")
                         if new_count > 0:
                             warnings.append(f"{new_count} raw items pending ingestion")
             except Exception as e:
                 issues.append(f"Database query error: {e}")
-                print(f"  [X] Database query error: {e}")
+                emit(f"  [X] Database query error: {e}")
     except Exception as e:
         issues.append(f"Config/database error: {e}")
-        print(f"  [X] Config/database error: {e}")
+        emit(f"  [X] Config/database error: {e}")
     
     # Check 2: sources.yaml is readable
-    print("\n[2] Sources Configuration...")
+    flush()
+    emit("\n[2] Sources Configuration...")
     try:
         sources_config = load_sources_config()
         all_sources = get_all_sources(sources_config)
         enabled_sources = [s for s in all_sources if s.get("enabled", True)]
         
-        print(f"  [OK] Sources config loaded")
-        print(f"  [OK] Total sources: {len(all_sources)}")
-        print(f"  [OK] Enabled sources: {len(enabled_sources)}")
+        emit(f"  [OK] Sources config loaded")
+        emit(f"  [OK] Total sources: {len(all_sources)}")
+        emit(f"  [OK] Enabled sources: {len(enabled_sources)}")
         
         # Count by tier
         tier_counts = {"global": 0, "regional": 0, "local": 0}
@@ -1360,24 +1567,25 @@ def cmd_doctor(args: argparse.Namespace) -> None:
             if tier in tier_counts:
                 tier_counts[tier] += 1
         
-        print(f"    - Global: {tier_counts['global']}, Regional: {tier_counts['regional']}, Local: {tier_counts['local']}")
+        emit(f"    - Global: {tier_counts['global']}, Regional: {tier_counts['regional']}, Local: {tier_counts['local']}")
         
         if len(enabled_sources) == 0:
             warnings.append("No enabled sources configured")
     except FileNotFoundError:
         issue_msg = "sources.yaml not found (run `hardstop init` to copy the example config)"
         issues.append(issue_msg)
-        print(f"  [X] {issue_msg}")
+        emit(f"  [X] {issue_msg}")
     except Exception as e:
         issue_msg = (
             f"Sources config error: {e} "
             "(fix the file or run `hardstop init --force` to regenerate from the example)"
         )
         issues.append(issue_msg)
-        print(f"  [X] {issue_msg}")
+        emit(f"  [X] {issue_msg}")
     
     # Check 3: Network connectivity (basic)
-    print("\n[3] Network Connectivity...")
+    flush()
+    emit("\n[3] Network Connectivity...")
     
     # Test NWS API with proper headers
     try:
@@ -1388,110 +1596,83 @@ def cmd_doctor(args: argparse.Namespace) -> None:
             "User-Agent": user_agent,
             "Accept": "application/geo+json",
         }
-        response = requests.get("https://api.weather.gov/alerts/active", headers=headers, timeout=5)
-        if response.status_code == 200:
-            print(f"  [OK] NWS API: Reachable (status {response.status_code})")
-        elif response.status_code == 403:
-            print(f"  [WARN] NWS API: Forbidden (status {response.status_code}) - check User-Agent header")
+        status_code = _probe_status("https://api.weather.gov/alerts/active", headers)
+        if status_code == 200:
+            emit(f"  [OK] NWS API: Reachable (status {status_code})")
+        elif status_code == 403:
+            emit(f"  [WARN] NWS API: Forbidden (status {status_code}) - check User-Agent header")
             warnings.append("NWS API returned 403 - verify User-Agent is set correctly")
         else:
-            print(f"  [WARN] NWS API: Status {response.status_code}")
-            warnings.append(f"NWS API returned status {response.status_code}")
+            emit(f"  [WARN] NWS API: Status {status_code}")
+            warnings.append(f"NWS API returned status {status_code}")
     except requests.RequestException as e:
         warnings.append("Network connectivity test failed (may affect fetching)")
-        print(f"  [WARN] NWS API: Connection failed - {e}")
+        emit(f"  [WARN] NWS API: Connection failed - {e}")
     
     # Check 4: Suppression configuration (v0.8)
-    print("\n[4] Suppression Configuration...")
+    flush()
+    emit("\n[4] Suppression Configuration...")
     try:
         suppression_config = load_suppression_config()
         suppression_enabled = suppression_config.get("enabled", True)
         global_rules = suppression_config.get("rules", [])
         
-        print(f"  [OK] Suppression config loaded")
-        print(f"  [OK] Suppression enabled: {'yes' if suppression_enabled else 'no'}")
-        print(f"  [OK] Global rules: {len(global_rules)}")
+        emit(f"  [OK] Suppression config loaded")
+        emit(f"  [OK] Suppression enabled: {'yes' if suppression_enabled else 'no'}")
+        emit(f"  [OK] Global rules: {len(global_rules)}")
         
         # Count per-source rules
         try:
             sources_config = load_sources_config()
             all_sources = get_all_sources(sources_config)
-            per_source_rules_count = 0
-            all_rule_ids = set()
-            duplicate_rule_ids = set()
-            
-            # Collect global rule IDs
-            for rule in global_rules:
-                rule_id = rule.get("id") if isinstance(rule, dict) else getattr(rule, "id", None)
-                if rule_id:
-                    if rule_id in all_rule_ids:
-                        duplicate_rule_ids.add(rule_id)
-                    all_rule_ids.add(rule_id)
-            
-            # Collect per-source rule IDs
-            for source in all_sources:
-                source_rules = get_suppression_rules_for_source(source)
-                per_source_rules_count += len(source_rules)
-                for rule in source_rules:
-                    rule_id = rule.get("id") if isinstance(rule, dict) else getattr(rule, "id", None)
-                    if rule_id:
-                        if rule_id in all_rule_ids:
-                            duplicate_rule_ids.add(rule_id)
-                        all_rule_ids.add(rule_id)
+            source_rule_lists = [get_suppression_rules_for_source(source) for source in all_sources]
+            per_source_rules_count = sum(len(source_rules) for source_rules in source_rule_lists)
+            rule_id_counts = Counter(
+                chain(_rule_ids(global_rules), *(_rule_ids(source_rules) for source_rules in source_rule_lists))
+            )
+            all_rule_ids = rule_id_counts.keys()
+            duplicate_rule_ids = {rule_id for rule_id, count in rule_id_counts.items() if count > 1}
             
-            print(f"  [OK] Per-source rules: {per_source_rules_count} total")
-            print(f"  [OK] Total rules: {len(all_rule_ids)}")
+            emit(f"  [OK] Per-source rules: {per_source_rules_count} total")
+            emit(f"  [OK] Total rules: {len(all_rule_ids)}")
             
             if duplicate_rule_ids:
                 warnings.append(f"Duplicate rule IDs found: {', '.join(sorted(duplicate_rule_ids))}")
-                print(f"  [WARN] Duplicate rule IDs: {', '.join(sorted(duplicate_rule_ids))}")
+                emit(f"  [WARN] Duplicate rule IDs: {', '.join(sorted(duplicate_rule_ids))}")
             
-            # Show suppressed count if DB exists
-            if db_path.exists():
-                try:
-                    with session_context(sqlite_path) as session:
-                        from datetime import datetime, timedelta, timezone
-                        cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-                        cutoff_iso = cutoff.isoformat()
-                        suppressed_24h = session.query(RawItem).filter(
-                            RawItem.suppression_status == "SUPPRESSED",
-                            RawItem.suppressed_at_utc >= cutoff_iso,
-                        ).count()
-                        if suppressed_24h > 0:
-                            print(f"  [OK] Suppressed (last 24h): {suppressed_24h}")
-                except Exception:
-                    pass  # Ignore DB errors in suppression check
+            # Show suppressed count if the database check counted it
+            if suppressed_24h:
+                emit(f"  [OK] Suppressed (last 24h): {suppressed_24h}")
         except Exception as e:
             warnings.append(f"Error counting per-source rules: {e}")
-            print(f"  [WARN] Error counting per-source rules: {e}")
+            emit(f"  [WARN] Error counting per-source rules: {e}")
     except FileNotFoundError:
-        print("  [INFO] Suppression config not found (suppression disabled)")
+        emit("  [INFO] Suppression config not found (suppression disabled)")
     except Exception as e:
         warnings.append(f"Suppression config error: {e}")
-        print(f"  [WARN] Suppression config error: {e}")
+        emit(f"  [WARN] Suppression config error: {e}")
     
     # Check 5: Source health tracking (v0.9)
-    print("\n[5] Source Health Tracking...")
+    flush()
+    emit("\n[5] Source Health Tracking...")
     try:
-        config = load_config()
-        sqlite_path = config.get("storage", {}).get("sqlite_path", "hardstop.db")
+        if config_error is not None:
+            raise config_error
         db_path = Path(sqlite_path)
         
         if not db_path.exists():
-            print("  [INFO] Database not found - source health tracking unavailable")
+            emit("  [INFO] Database not found - source health tracking unavailable")
         else:
-            import sqlite3
-            conn = sqlite3.connect(sqlite_path)
-            try:
-                # Check if source_runs table exists
-                cur = conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name='source_runs';"
-                )
-                if not cur.fetchone():
-                    print("  [INFO] source_runs table not found")
-                    print("  [INFO] Recommended: Run 'hardstop fetch' once to initialize source health tracking")
+            with session_context(sqlite_path) as session:
+                # Check if source_runs table exists (on the pooled connection)
+                has_source_runs = session.execute(
+                    text("SELECT name FROM sqlite_master WHERE type='table' AND name='source_runs';")
+                ).first()
+                if not has_source_runs:
+                    emit("  [INFO] source_runs table not found")
+                    emit("  [INFO] Recommended: Run 'hardstop fetch' once to initialize source health tracking")
                 else:
-                    print("  [OK] source_runs table exists")
+                    emit("  [OK] source_runs table exists")
                     
                     try:
                         sources_config = load_sources_config()
@@ -1501,192 +1682,168 @@ def cmd_doctor(args: argparse.Namespace) -> None:
                     
                     # Count stale sources (no successful fetch in last 48h)
                     try:
-                        with session_context(sqlite_path) as session:
-                            from hardstop.database.source_run_repo import get_all_source_health
-                            
-                            health_list = get_all_source_health(
-                                session,
-                                lookback_n=10,
-                                stale_threshold_hours=48,
-                                source_ids=configured_sources,
-                            )
-                            stale_cutoff = datetime.now(timezone.utc) - timedelta(hours=48)
-                            stale_cutoff_iso = stale_cutoff.isoformat()
-                            
-                            stale_count = 0
-                            for health in health_list:
-                                last_success = health.get("last_success_utc")
-                                if not last_success or last_success < stale_cutoff_iso:
-                                    stale_count += 1
-                            
-                            if stale_count > 0:
-                                warnings.append(f"{stale_count} sources have not succeeded in last 48h")
-                                print(f"  [WARN] Stale sources (no success in 48h): {stale_count}")
-                            else:
-                                print(f"  [OK] All sources healthy (last 48h)")
-                            
-                            blocked = [h for h in health_list if h.get("health_budget_state") == "BLOCKED"]
-                            watch = [h for h in health_list if h.get("health_budget_state") == "WATCH"]
-                            if blocked:
-                                blocked_ids = ", ".join(h["source_id"] for h in blocked)
-                                issues.append(f"{len(blocked)} source(s) exhausted failure budget: {blocked_ids}")
-                                print(f"  [X] Failure budget exhausted for: {blocked_ids}")
-                            if watch and not blocked:
-                                watch_ids = ", ".join(h["source_id"] for h in watch)
-                                warnings.append(f"{len(watch)} source(s) near failure budget: {watch_ids}")
-                                print(f"  [WARN] Failure budget warning for: {watch_ids}")
-                            
-                            if health_list:
-                                print(f"  [OK] Tracking health for {len(health_list)} sources")
+                        health_list = get_all_source_health(
+                            session,
+                            lookback_n=10,
+                            stale_threshold_hours=48,
+                            source_ids=configured_sources,
+                        )
+                        stale_cutoff = datetime.now(timezone.utc) - timedelta(hours=48)
+                        stale_cutoff_iso = stale_cutoff.isoformat()
+                        
+                        # One pass: stale count plus failure-budget buckets
+                        stale_count = 0
+                        blocked: List[str] = []
+                        watch: List[str] = []
+                        for health in health_list:
+                            last_success = health.get("last_success_utc")
+                            if not last_success or last_success < stale_cutoff_iso:
+                                stale_count += 1
+                                if first_stale_source_id is None:
+                                    first_stale_source_id = health.get("source_id")
+                            budget_state = health.get("health_budget_state")
+                            if budget_state == "BLOCKED":
+                                blocked.append(health["source_id"])
+                            elif budget_state == "WATCH":
+                                watch.append(health["source_id"])
+                        
+                        if stale_count > 0:
+                            warnings.append(f"{stale_count} sources have not succeeded in last 48h")
+                            emit(f"  [WARN] Stale sources (no success in 48h): {stale_count}")
+                        else:
+                            emit(f"  [OK] All sources healthy (last 48h)")
+                        
+                        if blocked:
+                            blocked_ids = ", ".join(blocked)
+                            issues.append(f"{len(blocked)} source(s) exhausted failure budget: {blocked_ids}")
+                            emit(f"  [X] Failure budget exhausted for: {blocked_ids}")
+                        if watch and not blocked:
+                            watch_ids = ", ".join(watch)
+                            warnings.append(f"{len(watch)} source(s) near failure budget: {watch_ids}")
+                            emit(f"  [WARN] Failure budget warning for: {watch_ids}")
+                        
+                        if health_list:
+                            emit(f"  [OK] Tracking health for {len(health_list)} sources")
                     except Exception as e:
                         warnings.append(f"Error checking source health: {e}")
-                        print(f"  [WARN] Error checking source health: {e}")
-            finally:
-                conn.close()
+                        emit(f"  [WARN] Error checking source health: {e}")
     except Exception as e:
         warnings.append(f"Source health check error: {e}")
-        print(f"  [WARN] Source health check error: {e}")
+        emit(f"  [WARN] Source health check error: {e}")
     
     # C2: Last run group summary (v1.0)
-    print("\n[6] Last Run Group Summary...")
+    flush()
+    emit("\n[6] Last Run Group Summary...")
     try:
-        config = load_config()
-        sqlite_path = config.get("storage", {}).get("sqlite_path", "hardstop.db")
+        if config_error is not None:
+            raise config_error
         db_path = Path(sqlite_path)
         
         if db_path.exists():
             try:
                 with session_context(sqlite_path) as session:
                     # Get most recent run_group_id
-                    most_recent_run = session.query(SourceRun).order_by(SourceRun.run_at_utc.desc()).first()
-                    if most_recent_run:
-                        run_group_id = most_recent_run.run_group_id
-                        print(f"  [INFO] Most recent run_group_id: {run_group_id[:8]}...")
-                        
-                        # Get all runs for this group
-                        group_runs = session.query(SourceRun).filter(
-                            SourceRun.run_group_id == run_group_id
-                        ).all()
+                    run_group_id = (
+                        session.query(SourceRun.run_group_id)
+                        .order_by(SourceRun.run_at_utc.desc())
+                        .limit(1)
+                        .scalar()
+                    )
+                    if run_group_id:
+                        emit(f"  [INFO] Most recent run_group_id: {run_group_id[:8]}...")
                         
-                        fetch_runs = [r for r in group_runs if r.phase == "FETCH"]
-                        ingest_runs = [r for r in group_runs if r.phase == "INGEST"]
+                        # Aggregate the group's runs per (phase, status) in SQL
+                        group_rows = (
+                            session.query(
+                                SourceRun.phase,
+                                SourceRun.status,
+                                func.count(),
+                                func.count().filter(SourceRun.items_fetched == 0),
+                                func.coalesce(func.sum(SourceRun.items_alerts_touched), 0),
+                                func.coalesce(func.sum(SourceRun.items_suppressed), 0),
+                            )
+                            .filter(SourceRun.run_group_id == run_group_id)
+                            .group_by(SourceRun.phase, SourceRun.status)
+                            .all()
+                        )
+                        group_counts = {(phase, status): rest for phase, status, *rest in group_rows}
+                        no_runs = (0, 0, 0, 0)
                         
-                        fetch_success = sum(1 for r in fetch_runs if r.status == "SUCCESS")
-                        fetch_fail = sum(1 for r in fetch_runs if r.status == "FAILURE")
-                        fetch_quiet = sum(1 for r in fetch_runs if r.status == "SUCCESS" and r.items_fetched == 0)
+                        fetch_success, fetch_quiet, _, _ = group_counts.get(("FETCH", "SUCCESS"), no_runs)
+                        fetch_fail = group_counts.get(("FETCH", "FAILURE"), no_runs)[0]
                         
-                        ingest_success = sum(1 for r in ingest_runs if r.status == "SUCCESS")
-                        ingest_fail = sum(1 for r in ingest_runs if r.status == "FAILURE")
+                        ingest_success = group_counts.get(("INGEST", "SUCCESS"), no_runs)[0]
+                        ingest_fail = group_counts.get(("INGEST", "FAILURE"), no_runs)[0]
                         
-                        total_alerts_touched = sum(r.items_alerts_touched for r in ingest_runs)
-                        total_suppressed = sum(r.items_suppressed for r in ingest_runs)
+                        ingest_totals = [counts for (phase, _status), counts in group_counts.items() if phase == "INGEST"]
+                        total_alerts_touched = sum(counts[2] for counts in ingest_totals)
+                        total_suppressed = sum(counts[3] for counts in ingest_totals)
                         
-                        print(f"  [INFO] Fetch: {fetch_success} success / {fetch_fail} fail / {fetch_quiet} quiet success")
-                        print(f"  [INFO] Ingest: {ingest_success} success / {ingest_fail} fail")
+                        emit(f"  [INFO] Fetch: {fetch_success} success / {fetch_fail} fail / {fetch_quiet} quiet success")
+                        emit(f"  [INFO] Ingest: {ingest_success} success / {ingest_fail} fail")
                         if total_alerts_touched > 0:
-                            print(f"  [INFO] Alerts touched: {total_alerts_touched}")
+                            emit(f"  [INFO] Alerts touched: {total_alerts_touched}")
                         if total_suppressed > 0:
-                            print(f"  [INFO] Suppressed: {total_suppressed}")
+                            emit(f"  [INFO] Suppressed: {total_suppressed}")
                     else:
-                        print("  [INFO] No run data available. Run 'hardstop run --since 24h' first.")
+                        emit("  [INFO] No run data available. Run 'hardstop run --since 24h' first.")
             except Exception as e:
-                print(f"  [WARN] Error retrieving last run group: {e}")
+                emit(f"  [WARN] Error retrieving last run group: {e}")
         else:
-            print("  [INFO] Database not found - no run data available")
+            emit("  [INFO] Database not found - no run data available")
     except Exception as e:
-        print(f"  [WARN] Error checking last run group: {e}")
+        emit(f"  [WARN] Error checking last run group: {e}")
     
     # Summary
-    print("\n" + "=" * 50)
+    flush()
+    emit("\n" + "=" * 50)
     if issues:
-        print(f"[X] Issues found: {len(issues)}")
+        emit(f"[X] Issues found: {len(issues)}")
         for issue in issues:
-            print(f"  - {issue}")
+            emit(f"  - {issue}")
     else:
-        print("[OK] No critical issues found")
+        emit("[OK] No critical issues found")
     
     if warnings:
-        print(f"\n[WARN] Warnings: {len(warnings)}")
+        emit(f"\n[WARN] Warnings: {len(warnings)}")
         for warning in warnings:
-            print(f"  - {warning}")
+            emit(f"  - {warning}")
     
     if not issues and not warnings:
-        print("\n[OK] All checks passed!")
+        emit("\n[OK] All checks passed!")
     
     # C1: What would I do next? (v1.0)
-    print("\n" + "=" * 50)
-    print("What would I do next?")
-    print("-" * 50)
-    
-    next_action = None
-    
-    # Priority 1: Schema drift
-    if issues:
-        for issue in issues:
-            if "schema drift" in issue.lower() or "missing" in issue.lower():
-                next_action = "Delete hardstop.db and rerun `hardstop run --since 24h`"
-                break
-    
-    # Priority 2: Stale sources
-    if not next_action:
-        for warning in warnings:
-            if "stale" in warning.lower():
-                # Try to get a stale source ID
-                try:
-                    config = load_config()
-                    sqlite_path = config.get("storage", {}).get("sqlite_path", "hardstop.db")
-                    with session_context(sqlite_path) as session:
-                        from hardstop.database.source_run_repo import get_all_source_health
-                        health_list = get_all_source_health(session, lookback_n=10)
-                        stale_cutoff = datetime.now(timezone.utc) - timedelta(hours=48)
-                        stale_cutoff_iso = stale_cutoff.isoformat()
-                        for health in health_list:
-                            last_success = health.get("last_success_utc")
-                            if not last_success or last_success < stale_cutoff_iso:
-                                source_id = health.get("source_id")
-                                if source_id:
-                                    next_action = f"Run `hardstop sources test {source_id} --since 72h`"
-                                    break
-                except Exception:
-                    pass
-                if not next_action:
-                    next_action = "Run `hardstop sources test <id> --since 72h` for stale sources"
-                break
-    
-    # Priority 3: All fetch failing
-    if not next_action:
-        for issue in issues:
-            if "failed" in issue.lower() and "fetch" in issue.lower():
-                next_action = "Check network / user agent / endpoint URLs in config/sources.yaml"
-                break
-    
-    # Priority 4: Suppression config invalid
-    if not next_action:
-        for warning in warnings:
-            if "suppression" in warning.lower() and ("invalid" in warning.lower() or "regex" in warning.lower()):
-                # Try to extract rule ID
-                import re
-                rule_match = re.search(r'rule[:\s]+([^\s,]+)', warning, re.IGNORECASE)
-                if rule_match:
-                    rule_id = rule_match.group(1)
-                    next_action = f"Fix suppression.yaml regex: {rule_id}"
-                else:
-                    next_action = "Fix suppression.yaml configuration"
-                break
-    
-    # Priority 5: Config error
-    if not next_action:
-        for issue in issues:
-            if "config" in issue.lower() or "sources.yaml" in issue.lower():
-                next_action = "Fix config/sources.yaml or config/suppression.yaml"
-                break
-    
-    # Default: all good
-    if not next_action:
-        next_action = "System is healthy. Run `hardstop run --since 24h` to fetch and process new data."
-    
-    print(f"  → {next_action}")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("What would I do next?")
+    emit("-" * 50)
+    
+    next_action = _doctor_next_action(issues, warnings, first_stale_source_id)
+    
+    emit(f"  → {next_action}")
+    emit("=" * 50)
+    flush()
+
+
+def _init_config_file(
+    example: Path,
+    target: Path,
+    force: bool,
+    created: List[str],
+    skipped: List[str],
+) -> bool:
+    """Copy one example config into place for cmd_init; returns False if the copy failed."""
+    if target.exists() and not force:
+        skipped.append(f"{target.name} (already exists, use --force to overwrite)")
+        return True
+    try:
+        # Contents only; the templates' mode bits don't matter
+        shutil.copyfile(example, target)
+    except Exception as e:
+        logger.error(f"Failed to create {target.name}: {e}")
+        return False
+    created.append(target.name)
+    print(f"Created {target}")
+    return True
 
 
 def cmd_init(args: argparse.Namespace) -> None:
@@ -1713,28 +1870,8 @@ def cmd_init(args: argparse.Namespace) -> None:
         logger.error("Please ensure config/suppression.example.yaml exists")
         return
     
-    # Create sources.yaml
-    if sources_config.exists() and not args.force:
-        skipped.append("sources.yaml (already exists, use --force to overwrite)")
-    else:
-        try:
-            shutil.copy(sources_example, sources_config)
-            created.append("sources.yaml")
-            print(f"Created {sources_config}")
-        except Exception as e:
-            logger.error(f"Failed to create sources.yaml: {e}")
-            return
-    
-    # Create suppression.yaml
-    if suppression_config.exists() and not args.force:
-        skipped.append("suppression.yaml (already exists, use --force to overwrite)")
-    else:
-        try:
-            shutil.copy(suppression_example, suppression_config)
-            created.append("suppression.yaml")
-            print(f"Created {suppression_config}")
-        except Exception as e:
-            logger.error(f"Failed to create suppression.yaml: {e}")
+    for example, target in ((sources_example, sources_config), (suppression_example, suppression_config)):
+        if not _init_config_file(example, target, args.force, created, skipped):
             return
     
     # Summary
@@ -1848,10 +1985,8 @@ def cmd_brief(args: argparse.Namespace, run_group_id: Optional[str] = None) -> N
         else:
             input_refs[1] = ingest_ref
         
-        # Ensure migrations
-        ensure_alert_correlation_columns(sqlite_path)
-        ensure_trust_tier_columns(sqlite_path)  # v0.7: trust tier columns
-        ensure_suppression_columns(sqlite_path)  # v0.8: suppression columns
+        # Ensure tables and migrations
+        _bootstrap_db(sqlite_path)
         
         # Generate brief
         try:
@@ -2153,6 +2288,11 @@ def main() -> None:
         action="store_true",
         help="Allow item-level ingest errors without failing the run (v1.3)",
     )
+    run_parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip SQLite fsyncs (synchronous=OFF); faster, but a crash or power loss can lose recent writes",
+    )
     run_parser.set_defaults(func=cmd_run)
     
     # brief command
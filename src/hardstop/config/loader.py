@@ -1,4 +1,5 @@
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -30,6 +31,24 @@ BASE_TIER_DEFAULTS: Dict[str, Dict[str, Any]] = {
 }
 
 
+@lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; mtime_ns/size are part of the cache key so edits are picked up."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _load_yaml(cfg_path: Path) -> Any:
+    """
+    Load YAML from cfg_path, reusing the previous parse while the file is unchanged.
+
+    Several CLI commands load the same config files in one process; parsing is the
+    expensive part. Callers get a deep copy, so mutating the result is safe.
+    """
+    stat = cfg_path.stat()
+    return deepcopy(_parse_yaml_file(str(cfg_path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
 def _merge_tier_defaults(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """Resolve tier defaults with built-in fallbacks."""
     user_defaults = config.get("tier_defaults") or {}
@@ -78,8 +97,7 @@ def load_config(path: Path | None = None) -> Dict[str, Any]:
     cfg_path = path or DEFAULT_CONFIG_PATH
     if not cfg_path.exists():
         raise FileNotFoundError(f"Config file not found: {cfg_path}")
-    with cfg_path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(cfg_path)
 
 
 def load_sources_config(path: Path | None = None) -> Dict[str, Any]:
@@ -98,8 +116,7 @@ def load_sources_config(path: Path | None = None) -> Dict[str, Any]:
     cfg_path = path or DEFAULT_SOURCES_PATH
     if not cfg_path.exists():
         raise FileNotFoundError(f"Sources config file not found: {cfg_path}")
-    with cfg_path.open("r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = _load_yaml(cfg_path)
     
     # Validate structure
     if not isinstance(config, dict):
@@ -218,8 +235,7 @@ def load_suppression_config(path: Path | None = None) -> Dict[str, Any]:
     if not cfg_path.exists():
         raise FileNotFoundError(f"Suppression config file not found: {cfg_path}")
     
-    with cfg_path.open("r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    config = _load_yaml(cfg_path)
     
     # Validate structure
     if not isinstance(config, dict):
@@ -264,8 +280,7 @@ def load_keywords_config(path: Path | None = None) -> Dict[str, Any]:
     if not cfg_path.exists():
         raise FileNotFoundError(f"Keywords config file not found: {cfg_path}")
     
-    with cfg_path.open("r", encoding="utf-8") as f:
-        config = yaml.safe_load(f) or {}
+    config = _load_yaml(cfg_path) or {}
     
     if not isinstance(config, dict):
         raise ValueError("Keywords config must be a dictionary")
@@ -2,12 +2,13 @@
 
 import json
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from ..database.schema import Alert
+from ..utils import json_codec
 
 
 def find_recent_alert_by_key(
@@ -53,12 +54,47 @@ def find_recent_alert_by_key(
     return None
 
 
+def find_recent_alerts_by_keys(
+    session: Session,
+    correlation_keys: List[str],
+    within_days: int = 7,
+) -> Dict[str, Alert]:
+    """
+    Batch form of find_recent_alert_by_key: one query for many correlation keys.
+
+    Args:
+        session: SQLAlchemy session
+        correlation_keys: Correlation keys to look up (duplicates are ignored)
+        within_days: How many days back to look (default 7)
+
+    Returns:
+        Dict mapping each key with a recent alert to its most recent Alert.
+        Keys without a recent alert are absent.
+    """
+    cutoff_iso = (datetime.now(timezone.utc) - timedelta(days=within_days)).isoformat()
+    unique_keys = list(dict.fromkeys(correlation_keys))
+    found: Dict[str, Alert] = {}
+    # Chunk the IN-list to stay well under SQLite's bound-parameter limit
+    for start in range(0, len(unique_keys), 500):
+        chunk = unique_keys[start:start + 500]
+        rows = (
+            session.query(Alert)
+            .filter(Alert.correlation_key.in_(chunk), Alert.last_seen_utc >= cutoff_iso)
+            .order_by(Alert.last_seen_utc.desc())
+            .all()
+        )
+        for row in rows:
+            # Rows are newest-first, so the first row per key wins
+            found.setdefault(row.correlation_key, row)
+    return found
+
+
 def load_root_event_ids(alert_row: Alert) -> list[str]:
     """Load root_event_ids from JSON string."""
     if not alert_row.root_event_ids_json:
         return []
     try:
-        return json.loads(alert_row.root_event_ids_json)
+        return json_codec.loads(alert_row.root_event_ids_json)
     except (json.JSONDecodeError, TypeError):
         return []
 
@@ -210,6 +246,11 @@ def query_recent_alerts(
     since_hours: int = 24,
     include_class0: bool = False,
     limit: int = 20,
+    *,
+    classification: Optional[int] = None,
+    tier: Optional[str] = None,
+    source_id: Optional[str] = None,
+    offset: int = 0,
 ) -> List[Alert]:
     """
     Query alerts that were created or updated within the specified time window.
@@ -219,6 +260,10 @@ def query_recent_alerts(
         since_hours: How many hours back to look (default 24)
         include_class0: Whether to include classification 0 alerts (default False)
         limit: Maximum number of alerts to return (default 20)
+        classification: Only alerts with this classification (default: any)
+        tier: Only alerts with this tier (default: any)
+        source_id: Only alerts last updated by this source (default: any)
+        offset: Number of sorted alerts to skip (default 0)
         
     Returns:
         List of Alert rows, sorted by classification DESC, impact_score DESC,
@@ -238,6 +283,12 @@ def query_recent_alerts(
     # Filter out class 0 if not included
     if not include_class0:
         q = q.filter(Alert.classification > 0)
+    if classification is not None:
+        q = q.filter(Alert.classification == classification)
+    if tier is not None:
+        q = q.filter(Alert.tier == tier)
+    if source_id is not None:
+        q = q.filter(Alert.source_id == source_id)
     
     # Sort: classification DESC, impact_score DESC (nulls last), update_count DESC, last_seen_utc DESC
     # Note: SQLite TEXT comparison works for ISO 8601 strings
@@ -248,7 +299,7 @@ def query_recent_alerts(
         Alert.last_seen_utc.desc().nullslast(),
     )
     
-    return q.limit(limit).all()
+    return q.offset(offset).limit(limit).all()
 
 
 def find_alert_by_id(session: Session, alert_id: str) -> Optional[Alert]:
@@ -263,3 +314,23 @@ def find_alert_by_id(session: Session, alert_id: str) -> Optional[Alert]:
         Alert row or None if not found
     """
     return session.query(Alert).filter(Alert.alert_id == alert_id).first()
+
+
+def find_alerts_by_ids(session: Session, alert_ids: List[str]) -> List[Alert]:
+    """
+    Find alerts by ID in batched IN queries.
+    
+    Args:
+        session: SQLAlchemy session
+        alert_ids: Alert IDs (duplicates are ignored)
+        
+    Returns:
+        Alert rows that exist, in no particular order
+    """
+    unique_ids = list(dict.fromkeys(alert_ids))
+    rows: List[Alert] = []
+    # Chunk the IN-list to stay well under SQLite's bound-parameter limit
+    for start in range(0, len(unique_ids), 500):
+        chunk = unique_ids[start:start + 500]
+        rows.extend(session.query(Alert).filter(Alert.alert_id.in_(chunk)).all())
+    return rows
@@ -3,10 +3,18 @@
 import sqlite3
 from typing import List, Tuple
 
+from .sqlite_client import apply_sqlite_pragmas
+
+
+def _connect(sqlite_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(sqlite_path)
+    apply_sqlite_pragmas(conn)
+    return conn
+
 
 def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
-    """Check if a column exists in a table."""
-    cur = conn.execute(f"PRAGMA table_info({table});")
+    """Check if a column exists in a table (generated columns included)."""
+    cur = conn.execute(f"PRAGMA table_xinfo({table});")
     cols = [row[1] for row in cur.fetchall()]
     return column in cols
 
@@ -20,6 +28,30 @@ def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
     return cur.fetchone() is not None
 
 
+# Stored in PRAGMA user_version once every ensure_* migration has run.
+# Bump when adding a migration so existing databases pick it up.
+SCHEMA_VERSION = 1
+
+
+def schema_is_current(sqlite_path: str) -> bool:
+    """Return True if the database was stamped with SCHEMA_VERSION (or newer)."""
+    conn = _connect(sqlite_path)
+    try:
+        return conn.execute("PRAGMA user_version;").fetchone()[0] >= SCHEMA_VERSION
+    finally:
+        conn.close()
+
+
+def mark_schema_current(sqlite_path: str) -> None:
+    """Stamp the database with SCHEMA_VERSION after migrations complete."""
+    conn = _connect(sqlite_path)
+    try:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def ensure_alert_correlation_columns(sqlite_path: str) -> None:
     """
     Minimal additive migration: adds new columns if missing.
@@ -37,7 +69,7 @@ def ensure_alert_correlation_columns(sqlite_path: str) -> None:
     Args:
         sqlite_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(sqlite_path)
+    conn = _connect(sqlite_path)
     try:
         additions: List[Tuple[str, str]] = [
             ("classification", "INTEGER"),  # v0.3: Classification field (0=Interesting, 1=Relevant, 2=Impactful)
@@ -65,7 +97,7 @@ def ensure_raw_items_table(sqlite_path: str) -> None:
     Args:
         sqlite_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(sqlite_path)
+    conn = _connect(sqlite_path)
     try:
         if not _table_exists(conn, "raw_items"):
             conn.execute("""
@@ -109,7 +141,7 @@ def ensure_event_external_fields(sqlite_path: str) -> None:
     Args:
         sqlite_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(sqlite_path)
+    conn = _connect(sqlite_path)
     try:
         additions: List[Tuple[str, str]] = [
             ("source_id", "TEXT"),
@@ -147,7 +179,7 @@ def ensure_trust_tier_columns(sqlite_path: str) -> None:
     Args:
         sqlite_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(sqlite_path)
+    conn = _connect(sqlite_path)
     try:
         # Add to raw_items
         if not _column_exists(conn, "raw_items", "trust_tier"):
@@ -169,6 +201,11 @@ def ensure_trust_tier_columns(sqlite_path: str) -> None:
         
         # Create index for alerts.source_id
         conn.execute("CREATE INDEX IF NOT EXISTS idx_alerts_source_id ON alerts(source_id);")
+        # Composite index for list_alerts() filters
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_alerts_tier_source_class_first_seen "
+            "ON alerts(tier, source_id, classification, first_seen_utc);"
+        )
         conn.commit()
     finally:
         conn.close()
@@ -193,7 +230,7 @@ def ensure_suppression_columns(sqlite_path: str) -> None:
     Args:
         sqlite_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(sqlite_path)
+    conn = _connect(sqlite_path)
     try:
         # Add to raw_items
         raw_items_additions: List[Tuple[str, str]] = [
@@ -233,7 +270,7 @@ def ensure_source_runs_table(sqlite_path: str) -> None:
     Args:
         sqlite_path: Path to SQLite database file
     """
-    conn = sqlite3.connect(sqlite_path)
+    conn = _connect(sqlite_path)
     try:
         table_missing = not _table_exists(conn, "source_runs")
         if table_missing:
@@ -244,6 +281,7 @@ def ensure_source_runs_table(sqlite_path: str) -> None:
                     source_id TEXT NOT NULL,
                     phase TEXT NOT NULL,
                     run_at_utc TEXT NOT NULL,
+                    run_at_epoch INTEGER GENERATED ALWAYS AS (CAST(strftime('%s', run_at_utc) AS INTEGER)) VIRTUAL,
                     status TEXT NOT NULL,
                     status_code INTEGER,
                     error TEXT,
@@ -269,6 +307,20 @@ def ensure_source_runs_table(sqlite_path: str) -> None:
             if not _column_exists(conn, "source_runs", "diagnostics_json"):
                 conn.execute("ALTER TABLE source_runs ADD COLUMN diagnostics_json TEXT;")
                 conn.commit()
+            if not _column_exists(conn, "source_runs", "run_at_epoch"):
+                conn.execute(
+                    "ALTER TABLE source_runs ADD COLUMN run_at_epoch INTEGER "
+                    "GENERATED ALWAYS AS (CAST(strftime('%s', run_at_utc) AS INTEGER)) VIRTUAL;"
+                )
+                conn.commit()
+        # Covering index for the last-success-per-source aggregation (stale sources)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_source_runs_phase_status_epoch "
+            "ON source_runs(phase, status, source_id, run_at_epoch);"
+        )
+        # Per-run lookups filter on run_group_id and phase together
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_source_runs_group_phase ON source_runs(run_group_id, phase);")
+        conn.commit()
     finally:
         conn.close()
 
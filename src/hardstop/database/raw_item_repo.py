@@ -62,14 +62,36 @@ def save_raw_item(
         logger.debug(f"Raw item already exists (dedupe): {source_id}/{canonical_id or content_hash[:8]}")
         return existing
     
-    # Create new raw item
-    raw_id = f"RAW-{datetime.now(timezone.utc).strftime('%Y%m%d')}-{new_event_id().split('-')[-1]}"
+    raw_item = _build_raw_item(source_id, tier, candidate, fetched_at_utc, trust_tier, canonical_id, content_hash)
+    session.add(raw_item)
+    logger.debug(f"Created new raw item: {raw_item.raw_id} from {source_id}")
+    return raw_item
+
+
+def _build_raw_item(
+    source_id: str,
+    tier: str,
+    candidate: Dict,
+    fetched_at_utc: str,
+    trust_tier: Optional[int],
+    canonical_id: Optional[str],
+    content_hash: Optional[str],
+    id_date: Optional[str] = None,
+) -> RawItem:
+    """
+    Build a new NEW-status RawItem row for a candidate (not added to the session).
+
+    id_date is the YYYYMMDD raw_id prefix; batch callers compute it once.
+    """
+    if id_date is None:
+        id_date = datetime.now(timezone.utc).strftime('%Y%m%d')
+    raw_id = f"RAW-{id_date}-{new_event_id().split('-')[-1]}"
     
     # Ensure content_hash is computed
     if not content_hash:
         content_hash = compute_content_hash(candidate)
     
-    raw_item = RawItem(
+    return RawItem(
         raw_id=raw_id,
         source_id=source_id,
         tier=tier,
@@ -84,10 +106,96 @@ def save_raw_item(
         error=None,
         trust_tier=trust_tier,
     )
+
+
+def save_raw_items_bulk(
+    session: Session,
+    source_id: str,
+    tier: str,
+    candidates: List[Dict],
+    fetched_at_utc: Optional[str] = None,
+    trust_tier: Optional[int] = None,
+) -> int:
+    """
+    Save a batch of raw item candidates from one source with deduplication.
     
-    session.add(raw_item)
-    logger.debug(f"Created new raw item: {raw_id} from {source_id}")
-    return raw_item
+    Same dedupe rules as save_raw_item (canonical_id first, then content_hash,
+    scoped to source_id), but existing rows are looked up with batched IN queries
+    instead of up to two SELECTs per candidate, new rows are added in one
+    add_all(), and duplicates within the batch itself are also collapsed.
+    Candidates that fail to key are logged and skipped.
+    
+    Args:
+        session: SQLAlchemy session
+        source_id: Source ID
+        tier: Tier (global, regional, local)
+        candidates: RawItemCandidate dicts
+        fetched_at_utc: Optional ISO 8601 timestamp. If None, uses current time.
+        trust_tier: Optional trust tier (1|2|3). Default 2 if None.
+        
+    Returns:
+        Number of new raw items added (duplicates only get fetched_at_utc refreshed)
+    """
+    if not candidates:
+        return 0
+    if fetched_at_utc is None:
+        fetched_at_utc = datetime.now(timezone.utc).isoformat()
+    
+    keyed = []
+    for candidate in candidates:
+        try:
+            canonical_id, content_hash = get_dedupe_key(source_id, candidate)
+        except Exception as e:
+            logger.error(f"Failed to save raw item from {source_id}: {e}")
+            continue
+        keyed.append((candidate, canonical_id, content_hash))
+    
+    by_canonical = _existing_by_column(
+        session, source_id, RawItem.canonical_id, {c for _, c, _ in keyed if c}
+    )
+    by_hash = _existing_by_column(
+        session, source_id, RawItem.content_hash, {h for _, _, h in keyed if h}
+    )
+    
+    new_items: List[RawItem] = []
+    id_date = datetime.now(timezone.utc).strftime('%Y%m%d')
+    for candidate, canonical_id, content_hash in keyed:
+        existing = (canonical_id and by_canonical.get(canonical_id)) or (
+            content_hash and by_hash.get(content_hash)
+        )
+        if existing:
+            # Update fetched_at_utc but keep status
+            existing.fetched_at_utc = fetched_at_utc
+            continue
+        raw_item = _build_raw_item(
+            source_id, tier, candidate, fetched_at_utc, trust_tier, canonical_id, content_hash, id_date=id_date
+        )
+        new_items.append(raw_item)
+        # Later candidates in this batch dedupe against the new row
+        if canonical_id:
+            by_canonical[canonical_id] = raw_item
+        by_hash[raw_item.content_hash] = raw_item
+    
+    session.add_all(new_items)
+    logger.debug(f"Created {len(new_items)} new raw items from {source_id} ({len(candidates)} candidates)")
+    return len(new_items)
+
+
+def _existing_by_column(
+    session: Session,
+    source_id: str,
+    column,
+    values: set,
+) -> Dict[str, RawItem]:
+    """Map each value of column to an existing RawItem for source_id (IN-list chunked at 500)."""
+    found: Dict[str, RawItem] = {}
+    values_list = sorted(values)
+    for start in range(0, len(values_list), 500):
+        chunk = values_list[start:start + 500]
+        rows = session.query(RawItem).filter(RawItem.source_id == source_id, column.in_(chunk)).all()
+        for row in rows:
+            found.setdefault(getattr(row, column.key), row)
+    return found
 
 
 def get_raw_items_for_ingest(
@@ -164,6 +272,7 @@ def mark_raw_item_status(
     raw_id: str,
     status: str,
     error: Optional[str] = None,
+    commit: bool = True,
 ) -> None:
     """
     Update raw item status.
@@ -173,6 +282,8 @@ def mark_raw_item_status(
         raw_id: Raw item ID
         status: New status (NORMALIZED, FAILED)
         error: Optional error message (for FAILED status)
+        commit: Commit immediately; pass False when the caller commits the
+            status together with related writes
     """
     raw_item = session.query(RawItem).filter(RawItem.raw_id == raw_id).first()
     if not raw_item:
@@ -183,7 +294,8 @@ def mark_raw_item_status(
     if error:
         raw_item.error = error
     
-    session.commit()
+    if commit:
+        session.commit()
     logger.debug(f"Updated raw item {raw_id} status to {status}")
 
 
@@ -1,5 +1,6 @@
 from sqlalchemy import (
     Column,
+    Computed,
     DateTime,
     Float,
     Index,
@@ -138,6 +139,11 @@ class Alert(Base):
     source_id = Column(String, nullable=True, index=True)  # Last-updating source ID - for UI efficiency
     trust_tier = Column(Integer, nullable=True)  # 1|2|3 (default 2) - source trust tier
 
+    __table_args__ = (
+        # Serves list_alerts() tier/source_id/classification filters
+        Index('idx_alerts_tier_source_class_first_seen', 'tier', 'source_id', 'classification', 'first_seen_utc'),
+    )
+
 
 class SourceRun(Base):
     """Source health tracking (v0.9)."""
@@ -148,6 +154,8 @@ class SourceRun(Base):
     source_id = Column(String, nullable=False, index=True)
     phase = Column(String, nullable=False, index=True)  # FETCH | INGEST
     run_at_utc = Column(String, nullable=False, index=True)  # ISO 8601
+    # Unix seconds derived from run_at_utc, so time comparisons don't depend on ISO formatting
+    run_at_epoch = Column(Integer, Computed("CAST(strftime('%s', run_at_utc) AS INTEGER)", persisted=False))
     status = Column(String, nullable=False)  # SUCCESS | FAILURE
     status_code = Column(Integer, nullable=True)  # HTTP status code
     error = Column(Text, nullable=True)  # Error message if failed
@@ -166,6 +174,8 @@ class SourceRun(Base):
     
     __table_args__ = (
         Index('idx_source_runs_source_run_at', 'source_id', 'run_at_utc'),
+        Index('idx_source_runs_phase_status_epoch', 'phase', 'status', 'source_id', 'run_at_epoch'),
+        Index('idx_source_runs_group_phase', 'run_group_id', 'phase'),
     )
 
 
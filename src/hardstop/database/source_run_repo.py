@@ -3,12 +3,14 @@
 import json
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from hardstop.database.schema import SourceRun
 from hardstop.ops.source_health import compute_health_score
+from hardstop.utils import json_codec
 from hardstop.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -119,11 +121,68 @@ def list_recent_runs(
     return query.order_by(SourceRun.run_at_utc.desc()).limit(limit).all()
 
 
+def list_runs_by_phase(
+    session: Session,
+    run_group_id: str,
+    phases: Sequence[str] = ("FETCH", "INGEST"),
+    limit: int = 100,
+) -> Dict[str, List[SourceRun]]:
+    """
+    Query one run group's runs for several phases in a single statement.
+    
+    Args:
+        session: SQLAlchemy session
+        run_group_id: Run group to load
+        phases: Phases to include
+        limit: Maximum number of runs kept per phase
+        
+    Returns:
+        Dict of phase -> SourceRun rows (ordered by run_at_utc DESC); every requested phase is present
+    """
+    runs_by_phase: Dict[str, List[SourceRun]] = {phase: [] for phase in phases}
+    rows = (
+        session.query(SourceRun)
+        .filter(SourceRun.run_group_id == run_group_id, SourceRun.phase.in_(list(phases)))
+        .order_by(SourceRun.run_at_utc.desc())
+        .all()
+    )
+    for row in rows:
+        bucket = runs_by_phase[row.phase]
+        if len(bucket) < limit:
+            bucket.append(row)
+    return runs_by_phase
+
+
+def list_stale_source_ids(session: Session, stale_threshold_epoch: int) -> List[str]:
+    """
+    List sources whose latest successful FETCH run is older than a threshold.
+    
+    Sources that have never succeeded are not included.
+    
+    Args:
+        session: SQLAlchemy session
+        stale_threshold_epoch: Unix-seconds cutoff; sources with no success at or after it are stale
+        
+    Returns:
+        Source IDs, ordered by source_id
+    """
+    last_success = func.max(SourceRun.run_at_epoch)
+    rows = (
+        session.query(SourceRun.source_id)
+        .filter(SourceRun.phase == "FETCH", SourceRun.status == "SUCCESS")
+        .group_by(SourceRun.source_id)
+        .having(last_success < stale_threshold_epoch)
+        .order_by(SourceRun.source_id)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
 def _load_diagnostics(row: SourceRun) -> Dict[str, Any]:
     if not row.diagnostics_json:
         return {}
     try:
-        return json.loads(row.diagnostics_json)
+        return json_codec.loads(row.diagnostics_json)
     except (json.JSONDecodeError, TypeError):
         return {}
 
@@ -1,23 +1,96 @@
+import os
 from contextlib import contextmanager
-from typing import Generator
+from typing import Dict, Generator, Optional, Tuple
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from .schema import create_all
+from .schema import Base
 
+# One engine (and connection pool) per database path, tagged with the identity of
+# the file it was created against so a deleted or replaced file gets a fresh engine
+_ENGINES: Dict[str, Tuple[Engine, Optional[Tuple[int, int]]]] = {}
+_SESSION_FACTORIES: Dict[str, sessionmaker] = {}
 
-def get_engine(sqlite_path: str):
-    engine_url = f"sqlite:///{sqlite_path}"
-    engine = create_engine(engine_url, future=True)
-    create_all(engine_url)
+
+# Applied to every new DBAPI connection. With WAL + synchronous=NORMAL a commit
+# appends to the WAL without fsyncing; syncs happen at checkpoints instead of
+# twice (journal + database) per commit.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# NORMAL is crash-safe in WAL mode; OFF (opt-in via set_fast_mode) can lose the
+# last transactions on power loss.
+_synchronous = "NORMAL"
+
+
+def set_fast_mode(enabled: bool) -> None:
+    """Use synchronous=OFF for connections opened from now on (unsafe on power loss)."""
+    global _synchronous
+    _synchronous = "OFF" if enabled else "NORMAL"
+
+
+def apply_sqlite_pragmas(dbapi_connection, _connection_record=None) -> None:
+    """Apply the standard pragmas to a sqlite3 connection (also used as the engine connect hook)."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.execute(f"PRAGMA synchronous={_synchronous}")
+    finally:
+        cursor.close()
+
+
+def _file_identity(sqlite_path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of the database file, or None if it does not exist (e.g. :memory:)."""
+    try:
+        stat = os.stat(sqlite_path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def get_engine(sqlite_path: str) -> Engine:
+    """
+    Return the engine for sqlite_path, creating it (and any missing tables) on first use.
+
+    Engines are cached per path so every session_context() in a process (e.g. the
+    fetch, ingest and brief phases of `hardstop run`) reuses pooled connections
+    instead of reopening the database files and re-running create_all. If the file
+    has been deleted or replaced since (tests, `init`, a long-lived API), the old
+    engine is disposed and a new one recreates the schema.
+    """
+    key = str(sqlite_path)
+    cached = _ENGINES.get(key)
+    if cached is not None:
+        engine, identity = cached
+        if _file_identity(key) == identity:
+            return engine
+        engine.dispose()
+        _SESSION_FACTORIES.pop(key, None)
+    engine = create_engine(f"sqlite:///{sqlite_path}", future=True)
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    Base.metadata.create_all(engine)
+    # Identity taken after create_all, which creates the file on first use
+    _ENGINES[key] = (engine, _file_identity(key))
     return engine
 
 
 def get_session(sqlite_path: str) -> Session:
     """Get a SQLAlchemy session (caller must close it)."""
+    key = str(sqlite_path)
     engine = get_engine(sqlite_path)
-    return sessionmaker(bind=engine, autoflush=False, autocommit=False)()
+    factory = _SESSION_FACTORIES.get(key)
+    if factory is None:
+        factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+        _SESSION_FACTORIES[key] = factory
+    return factory()
 
 
 @contextmanager
@@ -4,6 +4,7 @@ from typing import Dict
 
 from sqlalchemy.orm import Session
 
+from ..alerts.impact_scorer import clear_network_cache
 from ..database.schema import Facility, Lane, Shipment
 from ..utils.logging import get_logger
 
@@ -40,6 +41,7 @@ def load_facilities_from_csv(csv_path: Path, session: Session) -> int:
             count += 1
     
     session.commit()
+    clear_network_cache(session)
     logger.info(f"Loaded {count} facilities from {csv_path}")
     return count
 
@@ -71,6 +73,7 @@ def load_lanes_from_csv(csv_path: Path, session: Session) -> int:
             count += 1
     
     session.commit()
+    clear_network_cache(session)
     logger.info(f"Loaded {count} lanes from {csv_path}")
     return count
 
@@ -105,6 +108,7 @@ def load_shipments_from_csv(csv_path: Path, session: Session) -> int:
             count += 1
     
     session.commit()
+    clear_network_cache(session)
     logger.info(f"Loaded {count} shipments from {csv_path}")
     return count
 
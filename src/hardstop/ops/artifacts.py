@@ -16,37 +16,49 @@ def _canonical_dumps(payload: Any) -> str:
 
 def _load_source_run_snapshots(sqlite_path: str, run_group_id: str, phase: str) -> List[Dict[str, Any]]:
     """Load SourceRun rows for a run_group_id/phase pair, normalized to primitive dicts."""
+    snapshots: List[Dict[str, Any]] = []
     with session_context(sqlite_path) as session:
-        rows: List[SourceRun] = (
-            session.query(SourceRun)
+        # Only the digested columns, streamed in batches rather than hydrated as ORM objects
+        rows = (
+            session.query(
+                SourceRun.source_id,
+                SourceRun.status,
+                SourceRun.status_code,
+                SourceRun.error,
+                SourceRun.items_fetched,
+                SourceRun.items_new,
+                SourceRun.items_processed,
+                SourceRun.items_suppressed,
+                SourceRun.items_events_created,
+                SourceRun.items_alerts_touched,
+                SourceRun.diagnostics_json,
+            )
             .filter(SourceRun.run_group_id == run_group_id, SourceRun.phase == phase)
             .order_by(SourceRun.source_id.asc())
-            .all()
-        )
-
-    snapshots: List[Dict[str, Any]] = []
-    for row in rows:
-        diagnostics: Dict[str, Any] = {}
-        if row.diagnostics_json:
-            try:
-                diagnostics = json.loads(row.diagnostics_json)
-            except (json.JSONDecodeError, TypeError):
-                diagnostics = {}
-        snapshots.append(
-            {
-                "source_id": row.source_id,
-                "status": row.status,
-                "status_code": row.status_code,
-                "error": row.error or "",
-                "items_fetched": row.items_fetched,
-                "items_new": row.items_new,
-                "items_processed": row.items_processed,
-                "items_suppressed": row.items_suppressed,
-                "items_events_created": row.items_events_created,
-                "items_alerts_touched": row.items_alerts_touched,
-                "diagnostics": diagnostics,
-            }
+            .yield_per(500)
         )
+        for row in rows:
+            diagnostics: Dict[str, Any] = {}
+            if row.diagnostics_json:
+                try:
+                    diagnostics = json.loads(row.diagnostics_json)
+                except (json.JSONDecodeError, TypeError):
+                    diagnostics = {}
+            snapshots.append(
+                {
+                    "source_id": row.source_id,
+                    "status": row.status,
+                    "status_code": row.status_code,
+                    "error": row.error or "",
+                    "items_fetched": row.items_fetched,
+                    "items_new": row.items_new,
+                    "items_processed": row.items_processed,
+                    "items_suppressed": row.items_suppressed,
+                    "items_events_created": row.items_events_created,
+                    "items_alerts_touched": row.items_alerts_touched,
+                    "diagnostics": diagnostics,
+                }
+            )
     return snapshots
 
 
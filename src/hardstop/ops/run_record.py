@@ -45,7 +45,12 @@ def fingerprint_config(snapshot: Optional[Dict[str, Any]]) -> str:
 
 
 def resolve_config_snapshot() -> Dict[str, Any]:
-    """Load runtime, sources, and suppression configs (best-effort)."""
+    """
+    Load runtime, sources, and suppression configs (best-effort).
+
+    Not memoized here: the loaders already reuse parsed YAML while each file's
+    mtime and size are unchanged (reset with _parse_yaml_file.cache_clear()).
+    """
     snapshot: Dict[str, Any] = {}
     try:
         snapshot["runtime"] = load_config()
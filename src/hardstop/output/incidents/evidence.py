@@ -9,6 +9,7 @@ can be referenced from RunRecords and replayed later.
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +18,10 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from hardstop.ops.run_record import artifact_hash, canonical_dumps
 
 
+# Sidecar index in the artifacts directory: one JSON line per artifact file
+ARTIFACT_INDEX_FILENAME = "_index.jsonl"
+
+
 def _as_list(value: Iterable[str] | None) -> List[str]:
     if value is None:
         return []
@@ -164,17 +169,20 @@ def build_incident_evidence_artifact(
     filename_basename: Optional[str] = None,
     determinism_mode: str = "live",
     determinism_context: Optional[Dict[str, Any]] = None,
+    write: bool = True,
 ) -> Tuple[IncidentEvidenceArtifact, "ArtifactRef", Path]:
     """
     Build and persist an IncidentEvidence artifact.
 
+    With write=False nothing touches disk; the caller persists the artifact later
+    with write_incident_evidence_artifact() (e.g. once its transaction commits).
+
     Returns:
         (artifact_obj, ArtifactRef, artifact_path)
     """
     from hardstop.ops.run_record import ArtifactRef  # Local import to avoid cycles
 
     dest_dir = Path(dest_dir)
-    dest_dir.mkdir(parents=True, exist_ok=True)
 
     generated_at_utc = (generated_at or event.get("event_time_utc") or event.get("published_at_utc") or _now_utc_iso())
     if "Z" not in generated_at_utc and generated_at_utc.endswith("+00:00"):
@@ -239,7 +247,8 @@ def build_incident_evidence_artifact(
 
     filename = filename_basename or f"{alert_id}__{event.get('event_id', 'event')}__{correlation_key.replace('|', '_')}"
     artifact_path = dest_dir / f"{filename}.json"
-    artifact_path.write_text(canonical_dumps(payload), encoding="utf-8")
+    if write:
+        _write_artifact_payload(artifact_path, payload)
 
     artifact_ref = ArtifactRef(
         id=f"incident-evidence:{alert_id}",
@@ -251,6 +260,17 @@ def build_incident_evidence_artifact(
     return artifact, artifact_ref, artifact_path
 
 
+def _write_artifact_payload(artifact_path: Path, payload: Dict[str, Any]) -> None:
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    artifact_path.write_text(canonical_dumps(payload), encoding="utf-8")
+    _append_artifact_index(artifact_path.parent, artifact_path, payload)
+
+
+def write_incident_evidence_artifact(artifact: IncidentEvidenceArtifact, artifact_path: str | Path) -> None:
+    """Persist an artifact built with write=False (JSON file plus its _index.jsonl entry)."""
+    _write_artifact_payload(Path(artifact_path), artifact.to_dict())
+
+
 def _load_artifact_file(path: Path) -> Optional[Dict[str, Any]]:
     try:
         return json.loads(path.read_text(encoding="utf-8"))
@@ -258,6 +278,100 @@ def _load_artifact_file(path: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _artifact_index_entry(path: Path, payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "path": path.name,
+        "alert_id": (payload.get("inputs") or {}).get("alert_id"),
+        "correlation_key": payload.get("correlation_key"),
+        "generated_at_utc": payload.get("generated_at_utc"),
+    }
+
+
+def _append_artifact_index(dest_dir: Path, path: Path, payload: Dict[str, Any]) -> None:
+    line = json.dumps(_artifact_index_entry(path, payload), sort_keys=True)
+    try:
+        with open(dest_dir / ARTIFACT_INDEX_FILENAME, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass  # The index is an optimization; readers rebuild missing entries
+
+
+def load_artifact_index(dest_dir: str | Path) -> List[Dict[str, Any]]:
+    """
+    Return one index entry (path, alert_id, correlation_key, generated_at_utc) per artifact in dest_dir.
+
+    Entries come from the _index.jsonl sidecar, so finding an incident's
+    artifacts only needs to open the matching files. Artifacts without an entry
+    (written before the index existed, or by other tools) are parsed once and
+    the sidecar is rewritten; entries for deleted files are dropped. Ordered by
+    file name.
+    """
+    dest_dir = Path(dest_dir)
+    if not dest_dir.exists():
+        return []
+    with os.scandir(dest_dir) as it:
+        names = sorted(entry.name for entry in it if entry.name.endswith(".json") and entry.is_file())
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    index_path = dest_dir / ARTIFACT_INDEX_FILENAME
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict) and entry.get("path"):
+                    entries[entry["path"]] = entry  # Later lines win (rewritten artifact)
+    except OSError:
+        pass
+
+    if set(entries) != set(names):
+        for name in names:
+            if name not in entries:
+                payload = _load_artifact_file(dest_dir / name)
+                if isinstance(payload, dict):
+                    entries[name] = _artifact_index_entry(dest_dir / name, payload)
+        entries = {name: entries[name] for name in names if name in entries}
+        try:
+            index_path.write_text(
+                "".join(json.dumps(entries[name], sort_keys=True) + "\n" for name in sorted(entries)),
+                encoding="utf-8",
+            )
+        except OSError:
+            pass
+
+    return [entries[name] for name in names if name in entries]
+
+
+def _latest_artifacts(
+    dest_dir: Path,
+    wanted: set[Tuple[str, str]],
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Keep the newest artifact per wanted (alert_id, correlation_key), opening only indexed matches."""
+    latest: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
+    for entry in load_artifact_index(dest_dir):
+        if (entry.get("alert_id"), entry.get("correlation_key")) not in wanted:
+            continue
+        payload = _load_artifact_file(dest_dir / entry["path"])
+        if not payload:
+            continue
+        pair = (payload.get("inputs", {}).get("alert_id"), payload.get("correlation_key"))
+        if pair not in wanted:
+            continue
+        generated_at = payload.get("generated_at_utc") or ""
+        # Strictly newer wins, so ties keep the first file seen
+        if pair not in latest or generated_at > latest[pair][0]:
+            latest[pair] = (generated_at, payload)
+
+    results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for pair, (_, payload) in latest.items():
+        if not payload.get("artifact_hash"):
+            payload["artifact_hash"] = artifact_hash({k: v for k, v in payload.items() if k != "artifact_hash"})
+        results[pair] = payload
+    return results
+
+
 def load_incident_evidence_summary(
     alert_id: str,
     correlation_key: str,
@@ -270,31 +384,32 @@ def load_incident_evidence_summary(
     dest_dir = Path(dest_dir)
     if not dest_dir.exists():
         return None
+    return _latest_artifacts(dest_dir, {(alert_id, correlation_key)}).get((alert_id, correlation_key))
 
-    candidates = []
-    for path in dest_dir.glob("*.json"):
-        payload = _load_artifact_file(path)
-        if not payload:
-            continue
-        if payload.get("inputs", {}).get("alert_id") != alert_id:
-            continue
-        if payload.get("correlation_key") != correlation_key:
-            continue
-        generated_at = payload.get("generated_at_utc") or ""
-        candidates.append((generated_at, path, payload))
 
-    if not candidates:
-        return None
+def load_incident_evidence_summaries(
+    pairs: Sequence[Tuple[str, str]],
+    *,
+    dest_dir: str | Path = "output/incidents",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Batch form of load_incident_evidence_summary: one directory scan for many alerts.
 
-    candidates.sort(key=lambda item: item[0], reverse=True)
-    latest_payload = candidates[0][2]
-    recomputed_hash = artifact_hash({k: v for k, v in latest_payload.items() if k != "artifact_hash"})
-    latest_payload["artifact_hash"] = latest_payload.get("artifact_hash") or recomputed_hash
-    return latest_payload
+    Returns a dict keyed by alert_id; alerts without an artifact are absent.
+    """
+    dest_dir = Path(dest_dir)
+    if not pairs or not dest_dir.exists():
+        return {}
+    found = _latest_artifacts(dest_dir, set(pairs))
+    return {pair[0]: found[pair] for pair in pairs if pair in found}
 
 
 __all__ = [
+    "ARTIFACT_INDEX_FILENAME",
     "IncidentEvidenceArtifact",
     "build_incident_evidence_artifact",
+    "load_artifact_index",
     "load_incident_evidence_summary",
+    "load_incident_evidence_summaries",
+    "write_incident_evidence_artifact",
 ]
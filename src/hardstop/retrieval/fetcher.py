@@ -1,9 +1,11 @@
 """Source fetcher with rate limiting and error handling."""
 
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -15,6 +17,9 @@ from hardstop.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on hosts fetched concurrently by SourceFetcher.fetch_all()
+MAX_FETCH_WORKERS = 32
+
 
 class FetchResult(BaseModel):
     """Result of fetching from a source (v0.9)."""
@@ -57,33 +62,46 @@ class SourceFetcher:
         self.strict = strict
         self.jitter_seconds = 0 if strict else configured_jitter
         self.random_seed = rng_seed if rng_seed is not None else (0 if strict else random.randint(0, 2**32 - 1))
-        self._rng = random.Random(self.random_seed)
         self._adapter_versions: Set[str] = set()
         
         # Track last fetch time per host
         self._last_fetch_time: Dict[str, float] = {}
+        # One jitter RNG per host, seeded from (random_seed, host): fetch_all runs hosts
+        # in parallel, so a shared RNG would hand out draws in thread-scheduling order
+        self._host_rngs: Dict[str, random.Random] = {}
+        self._state_lock = threading.Lock()  # guards the per-host dicts and _adapter_versions
     
     def _get_host_from_url(self, url: str) -> str:
         """Extract host from URL for rate limiting."""
         parsed = urlparse(url)
         return parsed.netloc or parsed.path.split("/")[0]
     
+    def _host_rng(self, host: str) -> random.Random:
+        """Return the jitter RNG for host (a str seed hashes the same in every process)."""
+        with self._state_lock:
+            rng = self._host_rngs.get(host)
+            if rng is None:
+                rng = self._host_rngs[host] = random.Random(f"{self.random_seed}:{host}")
+            return rng
+    
     def _wait_for_rate_limit(self, url: str) -> None:
         """Wait if necessary to respect rate limit for this host."""
         host = self._get_host_from_url(url)
-        last_time = self._last_fetch_time.get(host, 0)
+        with self._state_lock:
+            last_time = self._last_fetch_time.get(host, 0)
         now = time.time()
         elapsed = now - last_time
         min_interval = self.per_host_min_seconds
         
         if elapsed < min_interval:
             wait_time = min_interval - elapsed
-            jitter = self._rng.uniform(0, self.jitter_seconds) if self.jitter_seconds > 0 else 0
+            jitter = self._host_rng(host).uniform(0, self.jitter_seconds) if self.jitter_seconds > 0 else 0
             total_wait = wait_time + jitter
             logger.debug(f"Rate limiting: waiting {total_wait:.2f}s for host {host}")
             time.sleep(total_wait)
         
-        self._last_fetch_time[host] = time.time()
+        with self._state_lock:
+            self._last_fetch_time[host] = time.time()
 
     def best_effort_metadata(self) -> Dict:
         """Return best-effort metadata for RunRecord compatibility."""
@@ -97,36 +115,12 @@ class SourceFetcher:
             "notes": jitter_note,
         }
     
-    def _parse_since(self, since_str: str) -> Optional[int]:
-        """
-        Parse --since argument (24h, 72h, 7d) to hours.
-        
-        Args:
-            since_str: Time string like "24h", "72h", "7d"
-            
-        Returns:
-            Number of hours, or None if invalid
-        """
-        since_str = since_str.lower().strip()
-        if since_str.endswith("h"):
-            try:
-                return int(since_str[:-1])
-            except ValueError:
-                return None
-        elif since_str.endswith("d"):
-            try:
-                days = int(since_str[:-1])
-                return days * 24
-            except ValueError:
-                return None
-        return None
-    
     def fetch_all(
         self,
         tier: Optional[str] = None,
         enabled_only: bool = True,
         max_items_per_source: Optional[int] = None,
-        since: Optional[str] = None,
+        since_hours: Optional[int] = None,
         fail_fast: bool = False,
     ) -> List[FetchResult]:
         """
@@ -136,7 +130,7 @@ class SourceFetcher:
             tier: Filter by tier (global, regional, local). None = all tiers.
             enabled_only: Only fetch from enabled sources
             max_items_per_source: Override max items per source
-            since: Time window (24h, 72h, 7d). None = no filtering.
+            since_hours: Time window in hours (already parsed from --since). None = no filtering.
             fail_fast: If True, stop on first error. If False, continue on errors.
             
         Returns:
@@ -155,117 +149,165 @@ class SourceFetcher:
         
         logger.info(f"Fetching from {len(filtered_sources)} sources")
         
-        # Parse since argument
-        since_hours = None
-        if since:
-            since_hours = self._parse_since(since)
-            if since_hours is None:
-                logger.warning(f"Invalid --since value: {since}, ignoring")
-            else:
-                logger.info(f"Filtering items from last {since_hours} hours")
+        if since_hours is not None:
+            logger.info(f"Filtering items from last {since_hours} hours")
         
-        results: List[FetchResult] = []
         fetched_at_utc = datetime.now(timezone.utc).isoformat()
         
-        for source in filtered_sources:
-            source_id = source["id"]
-            source_url = source["url"]
+        # Sources sharing a host stay sequential in one worker so the per-host
+        # rate limit still applies; different hosts are fetched concurrently.
+        by_host: Dict[str, List[int]] = {}
+        for position, source in enumerate(filtered_sources):
+            by_host.setdefault(self._get_host_from_url(source["url"]), []).append(position)
+        
+        stop = threading.Event()  # set on a fail_fast error so other hosts stop early
+        
+        def fetch_host(positions: List[int]) -> List[Tuple[int, FetchResult]]:
+            host_results: List[Tuple[int, FetchResult]] = []
+            for position in positions:
+                if stop.is_set():
+                    break
+                try:
+                    result = self._fetch_source(
+                        filtered_sources[position],
+                        since_hours=since_hours,
+                        max_items_per_source=max_items_per_source,
+                        fetched_at_utc=fetched_at_utc,
+                        fail_fast=fail_fast,
+                    )
+                except BaseException:
+                    stop.set()
+                    raise
+                host_results.append((position, result))
+            return host_results
+        
+        fetched: Dict[int, FetchResult] = {}
+        if len(by_host) <= 1:
+            for positions in by_host.values():
+                fetched.update(fetch_host(positions))
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(by_host))) as pool:
+                futures = [pool.submit(fetch_host, positions) for positions in by_host.values()]
+                try:
+                    for future in as_completed(futures):
+                        fetched.update(future.result())
+                except BaseException:
+                    # fail_fast: drop hosts that have not started yet, then re-raise
+                    stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        
+        # Results keep config order regardless of completion order
+        results = [fetched[position] for position in range(len(filtered_sources))]
+        
+        failed_count = sum(1 for r in results if r.status == "FAILURE")
+        if failed_count > 0:
+            logger.warning(f"Failed to fetch from {failed_count} sources")
+        
+        return results
+    
+    def _fetch_source(
+        self,
+        source: Dict,
+        *,
+        since_hours: Optional[int],
+        max_items_per_source: Optional[int],
+        fetched_at_utc: str,
+        fail_fast: bool,
+    ) -> FetchResult:
+        """Fetch one source for fetch_all(); failures become FAILURE results unless fail_fast."""
+        source_id = source["id"]
+        source_url = source["url"]
+        
+        # Measure duration
+        start_time = time.monotonic()
+        status_code = None
+        error = None
+        candidates: List[RawItemCandidate] = []
+        status = "SUCCESS"
+        bytes_downloaded = 0
+        
+        try:
+            # Rate limiting
+            self._wait_for_rate_limit(source_url)
             
-            # Measure duration
-            start_time = time.monotonic()
-            status_code = None
-            error = None
-            candidates: List[RawItemCandidate] = []
-            status = "SUCCESS"
-            bytes_downloaded = 0
+            # Create adapter
+            adapter = create_adapter(source, self.defaults, random_seed=self.random_seed)
+            with self._state_lock:
+                self._adapter_versions.add(f"{source_id}:{getattr(adapter, 'adapter_version', 'unknown')}")
             
+            # Override max_items if specified
+            if max_items_per_source:
+                adapter.max_items = max_items_per_source
+            
+            # Fetch items
+            logger.info(f"Fetching from {source_id} ({source.get('tier', 'unknown')} tier)")
+            
+            # Try to capture status code from adapter's HTTP request
+            # We need to wrap the adapter.fetch() call to catch HTTP errors
             try:
-                # Rate limiting
-                self._wait_for_rate_limit(source_url)
-                
-                # Create adapter
-                adapter = create_adapter(source, self.defaults, random_seed=self.random_seed)
-                self._adapter_versions.add(f"{source_id}:{getattr(adapter, 'adapter_version', 'unknown')}")
-                
-                # Override max_items if specified
-                if max_items_per_source:
-                    adapter.max_items = max_items_per_source
-                
-                # Fetch items
-                logger.info(f"Fetching from {source_id} ({source.get('tier', 'unknown')} tier)")
-                
-                # Try to capture status code from adapter's HTTP request
-                # We need to wrap the adapter.fetch() call to catch HTTP errors
-                try:
-                    adapter_response = adapter.fetch(since_hours=since_hours)
-                    candidates = adapter_response.items
-                    if adapter_response.status_code is not None:
-                        status_code = adapter_response.status_code
-                    bytes_downloaded = adapter_response.bytes_downloaded or 0
-                    # If we get here, fetch succeeded (even if 0 items)
-                    # Zero items = SUCCESS (quiet feeds are normal)
-                    logger.info(f"Fetched {len(candidates)} items from {source_id}")
-                except requests.RequestException as req_e:
-                    # Extract status code if available
-                    if hasattr(req_e, 'response') and req_e.response is not None:
-                        status_code = req_e.response.status_code
-                    error = str(req_e)
-                    status = "FAILURE"
-                    raise
-                
+                adapter_response = adapter.fetch(since_hours=since_hours)
+                candidates = adapter_response.items
+                if adapter_response.status_code is not None:
+                    status_code = adapter_response.status_code
+                bytes_downloaded = adapter_response.bytes_downloaded or 0
+                # If we get here, fetch succeeded (even if 0 items)
+                # Zero items = SUCCESS (quiet feeds are normal)
+                logger.info(f"Fetched {len(candidates)} items from {source_id}")
             except requests.RequestException as req_e:
-                # HTTP error with response
+                # Extract status code if available
                 if hasattr(req_e, 'response') and req_e.response is not None:
                     status_code = req_e.response.status_code
                 error = str(req_e)
                 status = "FAILURE"
-                logger.error(f"Failed to fetch from {source_id}: {error}", exc_info=not fail_fast)
-                
-                if fail_fast:
-                    raise RuntimeError(f"Failed to fetch from {source_id}: {error}") from req_e
-                    
-            except Exception as e:
-                # Other errors (timeout, connection, parsing, etc.)
-                # Check if this is a wrapped requests.RequestException
-                if hasattr(e, '__cause__') and isinstance(e.__cause__, requests.RequestException):
-                    req_e = e.__cause__
-                    if hasattr(req_e, 'response') and req_e.response is not None:
-                        status_code = req_e.response.status_code
-                
-                error = str(e)
-                status = "FAILURE"
-                # status_code may be set from chained exception above
-                logger.error(f"Failed to fetch from {source_id}: {error}", exc_info=not fail_fast)
+                raise
+            
+        except requests.RequestException as req_e:
+            # HTTP error with response
+            if hasattr(req_e, 'response') and req_e.response is not None:
+                status_code = req_e.response.status_code
+            error = str(req_e)
+            status = "FAILURE"
+            logger.error(f"Failed to fetch from {source_id}: {error}", exc_info=not fail_fast)
+            
+            if fail_fast:
+                raise RuntimeError(f"Failed to fetch from {source_id}: {error}") from req_e
                 
-                if fail_fast:
-                    raise RuntimeError(f"Failed to fetch from {source_id}: {error}") from e
+        except Exception as e:
+            # Other errors (timeout, connection, parsing, etc.)
+            # Check if this is a wrapped requests.RequestException
+            if hasattr(e, '__cause__') and isinstance(e.__cause__, requests.RequestException):
+                req_e = e.__cause__
+                if hasattr(req_e, 'response') and req_e.response is not None:
+                    status_code = req_e.response.status_code
             
-            # Calculate duration
-            duration_seconds = time.monotonic() - start_time
+            error = str(e)
+            status = "FAILURE"
+            # status_code may be set from chained exception above
+            logger.error(f"Failed to fetch from {source_id}: {error}", exc_info=not fail_fast)
             
-            # Create FetchResult
-            result = FetchResult(
-                source_id=source_id,
-                fetched_at_utc=fetched_at_utc,
-                status=status,
-                status_code=status_code,
-                error=error,
-                duration_seconds=duration_seconds,
-                items=candidates,
-                bytes_downloaded=bytes_downloaded,
-            )
-            results.append(result)
+            if fail_fast:
+                raise RuntimeError(f"Failed to fetch from {source_id}: {error}") from e
         
-        failed_count = sum(1 for r in results if r.status == "FAILURE")
-        if failed_count > 0:
-            logger.warning(f"Failed to fetch from {failed_count} sources")
+        # Calculate duration
+        duration_seconds = time.monotonic() - start_time
         
-        return results
-    
+        return FetchResult(
+            source_id=source_id,
+            fetched_at_utc=fetched_at_utc,
+            status=status,
+            status_code=status_code,
+            error=error,
+            duration_seconds=duration_seconds,
+            items=candidates,
+            bytes_downloaded=bytes_downloaded,
+        )
+
     def fetch_one(
         self,
         source_id: str,
-        since: Optional[str] = None,
+        since_hours: Optional[int] = None,
         max_items: Optional[int] = None,
     ) -> FetchResult:
         """
@@ -273,7 +315,7 @@ class SourceFetcher:
         
         Args:
             source_id: Source ID to fetch
-            since: Time window (24h, 72h, 7d). None = no filtering.
+            since_hours: Time window in hours (already parsed from --since). None = no filtering.
             max_items: Override max items per source
             
         Returns:
@@ -292,13 +334,6 @@ class SourceFetcher:
         if source is None:
             raise ValueError(f"Source '{source_id}' not found in configuration")
         
-        # Parse since argument
-        since_hours = None
-        if since:
-            since_hours = self._parse_since(since)
-            if since_hours is None:
-                logger.warning(f"Invalid --since value: {since}, ignoring")
-        
         source_url = source["url"]
         fetched_at_utc = datetime.now(timezone.utc).isoformat()
         
@@ -316,7 +351,8 @@ class SourceFetcher:
             
             # Create adapter
             adapter = create_adapter(source, self.defaults, random_seed=self.random_seed)
-            self._adapter_versions.add(f"{source_id}:{getattr(adapter, 'adapter_version', 'unknown')}")
+            with self._state_lock:
+                self._adapter_versions.add(f"{source_id}:{getattr(adapter, 'adapter_version', 'unknown')}")
             
             # Override max_items if specified
             if max_items:
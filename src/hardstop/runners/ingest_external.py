@@ -313,24 +313,24 @@ def main(
                     
                     # Not suppressed - proceed with normal flow
                     # Persist event
+                    # Event, alert, and status are committed together below
                     save_event(session, event)
-                    session.commit()
-                    source_events += 1
-                    stats["events"] += 1
                     logger.debug(f"Created event {event['event_id']} from raw_item {raw_item.raw_id}")
                     
                     # Link to network
                     event = link_event_to_network(event, session=session)
                     
-                    # Build alert (handles correlation internally)
+                    # Build alert (handles correlation internally; committed with the status update below)
                     alert = build_basic_alert(event, session=session)
                     source_alerts += 1
                     stats["alerts"] += 1
                     logger.debug(f"Created/updated alert {alert.alert_id} for event {event['event_id']}")
                     
                     # Mark raw item as normalized
-                    mark_raw_item_status(session, raw_item.raw_id, "NORMALIZED")
+                    mark_raw_item_status(session, raw_item.raw_id, "NORMALIZED", commit=False)
                     session.commit()
+                    source_events += 1
+                    stats["events"] += 1
                     
                     source_processed += 1
                     stats["processed"] += 1
@@ -340,7 +340,7 @@ def main(
                     logger.error(f"Failed to process raw_item {raw_item.raw_id}: {error_msg}", exc_info=True)
                     try:
                         session.rollback()  # Rollback failed transaction
-                        mark_raw_item_status(session, raw_item.raw_id, "FAILED", error=error_msg)
+                        mark_raw_item_status(session, raw_item.raw_id, "FAILED", error=error_msg, commit=False)
                         session.commit()
                     except Exception as rollback_error:
                         logger.error(f"Failed to rollback and mark status: {rollback_error}")
@@ -162,6 +162,7 @@ def _run_demo(determinism: DemoDeterminismConfig):
                 determinism_mode=determinism.mode,
                 determinism_context=determinism.context_payload(),
             )
+        session.commit()
     return event, alert
 
 
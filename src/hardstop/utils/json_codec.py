@@ -0,0 +1,74 @@
+"""JSON encode/decode helpers with an optional orjson fast path."""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (pip install hardstop-agent[speedups])
+    orjson = None
+
+
+def _reject_non_finite(obj: Any) -> None:
+    """Raise ValueError (as json.dumps(allow_nan=False) does) if obj holds a NaN or infinity."""
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _reject_non_finite(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _reject_non_finite(value)
+
+
+def _orjson_dumps(obj: Any, option: int = 0) -> bytes:
+    # Datetimes go to the (absent) default hook, so they raise TypeError like the stdlib
+    encoded = orjson.dumps(obj, option=option | orjson.OPT_PASSTHROUGH_DATETIME)
+    # orjson writes NaN/inf as null; only output containing null needs the check
+    if b"null" in encoded:
+        _reject_non_finite(obj)
+    return encoded
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize obj to a compact JSON string.
+
+    Uses orjson when installed; the stdlib fallback emits the same compact,
+    non-ASCII-escaped layout so stored payloads don't depend on the environment.
+    Both paths raise TypeError for datetimes and ValueError for NaN/infinity.
+    """
+    if orjson is not None:
+        return _orjson_dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """
+    Serialize obj as indented (2 spaces), key-sorted JSON for exports.
+
+    Same layout as json.dumps(obj, indent=2, sort_keys=True), except non-ASCII
+    characters are written as UTF-8 rather than \\u escapes. Datetimes and
+    NaN/infinity are rejected as in dumps().
+    """
+    if orjson is not None:
+        return _orjson_dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False, allow_nan=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises json.JSONDecodeError on malformed input (orjson.JSONDecodeError subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "dumps_pretty", "loads"]
@@ -57,3 +57,38 @@ def test_incident_replay_strict_missing_artifact(monkeypatch, tmp_path: Path):
 
     with pytest.raises(FileNotFoundError):
         cli.cmd_incidents_replay(args)
+
+
+def test_artifact_index_covers_unindexed_and_deleted_files(tmp_path: Path):
+    from hardstop.output.incidents.evidence import ARTIFACT_INDEX_FILENAME, load_artifact_index
+
+    artifacts_dir = tmp_path / "incidents"
+    for alert_id in ("ALERT-1", "ALERT-2"):
+        build_incident_evidence_artifact(
+            alert_id=alert_id,
+            event={"event_id": "EVT-1", "event_type": "SPILL", "title": "spill"},
+            correlation_key="SPILL|X|Y",
+            existing_alert=None,
+            window_hours=12,
+            dest_dir=artifacts_dir,
+            generated_at="2024-06-01T00:00:00Z",
+            filename_basename=f"{alert_id}__EVT-1",
+        )
+    assert len((artifacts_dir / ARTIFACT_INDEX_FILENAME).read_text(encoding="utf-8").splitlines()) == 2
+
+    # An artifact copied in without an index line is picked up; a deleted one drops out
+    (artifacts_dir / "ALERT-3__EVT-1.json").write_text(
+        (artifacts_dir / "ALERT-1__EVT-1.json").read_text(encoding="utf-8").replace("ALERT-1", "ALERT-3"),
+        encoding="utf-8",
+    )
+    (artifacts_dir / "ALERT-2__EVT-1.json").unlink()
+
+    entries = load_artifact_index(artifacts_dir)
+    assert [(e["path"], e["alert_id"]) for e in entries] == [
+        ("ALERT-1__EVT-1.json", "ALERT-1"),
+        ("ALERT-3__EVT-1.json", "ALERT-3"),
+    ]
+    assert len((artifacts_dir / ARTIFACT_INDEX_FILENAME).read_text(encoding="utf-8").splitlines()) == 2
+    assert [m[1].name for m in cli._find_incident_artifacts("ALERT-3", artifacts_dir=artifacts_dir)] == [
+        "ALERT-3__EVT-1.json"
+    ]
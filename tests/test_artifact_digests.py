@@ -1,4 +1,5 @@
 import json
+import sqlite3
 import uuid
 from pathlib import Path
 
@@ -95,3 +96,24 @@ def test_raw_item_batch_digest_tracks_fetch_counts(tmp_path):
     )
     second = compute_raw_item_batch_digest(str(sqlite_path), run_group)
     assert first != second
+
+
+def test_session_context_recreates_schema_after_db_file_is_replaced(tmp_path):
+    db_path = tmp_path / "replaced.db"
+    with session_context(str(db_path)) as session:
+        assert session.query(SourceRun).count() == 0
+
+    db_path.unlink()
+    for suffix in ("-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    # A stale cached engine keeps using the deleted file and never creates the new one's schema
+    with session_context(str(db_path)) as session:
+        assert session.query(SourceRun).count() == 0
+
+    conn = sqlite3.connect(db_path)
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    finally:
+        conn.close()
+    assert "source_runs" in tables
@@ -1,6 +1,7 @@
 import argparse
 import hashlib
 import json
+import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
 from types import SimpleNamespace
@@ -62,12 +63,7 @@ def test_cmd_fetch_emits_run_record_success(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "load_sources_config", lambda: {"sources": []})
     monkeypatch.setattr(cli, "get_source_with_defaults", lambda src, _cfg: src)
 
-    def _save_raw_item(session, **_kwargs):
-        item = SimpleNamespace(status="NEW")
-        session.new.add(item)
-        return item
-
-    monkeypatch.setattr(cli, "save_raw_item", _save_raw_item)
+    monkeypatch.setattr(cli, "save_raw_items_bulk", lambda session, **kwargs: len(kwargs["candidates"]))
     monkeypatch.setattr(cli, "create_source_run", lambda *_, **__: None)
     class _StubFetcher:
         def __init__(self, **_kwargs):
@@ -110,6 +106,44 @@ def test_cmd_fetch_emits_run_record_success(monkeypatch, tmp_path):
     assert data["best_effort"]["seed"] == 7
 
 
+def test_cmd_fetch_ignores_invalid_since_and_still_records(monkeypatch, tmp_path):
+    records_dir = _instrument_run_record(tmp_path, monkeypatch)
+    _stub_config(monkeypatch, tmp_path)
+    _stub_noops(monkeypatch)
+    monkeypatch.setattr(cli, "session_context", _fake_session_context)
+    monkeypatch.setattr(cli, "load_sources_config", lambda: {"sources": []})
+    monkeypatch.setattr(cli, "get_all_sources", lambda _cfg: [])
+    seen = {}
+
+    class _RecordingFetcher:
+        def __init__(self, **_kwargs):
+            pass
+
+        def fetch_all(self, **kwargs):
+            seen.update(kwargs)
+            return []
+
+        def best_effort_metadata(self):
+            return {}
+
+    monkeypatch.setattr(cli, "SourceFetcher", _RecordingFetcher)
+
+    args = argparse.Namespace(
+        tier=None,
+        enabled_only=True,
+        max_items_per_source=5,
+        since="soon",
+        dry_run=False,
+        fail_fast=False,
+        strict=False,
+    )
+    cli.cmd_fetch(args, run_group_id="group-fetch-since")
+
+    assert seen["since_hours"] is None
+    data = _load_validated_record(records_dir)
+    assert data["operator_id"] == "hardstop.fetch@1.0.0"
+
+
 def test_cmd_fetch_emits_run_record_on_failure(monkeypatch, tmp_path):
     records_dir = _instrument_run_record(tmp_path, monkeypatch)
     _stub_config(monkeypatch, tmp_path)
@@ -265,7 +299,8 @@ def test_cmd_run_respects_readme_fetch_defaults(monkeypatch, tmp_path):
     _stub_config(monkeypatch, tmp_path)
     _stub_noops(monkeypatch)
     monkeypatch.setattr(cli, "session_context", _fake_session_context)
-    monkeypatch.setattr(cli, "list_recent_runs", lambda *_, **__: [])
+    monkeypatch.setattr(cli, "list_stale_source_ids", lambda *_, **__: [])
+    monkeypatch.setattr(cli, "list_runs_by_phase", lambda *_, **__: {"FETCH": [], "INGEST": []})
     monkeypatch.setattr(cli, "get_all_source_health", lambda *_, **__: [])
     monkeypatch.setattr(cli, "load_sources_config", lambda: {"version": 1, "tiers": {}, "defaults": {}})
     monkeypatch.setattr(cli, "get_all_sources", lambda _cfg: [{"id": "source-1", "enabled": True}])
@@ -307,3 +342,128 @@ def test_cmd_run_respects_readme_fetch_defaults(monkeypatch, tmp_path):
 
     assert captures["fetch_args"].max_items_per_source == 10
     assert exit_codes == [0]
+
+
+def test_bootstrap_db_migrates_once_per_path(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "get_engine", lambda path: calls.append(path))
+    for name in (
+        "ensure_raw_items_table",
+        "ensure_event_external_fields",
+        "ensure_alert_correlation_columns",
+        "ensure_trust_tier_columns",
+        "ensure_suppression_columns",
+        "ensure_source_runs_table",
+    ):
+        monkeypatch.setattr(cli, name, lambda *_, **__: None)
+    monkeypatch.delenv("HARDSTOP_FORCE_MIGRATE", raising=False)
+    sqlite_path = str(tmp_path / "bootstrap.db")
+
+    cli._bootstrap_db(sqlite_path)
+    cli._bootstrap_db(sqlite_path)
+    assert calls == [sqlite_path]
+
+    monkeypatch.setenv("HARDSTOP_FORCE_MIGRATE", "1")
+    cli._bootstrap_db(sqlite_path)
+    assert calls == [sqlite_path, sqlite_path]
+
+
+def test_bootstrap_db_skips_migrations_for_stamped_schema(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "ensure_raw_items_table", lambda path: calls.append(path))
+    monkeypatch.delenv("HARDSTOP_FORCE_MIGRATE", raising=False)
+    cli._migrate_once.cache_clear()
+    sqlite_path = str(tmp_path / "stamped.db")
+
+    cli._bootstrap_db(sqlite_path)
+    assert calls == [sqlite_path]
+
+    # Simulate a new process: the user_version stamp short-circuits the migrations
+    cli._migrate_once.cache_clear()
+    cli._bootstrap_db(sqlite_path)
+    assert calls == [sqlite_path]
+
+
+def test_candidates_as_dicts_matches_model_dump():
+    from hardstop.retrieval.adapters import RawItemCandidate
+
+    candidates = [
+        RawItemCandidate(canonical_id="a", title="A", payload={"k": 1}),
+        RawItemCandidate(payload={}),
+    ]
+    assert cli._candidates_as_dicts(candidates) == [c.model_dump() for c in candidates]
+
+    mixed = [{"canonical_id": "raw"}, candidates[0]]
+    assert cli._candidates_as_dicts(mixed) == [{"canonical_id": "raw"}, candidates[0].model_dump()]
+
+
+def test_probe_status_falls_back_to_streamed_get(monkeypatch):
+    calls = []
+
+    class _Response:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        def close(self):
+            calls.append("close")
+
+    class _Session:
+        def head(self, url, **kwargs):
+            calls.append("head")
+            return _Response(405)
+
+        def get(self, url, **kwargs):
+            calls.append(("get", kwargs.get("stream")))
+            return _Response(200)
+
+    monkeypatch.setattr(cli, "_HTTP", _Session())
+    assert cli._probe_status("https://example.test", {}) == 200
+    assert calls == ["head", ("get", True), "close"]
+
+
+def test_fetch_result_from_run_prefers_diagnostics_counts():
+    from hardstop.database.schema import SourceRun
+
+    run = SourceRun(
+        source_id="source-1",
+        run_at_utc="2024-01-01T00:00:00+00:00",
+        status="SUCCESS",
+        status_code=200,
+        items_fetched=7,
+        items_new=3,
+        diagnostics_json=json.dumps({"items_seen": "bad", "items_new": 5}),
+    )
+    result = cli._fetch_result_from_run(run)
+    assert result.items_count == 5
+    assert result.items == []
+    assert result.status_code == 200
+
+    run.diagnostics_json = "not json"
+    assert cli._fetch_result_from_run(run).items_count == 7
+
+
+def test_doctor_next_action_follows_priority_order():
+    assert cli._doctor_next_action([], []).startswith("System is healthy")
+    assert cli._doctor_next_action(
+        ["Config parse error"], ["Invalid suppression regex in rule: noisy_rule"]
+    ) == "Fix suppression.yaml regex: noisy_rule"
+    assert cli._doctor_next_action(
+        ["Schema drift detected: 2 missing columns/tables"], ["3 stale sources"], "nws"
+    ) == "Delete hardstop.db and rerun `hardstop run --since 24h`"
+    assert cli._doctor_next_action(["All fetch attempts FAILED"], ["Stale source"], "nws") == (
+        "Run `hardstop sources test nws --since 72h`"
+    )
+
+
+def test_missing_required_tables_reads_schema_without_creating_tables(tmp_path):
+    db_path = tmp_path / "partial.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE raw_items (raw_id TEXT PRIMARY KEY)")
+    conn.close()
+
+    expected = ["table: events", "table: alerts", "table: source_runs"]
+    assert cli._missing_required_tables(str(db_path)) == expected
+    # The probe must not have repaired the schema it was checking
+    assert cli._missing_required_tables(str(db_path)) == expected
+    assert len(cli._missing_required_tables(str(tmp_path / "absent.db"))) == 4
+    assert not (tmp_path / "absent.db").exists()
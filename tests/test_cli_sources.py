@@ -39,15 +39,10 @@ def test_sources_test_skips_ingest_when_flag_false(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cli, "session_context", fake_session_context)
 
-    def fake_save_raw_item(session, **_kwargs):
-        obj = SimpleNamespace(status="NEW")
-        session.new.add(obj)
-        return obj
-
-    monkeypatch.setattr(cli, "save_raw_item", fake_save_raw_item)
+    monkeypatch.setattr(cli, "save_raw_items_bulk", lambda _session, **kwargs: len(kwargs["candidates"]))
 
     class FakeFetcher:
-        def fetch_one(self, source_id, since, max_items):
+        def fetch_one(self, source_id, since_hours, max_items):
             item = SimpleNamespace(title="Example item")
             return SimpleNamespace(
                 status="SUCCESS",
@@ -71,3 +66,26 @@ def test_sources_test_skips_ingest_when_flag_false(monkeypatch, tmp_path):
     cli.cmd_sources_test(args)
 
     assert ingest_called["value"] is False
+
+
+def test_sources_health_falls_back_to_48h_for_invalid_stale(monkeypatch, tmp_path):
+    cli = importlib.import_module("hardstop.cli")
+    captured = {}
+
+    @contextmanager
+    def fake_session_context(_sqlite_path):
+        yield SimpleNamespace()
+
+    def fake_health(_session, **kwargs):
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr(cli, "load_config", lambda: {"storage": {"sqlite_path": str(tmp_path / "db.sqlite")}})
+    monkeypatch.setattr(cli, "load_sources_config", lambda: {})
+    monkeypatch.setattr(cli, "get_all_sources", lambda _cfg: [])
+    monkeypatch.setattr(cli, "session_context", fake_session_context)
+    monkeypatch.setattr(cli, "get_all_source_health", fake_health)
+
+    cli.cmd_sources_health(argparse.Namespace(stale="48", lookback=None))
+
+    assert captured["stale_threshold_hours"] == 48
@@ -0,0 +1,21 @@
+"""Tests for config loading."""
+
+import os
+
+from hardstop.config.loader import load_suppression_config
+
+
+def test_load_yaml_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "suppression.yaml"
+    path.write_text("version: 1\nrules: []\n", encoding="utf-8")
+
+    first = load_suppression_config(path)
+    first["rules"].append({"id": "mutated"})
+    second = load_suppression_config(path)
+    assert second == {"version": 1, "enabled": True, "rules": []}
+    assert second is not first
+
+    path.write_text("version: 1\nenabled: false\nrules: []\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_suppression_config(path)["enabled"] is False
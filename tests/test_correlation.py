@@ -4,9 +4,15 @@ import json
 from pathlib import Path
 from types import SimpleNamespace
 
+from sqlalchemy.event import listen
+
+from hardstop.alerts.alert_builder import build_alerts
 from hardstop.alerts.correlation import build_correlation_key
+from hardstop.database.alert_repo import find_recent_alerts_by_keys
+from hardstop.database.schema import Alert
 from hardstop.output.incidents.evidence import (
     build_incident_evidence_artifact,
+    load_incident_evidence_summaries,
     load_incident_evidence_summary,
 )
 from hardstop.ops.run_record import artifact_hash
@@ -214,3 +220,104 @@ def test_incident_evidence_summary_loads_latest(tmp_path):
     assert "merge_summary" in summary
     assert summary["inputs"]["alert_id"] == "ALERT-XYZ"
     assert summary["artifact_hash"]
+
+
+def test_build_alerts_correlates_within_batch_and_commits(session, tmp_path):
+    events = [
+        {
+            "event_id": f"EVT-BATCH-{i}",
+            "title": "Chemical spill at DC-01",
+            "event_type": "SPILL",
+            "facilities": ["DC-01"],
+            "lanes": ["LANE-1"],
+            "shipments": [],
+        }
+        for i in range(3)
+    ]
+    commits = []
+    listen(session, "after_commit", lambda _session: commits.append(True))
+
+    alerts = build_alerts(events, session, commit_every=2, incident_dest_dir=tmp_path)
+
+    assert [a.evidence.correlation["action"] for a in alerts] == ["CREATED", "UPDATED", "UPDATED"]
+    assert len({a.alert_id for a in alerts}) == 1
+    assert len(commits) == 2
+    row = session.query(Alert).one()
+    assert row.update_count == 2
+    assert json.loads(row.root_event_ids_json) == ["EVT-BATCH-0", "EVT-BATCH-1", "EVT-BATCH-2"]
+
+
+def test_find_recent_alerts_by_keys_returns_latest_recent_per_key(session):
+    def _alert(alert_id, key, last_seen):
+        return Alert(
+            alert_id=alert_id,
+            summary="Spill",
+            risk_type="SPILL",
+            classification=0,
+            status="OPEN",
+            root_event_id=f"EVT-{alert_id}",
+            correlation_key=key,
+            last_seen_utc=last_seen,
+        )
+
+    session.add_all([
+        _alert("A-OLD", "K1", "2000-01-01T00:00:00+00:00"),
+        _alert("A-NEW", "K1", "2999-01-01T00:00:00+00:00"),
+        _alert("A-STALE", "K2", "2000-01-01T00:00:00+00:00"),
+    ])
+    session.flush()
+
+    found = find_recent_alerts_by_keys(session, ["K1", "K2", "K1", "K3"])
+
+    assert {key: row.alert_id for key, row in found.items()} == {"K1": "A-NEW"}
+
+
+def test_build_alerts_prefetches_correlation_keys_once(session, tmp_path):
+    events = [
+        {
+            "event_id": f"EVT-PREFETCH-{i}",
+            "title": "Chemical spill",
+            "event_type": "SPILL",
+            "facilities": [f"DC-0{i % 2}"],
+            "lanes": [],
+            "shipments": [],
+        }
+        for i in range(4)
+    ]
+    statements = []
+    listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    alerts = build_alerts(events, session, incident_dest_dir=tmp_path)
+
+    assert [a.evidence.correlation["action"] for a in alerts] == ["CREATED", "CREATED", "UPDATED", "UPDATED"]
+    assert sum("alerts.correlation_key" in s and s.lstrip().startswith("SELECT") for s in statements) == 1
+
+
+def test_incident_evidence_summaries_batch_matches_single_loads(tmp_path):
+    for alert_id, key, generated_at in [
+        ("ALERT-A", "SPILL|DC-01|LANE-1", "2024-05-02T00:00:00Z"),
+        ("ALERT-A", "SPILL|DC-01|LANE-1", "2024-05-03T00:00:00Z"),
+        ("ALERT-B", "STRIKE|DC-02|NONE", "2024-05-02T00:00:00Z"),
+    ]:
+        build_incident_evidence_artifact(
+            alert_id=alert_id,
+            event={"event_id": f"EVT-{generated_at[:10]}", "facilities": [], "lanes": [], "shipments": []},
+            correlation_key=key,
+            existing_alert=None,
+            window_hours=168,
+            dest_dir=tmp_path,
+            generated_at=generated_at,
+            filename_basename=f"{alert_id}__{generated_at[:10]}",
+        )
+
+    pairs = [("ALERT-A", "SPILL|DC-01|LANE-1"), ("ALERT-B", "STRIKE|DC-02|NONE"), ("ALERT-C", "X|NONE|NONE")]
+    summaries = load_incident_evidence_summaries(pairs, dest_dir=tmp_path)
+
+    assert set(summaries) == {"ALERT-A", "ALERT-B"}
+    for alert_id, key in pairs[:2]:
+        assert summaries[alert_id] == load_incident_evidence_summary(alert_id, key, dest_dir=tmp_path)
+    assert summaries["ALERT-A"]["generated_at_utc"] == "2024-05-03T00:00:00Z"
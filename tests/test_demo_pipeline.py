@@ -64,6 +64,7 @@ def test_pinned_demo_output_is_stable(tmp_path, session):
             determinism_context=determinism_context,
             incident_dest_dir=incidents_dir,
         )
+    session.commit()  # The artifact is written once the alert rows commit
 
     assert alert.alert_id == "ALERT-20251229-d31a370b"
 
@@ -77,3 +78,45 @@ def test_pinned_demo_output_is_stable(tmp_path, session):
     assert incident_summary.artifact_hash == expected_hash
     assert payload["artifact_hash"] == expected_hash
 
+
+
+def test_classification_floor_is_recorded_in_reasoning(tmp_path, session):
+    event = {
+        "event_id": "EVT-FLOOR-0001",
+        "title": "Minor notice",
+        "event_type": "GENERAL",
+        "facilities": [],
+        "lanes": [],
+        "shipments": [],
+        "classification_floor": 2,
+    }
+
+    alert = build_basic_alert(event, session=session, incident_dest_dir=tmp_path)
+
+    assert alert.classification == 2
+    assert alert.reasoning[0] == "Event type: GENERAL"
+    assert alert.reasoning[1].startswith("Classification: 2 ")
+    assert alert.reasoning[2] == "Classification floor: 2 (source policy) - raised from 0"
+
+
+def test_incident_artifact_is_written_only_when_alert_commits(tmp_path, session):
+    event = {
+        "event_id": "EVT-ROLLBACK-0001",
+        "title": "Port closure",
+        "event_type": "CLOSURE",
+        "facilities": [],
+        "lanes": [],
+        "shipments": [],
+    }
+
+    alert = build_basic_alert(event, session=session, incident_dest_dir=tmp_path)
+    artifact_path = Path(alert.evidence.incident_evidence.artifact_path)
+    assert not artifact_path.exists()
+
+    session.rollback()
+    session.commit()
+    assert not artifact_path.exists()
+
+    alert = build_basic_alert(event, session=session, incident_dest_dir=tmp_path)
+    session.commit()
+    assert Path(alert.evidence.incident_evidence.artifact_path).exists()
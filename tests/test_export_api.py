@@ -336,3 +336,188 @@ def test_alert_reconstruction_with_source_metadata(session):
     # This would require querying the Alert row for tier/source_id/trust_tier and adding to evidence.source
     # For now, we verify that the correlation_action and scope_json are preserved
 
+
+
+def test_export_alerts_csv_fills_row_columns_from_batch_lookup(session):
+    """CSV export pulls tier/source_id/update_count for every alert from the DB rows."""
+    import csv
+    from io import StringIO
+
+    from hardstop.database.alert_repo import upsert_new_alert_row
+
+    for i in range(3):
+        upsert_new_alert_row(
+            session,
+            alert_id=f"ALERT-CSV-{i}",
+            summary=f"CSV alert {i}",
+            risk_type="TEST",
+            classification=1,
+            status="OPEN",
+            reasoning=None,
+            recommended_actions=None,
+            root_event_id=f"EVT-CSV-{i}",
+            correlation_key=f"TEST|FAC-{i}|NONE",
+            correlation_action="CREATED",
+            impact_score=3,
+            scope_json=None,
+            tier="regional",
+            source_id=f"source_{i}",
+            trust_tier=2,
+        )
+    session.commit()
+
+    csv_output = export_alerts(session, since=None, limit=50, format="csv")
+    rows = {row["alert_id"]: row for row in csv.DictReader(StringIO(csv_output))}
+
+    assert set(rows) == {"ALERT-CSV-0", "ALERT-CSV-1", "ALERT-CSV-2"}
+    for i in range(3):
+        row = rows[f"ALERT-CSV-{i}"]
+        assert row["tier"] == "regional"
+        assert row["source_id"] == f"source_{i}"
+        assert row["update_count"] == "0"
+
+
+def test_export_alerts_csv_to_file_matches_string_output(session, tmp_path):
+    """Streaming CSV to a file writes the same document as the in-memory path."""
+    from hardstop.database.alert_repo import upsert_new_alert_row
+
+    upsert_new_alert_row(
+        session,
+        alert_id="ALERT-CSV-FILE",
+        summary='Summary with "quotes", commas',
+        risk_type="TEST",
+        classification=2,
+        status="OPEN",
+        reasoning=None,
+        recommended_actions=None,
+        root_event_id="EVT-CSV-FILE",
+        correlation_key="TEST|FAC-1|NONE",
+        correlation_action="CREATED",
+        impact_score=7,
+        scope_json=None,
+    )
+    session.commit()
+
+    expected = export_alerts(session, since=None, format="csv")
+    out = tmp_path / "alerts.csv"
+    assert export_alerts(session, since=None, format="csv", out=out) == f"Exported to {out}"
+    assert out.read_bytes() == expected.encode("utf-8")
+
+
+def test_list_alerts_filters_in_query_before_limit(session):
+    """Selective filters are applied before limit/offset, not to an over-fetched page."""
+    from hardstop.api.alerts_api import list_alerts
+    from hardstop.database.alert_repo import upsert_new_alert_row
+
+    for i in range(6):
+        upsert_new_alert_row(
+            session,
+            alert_id=f"ALERT-FILTER-{i}",
+            summary=f"Filter alert {i}",
+            risk_type="TEST",
+            classification=2 if i < 4 else 1,
+            status="OPEN",
+            reasoning=None,
+            recommended_actions=None,
+            root_event_id=f"EVT-FILTER-{i}",
+            correlation_key=f"TEST|FAC-{i}|NONE",
+            correlation_action="CREATED",
+            impact_score=10 - i,
+            scope_json=None,
+            tier="local" if i >= 4 else "global",
+            source_id="source_local" if i >= 4 else "source_global",
+        )
+    session.commit()
+
+    local = list_alerts(session, since=None, tier="local", limit=1)
+    assert [a.alert_id for a in local] == ["ALERT-FILTER-4"]
+
+    paged = list_alerts(session, since=None, source_id="source_local", limit=1, offset=1)
+    assert [a.alert_id for a in paged] == ["ALERT-FILTER-5"]
+
+    class1 = list_alerts(session, since=None, classification=1)
+    assert {a.alert_id for a in class1} == {"ALERT-FILTER-4", "ALERT-FILTER-5"}
+
+
+def test_iter_alerts_yields_same_alerts_as_list_alerts(session):
+    from types import GeneratorType
+
+    from hardstop.api.alerts_api import iter_alerts, list_alerts
+    from hardstop.database.alert_repo import upsert_new_alert_row
+
+    for i in range(3):
+        upsert_new_alert_row(
+            session,
+            alert_id=f"ALERT-ITER-{i}",
+            summary=f"Iter alert {i}",
+            risk_type="TEST",
+            classification=1,
+            status="OPEN",
+            reasoning="Event type: TEST",
+            recommended_actions=None,
+            root_event_id=f"EVT-ITER-{i}",
+            correlation_key=f"TEST|FAC-{i}|NONE",
+            correlation_action="CREATED",
+            impact_score=i,
+            scope_json=None,
+        )
+    session.commit()
+
+    iterator = iter_alerts(session, since=None, limit=2, offset=1)
+    assert isinstance(iterator, GeneratorType)
+    assert list(iterator) == list_alerts(session, since=None, limit=2, offset=1)
+
+
+def test_alert_row_parsing_is_reused_until_row_changes(session):
+    from hardstop.api.alerts_api import _convert_alert_row, get_alert_detail, list_alerts
+    from hardstop.database.alert_repo import find_alert_by_id, upsert_new_alert_row
+
+    upsert_new_alert_row(
+        session,
+        alert_id="ALERT-CACHE",
+        summary="Cached alert",
+        risk_type="TEST",
+        classification=1,
+        status="OPEN",
+        reasoning="First reason",
+        recommended_actions=None,
+        root_event_id="EVT-CACHE",
+        correlation_key="TEST|FAC-1|NONE",
+        correlation_action="CREATED",
+        impact_score=4,
+        scope_json=None,
+    )
+    session.commit()
+
+    detail = get_alert_detail(session, "ALERT-CACHE")
+    (listed,) = list_alerts(session, since=None)
+    # Each call returns its own models, so callers can't corrupt each other
+    assert listed == detail.alert
+    assert listed is not detail.alert
+    listed.reasoning.append("caller mutation")
+    (relisted,) = list_alerts(session, since=None)
+    assert relisted.reasoning == ["First reason"]
+
+    # Incident evidence is attached per call, even for a cached row
+    row = find_alert_by_id(session, "ALERT-CACHE")
+    assert _convert_alert_row(session, row, incident_summaries={}).evidence.incident_evidence is None
+    summary = {"artifact_hash": "h-1", "artifact_path": "x.json", "merge_reasons": [], "merge_summary": [], "inputs": {}}
+    converted = _convert_alert_row(session, row, incident_summaries={"ALERT-CACHE": summary})
+    assert converted.evidence.incident_evidence.artifact_hash == "h-1"
+
+    row.reasoning = "Second reason"
+    row.last_seen_utc = "2999-01-01T00:00:00+00:00"
+    session.commit()
+
+    (updated,) = list_alerts(session, since=None)
+    assert updated.reasoning == ["Second reason"]
+
+
+def test_parse_since_accepts_hours_and_days_only():
+    from hardstop.api.brief_api import _parse_since
+
+    assert _parse_since("24h") == 24
+    assert _parse_since(" 7D ") == 168
+    for bad in ("48", "-5h", "1.5d", "h"):
+        with pytest.raises(ValueError):
+            _parse_since(bad)
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 import hardstop.retrieval.fetcher as fetcher_mod
@@ -52,3 +54,98 @@ def test_best_effort_metadata_records_seed_and_inputs(monkeypatch):
     assert metadata["seed"] == 99
     assert metadata["inputs_version"] == "source-1:demo@1"
     assert "jitter_seconds" in metadata["notes"]
+
+
+def _stub_fetcher(monkeypatch, sources, fetch):
+    sources_config = {"defaults": {"rate_limit": {"per_host_min_seconds": 0, "jitter_seconds": 0}}, "sources": sources}
+    fetcher = SourceFetcher(sources_config, strict=True, rng_seed=1)
+    monkeypatch.setattr(fetcher_mod, "get_all_sources", lambda _cfg: _cfg.get("sources", []))
+
+    class _Adapter:
+        adapter_version = "stub@1"
+
+        def __init__(self, source):
+            self.source = source
+
+        def fetch(self, since_hours=None):
+            return fetch(self.source)
+
+    monkeypatch.setattr(fetcher_mod, "create_adapter", lambda source, defaults, random_seed=None: _Adapter(source))
+    return fetcher
+
+
+def test_fetch_all_keeps_config_order_across_hosts(monkeypatch):
+    sources = [
+        {"id": "a1", "url": "https://a.example.com/1"},
+        {"id": "b1", "url": "https://b.example.com/1"},
+        {"id": "a2", "url": "https://a.example.com/2"},
+        {"id": "c1", "url": "https://c.example.com/1"},
+    ]
+    fetcher = _stub_fetcher(
+        monkeypatch,
+        sources,
+        lambda source: AdapterFetchResponse(items=[], status_code=200, bytes_downloaded=len(source["id"])),
+    )
+
+    results = fetcher.fetch_all()
+
+    assert [r.source_id for r in results] == ["a1", "b1", "a2", "c1"]
+    assert all(r.status == "SUCCESS" for r in results)
+
+
+def test_fetch_all_fail_fast_raises_from_worker(monkeypatch):
+    sources = [
+        {"id": "ok", "url": "https://a.example.com/1"},
+        {"id": "bad", "url": "https://b.example.com/1"},
+    ]
+
+    def _fetch(source):
+        if source["id"] == "bad":
+            raise ValueError("boom")
+        return AdapterFetchResponse(items=[], status_code=200, bytes_downloaded=0)
+
+    fetcher = _stub_fetcher(monkeypatch, sources, _fetch)
+
+    with pytest.raises(RuntimeError, match="bad"):
+        fetcher.fetch_all(fail_fast=True)
+    assert [r.status for r in fetcher.fetch_all()] == ["SUCCESS", "FAILURE"]
+
+
+def test_fetch_all_jitter_is_reproducible_per_source(monkeypatch):
+    sources = [
+        {"id": f"{host}{n}", "url": f"https://{host}.example.com/{n}"}
+        for n in range(3)
+        for host in ("a", "b", "c")
+    ]
+    sources_config = {"defaults": {"rate_limit": {"per_host_min_seconds": 100, "jitter_seconds": 5}}, "sources": sources}
+    monkeypatch.setattr(fetcher_mod, "get_all_sources", lambda _cfg: _cfg.get("sources", []))
+    monkeypatch.setattr(fetcher_mod.time, "time", lambda: 1000.0)
+
+    # Sources on one host run sequentially in one worker, so the sleep just before
+    # a source's fetch (recorded per thread) is that source's rate-limit wait
+    local = threading.local()
+    monkeypatch.setattr(fetcher_mod.time, "sleep", lambda seconds: setattr(local, "slept", seconds))
+
+    def _run():
+        waits = {}
+
+        class _Adapter:
+            adapter_version = "stub@1"
+
+            def __init__(self, source):
+                self.source = source
+
+            def fetch(self, since_hours=None):
+                waits[self.source["id"]] = getattr(local, "slept", 0.0)
+                local.slept = 0.0
+                return AdapterFetchResponse(items=[], status_code=200, bytes_downloaded=0)
+
+        monkeypatch.setattr(fetcher_mod, "create_adapter", lambda source, defaults, random_seed=None: _Adapter(source))
+        SourceFetcher(sources_config, rng_seed=42).fetch_all()
+        return waits
+
+    first, second = _run(), _run()
+
+    assert first == second
+    assert first["a0"] == 0.0  # first fetch per host does not wait
+    assert all(100 <= first[f"{host}{n}"] <= 105 for host in "abc" for n in (1, 2))
@@ -4,8 +4,13 @@ import pytest
 from datetime import date, datetime, timedelta, timezone
 from unittest.mock import Mock
 
+from sqlalchemy import select
+from sqlalchemy.event import listen
+
 from hardstop.alerts.impact_scorer import (
+    _eta_epoch_expr,
     calculate_network_impact_score,
+    clear_network_cache,
     map_score_to_classification,
     parse_eta_date_safely,
     is_eta_within_48h,
@@ -13,6 +18,23 @@ from hardstop.alerts.impact_scorer import (
 from hardstop.database.schema import Facility, Lane, Shipment
 
 
+def _facility(facility_id, criticality_score):
+    return Facility(facility_id=facility_id, name=facility_id, type="PLANT", criticality_score=criticality_score)
+
+
+def _lane(lane_id, volume_score):
+    return Lane(lane_id=lane_id, origin_facility_id="A", dest_facility_id="B", volume_score=volume_score)
+
+
+def _shipment(shipment_id, eta_date, priority_flag=1):
+    return Shipment(shipment_id=shipment_id, lane_id="LANE-001", eta_date=eta_date, priority_flag=priority_flag)
+
+
+def _seed(session, *rows):
+    session.add_all(rows)
+    session.commit()
+
+
 class TestMapScoreToClassification:
     """Test classification mapping from impact scores."""
     
@@ -33,16 +55,10 @@ class TestMapScoreToClassification:
 class TestCalculateNetworkImpactScore:
     """Test network impact score calculation."""
     
-    def test_uses_db_values_not_input_severity(self):
+    def test_uses_db_values_not_input_severity(self, session):
         """Verify scoring uses DB-driven values, not input severity_guess."""
-        # Create mock session with high-impact facility
-        session = Mock()
-        facility = Mock(spec=Facility)
-        facility.facility_id = "PLANT-01"
-        facility.criticality_score = 8  # High criticality
-        
-        session.query.return_value.filter.return_value.all.return_value = [facility]
-        session.query.return_value.filter.return_value.in_.return_value = None
+        # Seed a high-impact facility
+        _seed(session, _facility("PLANT-01", 8))
         
         event = {
             "facilities": ["PLANT-01"],
@@ -59,28 +75,10 @@ class TestCalculateNetworkImpactScore:
         assert any("criticality_score" in b for b in breakdown)
         assert rationale["network_criticality"]["facilities"][0]["facility_id"] == "PLANT-01"
     
-    def test_facility_criticality_scoring(self):
+    def test_facility_criticality_scoring(self, session):
         """Test facility criticality scoring with 1-10 scale."""
-        session = Mock()
-        
-        # High criticality facility (>=7)
-        high_facility = Mock(spec=Facility)
-        high_facility.facility_id = "PLANT-01"
-        high_facility.criticality_score = 8
-        
-        # Low criticality facility (<7)
-        low_facility = Mock(spec=Facility)
-        low_facility.facility_id = "DC-01"
-        low_facility.criticality_score = 5
-        
-        def query_side_effect(model):
-            if model == Facility:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [high_facility]
-                return mock_query
-            return Mock()
-        
-        session.query.side_effect = query_side_effect
+        # High criticality facility (>=7) and low criticality facility (<7)
+        _seed(session, _facility("PLANT-01", 8), _facility("DC-01", 5))
         
         event = {
             "facilities": ["PLANT-01"],
@@ -96,36 +94,14 @@ class TestCalculateNetworkImpactScore:
         assert any(">= 7" in b and "PLANT-01" in b for b in breakdown)
         
         # Test with low criticality
-        def query_side_effect_low(model):
-            if model == Facility:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [low_facility]
-                return mock_query
-            return Mock(filter=lambda **kw: Mock(all=lambda: []))
-        
-        session.query.side_effect = query_side_effect_low
-        score2, _, rationale2 = calculate_network_impact_score(event, session)
+        low_event = dict(event, facilities=["DC-01"])
+        score2, _, rationale2 = calculate_network_impact_score(low_event, session)
         assert score2 < score  # Lower score for low criticality
         assert rationale2["network_criticality"]["facilities"] == []
     
-    def test_lane_volume_scoring(self):
+    def test_lane_volume_scoring(self, session):
         """Test lane volume scoring with 1-10 scale."""
-        session = Mock()
-        
-        high_lane = Mock(spec=Lane)
-        high_lane.lane_id = "LANE-001"
-        high_lane.volume_score = 8
-        
-        def query_side_effect(model):
-            if model == Lane:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [high_lane]
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
+        _seed(session, _lane("LANE-001", 8))
         
         event = {
             "facilities": [],
@@ -141,31 +117,14 @@ class TestCalculateNetworkImpactScore:
         assert any("volume_score" in b and ">= 7" in b for b in breakdown)
         assert rationale["network_criticality"]["lanes"][0]["lane_id"] == "LANE-001"
     
-    def test_shipment_priority_scoring(self):
+    def test_shipment_priority_scoring(self, session):
         """Test enhanced shipment priority scoring."""
-        session = Mock()
-        
         # Create priority shipments
-        priority_ship1 = Mock(spec=Shipment)
-        priority_ship1.shipment_id = "SHP-001"
-        priority_ship1.priority_flag = 1
-        priority_ship1.eta_date = (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")
-        
-        priority_ship2 = Mock(spec=Shipment)
-        priority_ship2.shipment_id = "SHP-002"
-        priority_ship2.priority_flag = 1
-        priority_ship2.eta_date = (date.today() + timedelta(days=3)).strftime("%Y-%m-%d")
-        
-        def query_side_effect(model):
-            if model == Shipment:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [priority_ship1, priority_ship2]
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
+        _seed(
+            session,
+            _shipment("SHP-001", (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")),
+            _shipment("SHP-002", (date.today() + timedelta(days=3)).strftime("%Y-%m-%d")),
+        )
         
         event = {
             "facilities": [],
@@ -182,6 +141,55 @@ class TestCalculateNetworkImpactScore:
         assert any("Priority shipments" in b for b in breakdown)
         assert rationale["network_criticality"]["priority_shipments"]["count"] == 2
     
+    def test_network_lookup_is_single_round_trip(self, session):
+        """Facility, lane, and shipment lookups share one statement."""
+        _seed(
+            session,
+            _facility("PLANT-01", 8),
+            _facility("PLANT-02", 9),
+            _facility("DC-01", 4),
+            _lane("LANE-001", 9),
+            _shipment("SHP-001", "2024-01-11"),
+            _shipment("SHP-002", "2024-01-11", priority_flag=0),
+        )
+        statements = []
+        listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        
+        event = {
+            "facilities": ["DC-01", "PLANT-02", "PLANT-01"],
+            "lanes": ["LANE-001"],
+            "shipments": ["SHP-001", "SHP-002"],
+            "event_type": "GENERAL",
+        }
+        fixed_now = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+        score, _, rationale = calculate_network_impact_score(event, session, now=fixed_now)
+        
+        assert len(statements) == 1
+        assert score == 5  # +2 facility, +1 lane, +1 priority, +1 ETA within 48h
+        assert rationale["network_criticality"]["facilities"][0]["facility_id"] == "PLANT-01"
+        assert rationale["network_criticality"]["priority_shipments"]["count"] == 1
+        assert rationale["network_criticality"]["priority_shipments"]["ids_within_48h"] == ["SHP-001"]
+    
+    def test_network_lookup_reused_within_session(self, session):
+        """Repeat scoring of the same entities hits the per-session cache until cleared."""
+        _seed(session, _facility("PLANT-01", 8))
+        statements = []
+        listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        event = {"facilities": ["PLANT-01"], "lanes": [], "shipments": [], "event_type": "GENERAL"}
+        
+        first = calculate_network_impact_score(event, session)
+        second = calculate_network_impact_score(dict(event, title="Replayed"), session)
+        assert len(statements) == 1
+        assert first[0] == second[0]
+        
+        session.get(Facility, "PLANT-01").criticality_score = 3
+        session.commit()
+        statements.clear()
+        clear_network_cache(session)
+        score, _, rationale = calculate_network_impact_score(event, session)
+        assert any("facilities" in stmt for stmt in statements)
+        assert rationale["network_criticality"]["facilities"] == []
+    
     def test_event_type_keyword_scoring(self):
         """Test event type and keyword detection."""
         session = Mock()
@@ -203,50 +211,26 @@ class TestCalculateNetworkImpactScore:
         assert score >= 1
         assert any("keyword" in b.lower() or "spill" in b.lower() for b in breakdown)
         assert "SPILL" in rationale["score_trace"]["keyword_terms"]
+        
+        # Text-only events never hit the database
+        session.query.assert_not_called()
+        session.execute.assert_not_called()
     
-    def test_eta_within_48h_scoring(self):
+    def test_eta_within_48h_scoring(self, session):
         """Test ETA within 48h scoring with various date scenarios."""
-        session = Mock()
-        
         # Create priority shipments with different ETA scenarios
         reference_date = date(2024, 1, 10)
-        
-        # Shipment within 48h (tomorrow end-of-day relative to fixed_now)
-        near_ship = Mock(spec=Shipment)
-        near_ship.shipment_id = "SHP-NEAR"
-        near_ship.priority_flag = 1
-        near_ship.eta_date = (reference_date + timedelta(days=1)).strftime("%Y-%m-%d")
-        
-        # Shipment beyond 48h (3 days out)
-        far_ship = Mock(spec=Shipment)
-        far_ship.shipment_id = "SHP-FAR"
-        far_ship.priority_flag = 1
-        far_ship.eta_date = (reference_date + timedelta(days=3)).strftime("%Y-%m-%d")
-        
-        # Shipment with bad date
-        bad_ship = Mock(spec=Shipment)
-        bad_ship.shipment_id = "SHP-BAD"
-        bad_ship.priority_flag = 1
-        bad_ship.eta_date = "invalid-date-format"
-        
-        # Shipment with None ETA
-        no_eta_ship = Mock(spec=Shipment)
-        no_eta_ship.shipment_id = "SHP-NO-ETA"
-        no_eta_ship.priority_flag = 1
-        no_eta_ship.eta_date = None
-        
-        def query_side_effect(model):
-            if model == Shipment:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = [
-                    near_ship, far_ship, bad_ship, no_eta_ship
-                ]
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
+        _seed(
+            session,
+            # Shipment within 48h (tomorrow end-of-day relative to fixed_now)
+            _shipment("SHP-NEAR", (reference_date + timedelta(days=1)).strftime("%Y-%m-%d")),
+            # Shipment beyond 48h (3 days out)
+            _shipment("SHP-FAR", (reference_date + timedelta(days=3)).strftime("%Y-%m-%d")),
+            # Shipment with bad date
+            _shipment("SHP-BAD", "invalid-date-format"),
+            # Shipment with None ETA
+            _shipment("SHP-NO-ETA", None),
+        )
         
         event = {
             "facilities": [],
@@ -268,11 +252,10 @@ class TestCalculateNetworkImpactScore:
         for b in breakdown:
             if "within 48h" in b:
                 assert "1 shipments" in b  # Only near_ship should be within 48h
+        assert rationale["network_criticality"]["priority_shipments"]["ids_within_48h"] == ["SHP-NEAR"]
     
-    def test_bad_date_handling(self):
+    def test_bad_date_handling(self, session):
         """Test that bad dates don't crash the pipeline."""
-        session = Mock()
-        
         # Create shipments with various bad date formats
         bad_dates = [
             "not-a-date",
@@ -284,24 +267,8 @@ class TestCalculateNetworkImpactScore:
             None,  # None value
         ]
         
-        shipments = []
-        for i, bad_date in enumerate(bad_dates):
-            ship = Mock(spec=Shipment)
-            ship.shipment_id = f"SHP-BAD-{i}"
-            ship.priority_flag = 1
-            ship.eta_date = bad_date
-            shipments.append(ship)
-        
-        def query_side_effect(model):
-            if model == Shipment:
-                mock_query = Mock()
-                mock_query.filter.return_value.all.return_value = shipments
-                return mock_query
-            mock_query = Mock()
-            mock_query.filter.return_value.all.return_value = []
-            return mock_query
-        
-        session.query.side_effect = query_side_effect
+        shipments = [_shipment(f"SHP-BAD-{i}", bad_date) for i, bad_date in enumerate(bad_dates)]
+        _seed(session, *shipments)
         
         event = {
             "facilities": [],
@@ -385,6 +352,19 @@ class TestEtaParsing:
         assert result.minute == 30
         assert result.tzinfo == timezone.utc  # Should default to UTC
     
+    def test_parse_datetime_offsets_and_legacy_formats(self):
+        """ISO fast path and strptime fallback agree on offsets and suffixes."""
+        expected = datetime(2024, 1, 15, 14, 30, 0, tzinfo=timezone.utc)
+        assert parse_eta_date_safely("2024-01-15T14:30:00Z") == expected
+        assert parse_eta_date_safely("2024-01-15T14:30:00+00:00") == expected
+        assert parse_eta_date_safely("2024-01-15 14:30:00+0000") == expected
+        assert parse_eta_date_safely(" 2024-01-15T14:30:00 ") == expected
+        assert parse_eta_date_safely("2024-01-15 09:30:00-0500") == expected
+        # Non-padded fields only parse via the legacy formats
+        assert parse_eta_date_safely("2024-1-5 1:2:3") == datetime(2024, 1, 5, 1, 2, 3, tzinfo=timezone.utc)
+        # ISO week dates are not ETA dates
+        assert parse_eta_date_safely("2024-W03-1") is None
+    
     def test_parse_invalid_dates(self):
         """Test that invalid dates return None without crashing."""
         bad_dates = [
@@ -475,3 +455,30 @@ class TestEtaParsing:
         
         # Both should be True (tomorrow is within 48h from today)
         assert result_utc == result_est
+
+
+def test_sql_eta_epoch_matches_python_parser(session):
+    """SQL-side ETA normalization agrees with parse_eta_date_safely or defers to it (NULL)."""
+    etas = [
+        "2024-01-15",
+        "2024-02-29",
+        "2024-02-30",  # Invalid day: SQLite would normalize to 2024-03-01
+        "2024-01-15 14:30:00",
+        "2024-01-15T14:30:00Z",
+        "2024-01-15T24:00:00",  # Invalid hour: SQLite would roll over
+        "2024-01-15 14:30:00+0000",
+        "2024-1-5 1:2:3",
+        "not-a-date",
+        None,
+    ]
+    _seed(session, *[_shipment(f"SHP-{i}", eta) for i, eta in enumerate(etas)])
+    
+    rows = session.execute(select(Shipment.eta_date, _eta_epoch_expr())).all()
+    assert len(rows) == len(etas)
+    sql_handled = 0
+    for eta_date, eta_epoch in rows:
+        parsed = parse_eta_date_safely(eta_date)
+        if eta_epoch is not None:
+            sql_handled += 1
+            assert parsed is not None and eta_epoch == parsed.timestamp(), eta_date
+    assert sql_handled == 4  # date-only (x2), naive datetime, Z-suffixed datetime
@@ -0,0 +1,47 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from hardstop.utils import json_codec
+
+
+def test_dumps_is_compact_and_round_trips():
+    payload = {"facilities": ["DC-01"], "lanes": [], "shipments_truncated": False}
+    encoded = json_codec.dumps(payload)
+    assert encoded == '{"facilities":["DC-01"],"lanes":[],"shipments_truncated":false}'
+    assert json_codec.loads(encoded) == payload
+
+
+def test_stdlib_fallback_matches_fast_path(monkeypatch):
+    payload = {"note": "Zürich", "ids": ["A", "B"], "count": 3}
+    fast = json_codec.dumps(payload)
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.dumps(payload) == fast
+    assert json_codec.loads(fast) == payload
+
+
+def test_loads_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads("{not json")
+
+
+def test_dumps_pretty_matches_indented_sorted_layout(monkeypatch):
+    payload = {"data": {"b": [1, 2], "a": None}, "export_schema_version": "1"}
+    expected = json.dumps(payload, indent=2, sort_keys=True)
+    assert json_codec.dumps_pretty(payload) == expected
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert json_codec.dumps_pretty(payload) == expected
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_rejects_datetimes_and_nan_on_both_paths(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    with pytest.raises(TypeError):
+        json_codec.dumps({"t": datetime(2024, 1, 1)})
+    with pytest.raises(ValueError):
+        json_codec.dumps({"a": [1.0, float("nan")]})
+    with pytest.raises(ValueError):
+        json_codec.dumps_pretty({"a": float("inf")})
+    assert json_codec.dumps({"a": None}) == '{"a":null}'
@@ -263,3 +263,30 @@ def test_cmd_incidents_replay_emits_run_record(monkeypatch, tmp_path: Path):
     jsonschema.validate(instance=replay_record, schema=schema)
     assert replay_record["operator_id"] == "hardstop.incidents.replay@1.0.0"
     assert replay_record["config_hash"] == fingerprint_config(snapshot)
+
+
+def test_find_incident_run_record_prefers_first_matching_record(tmp_path: Path):
+    def _write(name, refs):
+        (tmp_path / name).write_text(json.dumps({"run_id": name, "output_refs": refs}), encoding="utf-8")
+
+    _write("a.json", [{"id": "other", "hash": "h-other"}])
+    _write("c.json", [{"id": "x", "hash": "h-target"}])
+    assert cli._find_incident_run_record(tmp_path, "ALERT-1", "h-target")["run_id"] == "c.json"
+    assert cli._find_incident_run_record(tmp_path, "ALERT-1", "h-missing") is None
+
+    # A record earlier in file order that names the incident wins over a later hash match
+    _write("b.json", [{"id": "incident:ALERT-1", "hash": "h-b"}])
+    assert cli._find_incident_run_record(tmp_path, "ALERT-1", "h-target")["run_id"] == "b.json"
+
+
+def test_find_incident_run_record_stops_reading_at_first_match(tmp_path: Path, monkeypatch):
+    for name in ("a.json", "b.json", "c.json"):
+        refs = [{"id": "incident:ALERT-1", "hash": "h"}] if name == "a.json" else []
+        (tmp_path / name).write_text(json.dumps({"run_id": name, "output_refs": refs}), encoding="utf-8")
+
+    read = []
+    original = cli._read_json_file
+    monkeypatch.setattr(cli, "_read_json_file", lambda path: read.append(Path(path).name) or original(path))
+
+    assert cli._find_incident_run_record(tmp_path, "ALERT-1", None)["run_id"] == "a.json"
+    assert read == ["a.json"]
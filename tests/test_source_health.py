@@ -14,6 +14,8 @@ from hardstop.database.source_run_repo import (
     get_source_health,
     get_all_source_health,
     list_recent_runs,
+    list_runs_by_phase,
+    list_stale_source_ids,
 )
 from hardstop.database.schema import SourceRun
 from hardstop.retrieval.fetcher import FetchResult, SourceFetcher
@@ -282,3 +284,58 @@ def test_list_recent_runs_with_filters(session):
     all_runs = list_recent_runs(session, source_id=source_id)
     assert len(all_runs) == 2
 
+
+def test_list_stale_source_ids_uses_latest_success(session):
+    """Only sources whose newest successful FETCH predates the threshold are stale."""
+    now = datetime.now(timezone.utc)
+    old = (now - timedelta(hours=72)).isoformat()
+    # 47h ago in a -05:00 offset sorts before the threshold as a string but is newer as an instant
+    recent = (now - timedelta(hours=47)).astimezone(timezone(timedelta(hours=-5))).isoformat()
+    runs = [
+        ("fresh", "FETCH", "SUCCESS", old),
+        ("fresh", "FETCH", "SUCCESS", recent),
+        ("stale", "FETCH", "SUCCESS", old),
+        ("stale", "FETCH", "FAILURE", recent),
+        ("stale", "INGEST", "SUCCESS", recent),
+        ("never", "FETCH", "FAILURE", old),
+    ]
+    for source_id, phase, status, run_at in runs:
+        create_source_run(
+            session,
+            run_group_id="group-1",
+            source_id=source_id,
+            phase=phase,
+            run_at_utc=run_at,
+            status=status,
+        )
+    session.commit()
+
+    threshold = int((now - timedelta(hours=48)).timestamp())
+    assert list_stale_source_ids(session, threshold) == ["stale"]
+
+
+def test_list_runs_by_phase_groups_one_run_group(session):
+    """list_runs_by_phase returns each requested phase for the given run group only."""
+    now = datetime.now(timezone.utc).isoformat()
+    for run_group_id, source_id, phase in [
+        ("group-1", "a", "FETCH"),
+        ("group-1", "b", "FETCH"),
+        ("group-1", "a", "INGEST"),
+        ("group-2", "a", "FETCH"),
+    ]:
+        create_source_run(
+            session,
+            run_group_id=run_group_id,
+            source_id=source_id,
+            phase=phase,
+            run_at_utc=now,
+            status="SUCCESS",
+        )
+    session.commit()
+
+    runs = list_runs_by_phase(session, "group-1")
+    assert sorted(r.source_id for r in runs["FETCH"]) == ["a", "b"]
+    assert [r.source_id for r in runs["INGEST"]] == ["a"]
+    assert all(r.run_group_id == "group-1" for r in runs["FETCH"] + runs["INGEST"])
+
+    assert list_runs_by_phase(session, "group-3", phases=("FETCH",)) == {"FETCH": []}
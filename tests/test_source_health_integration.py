@@ -6,7 +6,8 @@ from datetime import datetime, timezone
 
 from hardstop.database.schema import SourceRun
 from hardstop.database.source_run_repo import create_source_run, list_recent_runs
-from hardstop.database.raw_item_repo import save_raw_item
+from hardstop.database.raw_item_repo import save_raw_item, save_raw_items_bulk
+from hardstop.database.schema import RawItem
 from hardstop.runners.ingest_external import main as ingest_external_main
 
 
@@ -1134,3 +1135,73 @@ def test_ingest_source_run_written_flag_resets_per_source(session, mocker):
     assert source2_run.items_processed is not None
     
     # This proves the flag resets: both sources got SourceRuns despite source1's failure
+
+
+def test_save_raw_items_bulk_dedupes_against_db_and_batch(session):
+    """Bulk save counts only genuinely new items and refreshes existing ones."""
+    source_id = "bulk_source"
+    existing = save_raw_item(
+        session,
+        source_id=source_id,
+        tier="global",
+        candidate={"canonical_id": "C-1", "title": "Existing", "payload": {}},
+        fetched_at_utc="2024-01-01T00:00:00+00:00",
+    )
+    session.commit()
+
+    candidates = [
+        {"canonical_id": "C-1", "title": "Existing again", "payload": {}},
+        {"canonical_id": "C-2", "title": "New item", "payload": {}},
+        {"canonical_id": "C-2", "title": "Same item, same batch", "payload": {}},
+        {"title": "No canonical id", "url": "https://example.com/a", "payload": {}},
+    ]
+    items_new = save_raw_items_bulk(
+        session,
+        source_id=source_id,
+        tier="global",
+        candidates=candidates,
+        fetched_at_utc="2024-01-02T00:00:00+00:00",
+        trust_tier=3,
+    )
+    session.commit()
+
+    assert items_new == 2
+    rows = session.query(RawItem).filter(RawItem.source_id == source_id).all()
+    assert len(rows) == 3
+    assert existing.fetched_at_utc == "2024-01-02T00:00:00+00:00"
+    assert {row.trust_tier for row in rows if row.raw_id != existing.raw_id} == {3}
+
+
+def test_ingest_artifact_write_failure_keeps_committed_item(session, mocker):
+    """A failing post-commit artifact write must not mark a committed item FAILED."""
+    from hardstop.database.schema import Alert
+
+    source_id = "artifact_write_source"
+    now = datetime.now(timezone.utc).isoformat()
+    save_raw_item(
+        session,
+        source_id=source_id,
+        tier="global",
+        candidate={
+            "canonical_id": "artifact-write-1",
+            "title": "Port closure",
+            "url": "https://example.com/closure",
+            "published_at_utc": now,
+            "payload": {"title": "Port closure"},
+        },
+    )
+    session.commit()
+
+    mocker.patch(
+        "hardstop.alerts.alert_builder.write_incident_evidence_artifact",
+        side_effect=OSError("disk full"),
+    )
+
+    stats = ingest_external_main(session=session, source_id=source_id, run_group_id="artifact-write")
+    session.commit()
+
+    assert stats["errors"] == 0
+    assert stats["alerts"] == 1
+    raw_item = session.query(RawItem).filter(RawItem.source_id == source_id).one()
+    assert raw_item.status == "NORMALIZED"
+    assert session.query(Alert).count() >= 1